@@ -0,0 +1,115 @@
+import click
+import random
+from pathlib import Path
+
+from src.models.board import Board
+from src.storage.markdown_storage import MarkdownStorage
+
+WORDS = [
+    "refactor",
+    "storage",
+    "column",
+    "review",
+    "deploy",
+    "parser",
+    "widget",
+    "layout",
+    "cache",
+    "index",
+    "migrate",
+    "release",
+    "cleanup",
+    "docs",
+    "metrics",
+    "focus",
+]
+
+COLUMN_NAMES = ["To Do", "In Progress", "Review", "Done", "Blocked", "Backlog"]
+
+
+def _random_text(rng: random.Random, size: int) -> str:
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def build_board(
+    name: str,
+    columns: int,
+    items: int,
+    description_size: int,
+    parents: int = 3,
+    seed: int = 0,
+) -> Board:
+    rng = random.Random(f"{seed}:{name}")
+    board = Board(name=name, description=f"Synthetic board {name}")
+
+    board_parents = [board.add_parent(f"Parent {index}") for index in range(parents)]
+
+    for column_index in range(columns):
+        if column_index < len(COLUMN_NAMES):
+            column_name = COLUMN_NAMES[column_index]
+        else:
+            column_name = f"Column {column_index}"
+        column = board.add_column(column_name, column_index)
+
+        for item_index in range(items):
+            parent_id = None
+            if board_parents and rng.random() < 0.3:
+                parent_id = rng.choice(board_parents).id
+
+            item = board.add_item(
+                column.id,
+                f"Task {column_index}-{item_index} {rng.choice(WORDS)}",
+                parent_id,
+            )
+            item.description = _random_text(rng, description_size)
+
+    return board
+
+
+def generate_data_dir(
+    data_dir: Path,
+    boards: int,
+    columns: int,
+    items: int,
+    description_size: int = 200,
+    seed: int = 0,
+) -> list[str]:
+    """Write ``boards`` x ``columns`` x ``items`` synthetic boards into a data dir."""
+    storage = MarkdownStorage(data_dir)
+    names = []
+    for board_index in range(boards):
+        board = build_board(
+            f"bench-{board_index}", columns, items, description_size, seed=seed
+        )
+        storage.save_board(board)
+        names.append(board.name)
+    return names
+
+
+@click.command()
+@click.argument("data_dir", type=click.Path(path_type=Path))
+@click.option("--boards", default=3, help="Number of boards")
+@click.option("--columns", default=4, help="Columns per board")
+@click.option("--items", default=50, help="Items per column")
+@click.option("--description-size", default=200, help="Characters per description")
+@click.option("--seed", default=0, help="Random seed")
+def main(
+    data_dir: Path,
+    boards: int,
+    columns: int,
+    items: int,
+    description_size: int,
+    seed: int,
+) -> None:
+    names = generate_data_dir(data_dir, boards, columns, items, description_size, seed)
+    click.echo(f"Generated {len(names)} boards in {data_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import json
+import platform
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "max": max(samples),
+    }
+
+
+def write_results(path: Path, config: dict, results: dict) -> dict:
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def load_results(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_to_baseline(
+    report: dict, baseline: dict, threshold: float
+) -> list[tuple[str, float, float, float, bool]]:
+    """Compare best-of-N timings and flag those slower than ``1 + threshold``."""
+    rows = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("min"):
+            continue
+        ratio = result["min"] / base["min"]
+        rows.append(
+            (name, base["min"], result["min"], ratio, ratio > 1 + threshold)
+        )
+    return rows
+
+
+def format_comparison(rows: list[tuple[str, float, float, float, bool]]) -> str:
+    lines = [f"{'operation':<32} {'baseline':>12} {'current':>12} {'ratio':>8}"]
+    for name, base, current, ratio, regressed in rows:
+        marker = "  REGRESSION" if regressed else ""
+        lines.append(
+            f"{name:<32} {base * 1000:>10.2f}ms {current * 1000:>10.2f}ms "
+            f"{ratio:>7.2f}x{marker}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,186 @@
+import click
+import tempfile
+import time
+from pathlib import Path
+
+from src.models.board import Board
+from src.storage.markdown_storage import MarkdownStorage
+from .generator import generate_data_dir
+from .results import (
+    compare_to_baseline,
+    format_comparison,
+    load_results,
+    summarize,
+    write_results,
+)
+
+BENCHMARK_DIR = Path(__file__).parent
+
+
+def _time(func, repeat: int, setup=None) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_storage_benchmarks(data_dir: Path, board_names: list[str], repeat: int) -> dict:
+    storage = MarkdownStorage(data_dir)
+    target_name = board_names[len(board_names) // 2]
+    results = {}
+
+    results["load_boards"] = summarize(_time(storage.load_boards, repeat))
+    results["load_board_by_name"] = summarize(
+        _time(lambda: storage.load_board_by_name(target_name), repeat)
+    )
+
+    board = storage.load_board_by_name(target_name)
+    results["save_board"] = summarize(_time(lambda: storage.save_board(board), repeat))
+
+    first_column, second_column = board.columns[0], board.columns[1]
+    results.update(run_internal_benchmarks(storage, board, repeat))
+
+    # Alternate direction so every run moves a file that exists on disk
+    moving_item = first_column.items[0]
+    directions = [(first_column.id, second_column.id)]
+
+    def move_setup():
+        old_column_id, new_column_id = directions[-1]
+        directions.append((new_column_id, old_column_id))
+        return (old_column_id, new_column_id)
+
+    results["move_item_between_columns"] = summarize(
+        _time(
+            lambda old, new: storage.move_item_between_columns(
+                board, moving_item, old, new
+            ),
+            repeat,
+            move_setup,
+        )
+    )
+    storage.save_board(storage.load_board_by_name(target_name))
+
+    board = storage.load_board_by_name(target_name)
+    column = board.columns[-1]
+    deleted = list(column.items[-repeat:])
+
+    def delete_setup():
+        return (deleted.pop(),)
+
+    results["delete_item_from_column"] = summarize(
+        _time(
+            lambda item: storage.delete_item_from_column(board, item),
+            min(repeat, len(column.items)),
+            delete_setup,
+        )
+    )
+    for item in column.items[-repeat:]:
+        storage.add_item_to_column(board, item)
+
+    return results
+
+
+def run_internal_benchmarks(
+    storage: MarkdownStorage, board: Board, repeat: int
+) -> dict:
+    """Private storage helpers that the operations above are built on.
+
+    These reach past the public API, so they change with the storage
+    internals; a renamed helper means updating this and the baseline.
+    """
+    column = board.columns[0]
+    _, column_dirs = storage.load_board_outline(storage.get_kanban_file(board))
+    items_dir = column_dirs[column.id] / "items"
+    last_item = column.items[-1]
+    return {
+        "_find_item_file_by_id": summarize(
+            _time(
+                lambda: storage._find_item_file_by_id(items_dir, last_item.id), repeat
+            )
+        )
+    }
+
+
+@click.command()
+@click.option("--boards", default=3, help="Number of synthetic boards")
+@click.option("--columns", default=4, help="Columns per board")
+@click.option("--items", default=50, help="Items per column")
+@click.option("--description-size", default=200, help="Characters per description")
+@click.option("--repeat", default=5, help="Timed runs per operation")
+@click.option(
+    "--output",
+    default="bench_output.json",
+    type=click.Path(path_type=Path),
+    help="Where to write the JSON results",
+)
+@click.option(
+    "--baseline",
+    default=str(BENCHMARK_DIR / "baseline.json"),
+    type=click.Path(path_type=Path),
+    help="Baseline results to compare against",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    help="Allowed slowdown over the baseline best run (0.25 = 25%)",
+)
+@click.option(
+    "--update-baseline", is_flag=True, help="Store these results as the new baseline"
+)
+def main(
+    boards: int,
+    columns: int,
+    items: int,
+    description_size: int,
+    repeat: int,
+    output: Path,
+    baseline: Path,
+    threshold: float,
+    update_baseline: bool,
+) -> None:
+    if columns < 2 or items < 1:
+        raise click.BadParameter("need at least 2 columns and 1 item per column")
+
+    config = {
+        "boards": boards,
+        "columns": columns,
+        "items": items,
+        "description_size": description_size,
+        "repeat": repeat,
+    }
+
+    with tempfile.TemporaryDirectory(prefix="mkanban-bench-") as tmp:
+        data_dir = Path(tmp)
+        board_names = generate_data_dir(
+            data_dir, boards, columns, items, description_size
+        )
+        results = run_storage_benchmarks(data_dir, board_names, repeat)
+
+    report = write_results(output, config, results)
+    click.echo(f"Results written to {output}")
+
+    if update_baseline:
+        write_results(baseline, config, results)
+        click.echo(f"Baseline updated at {baseline}")
+        return
+
+    stored = load_results(baseline)
+    if not stored:
+        click.echo(f"No baseline at {baseline}, skipping comparison")
+        return
+
+    if stored.get("config") != config:
+        click.echo("Warning: baseline was recorded with a different configuration")
+
+    rows = compare_to_baseline(report, stored, threshold)
+    click.echo(format_comparison(rows))
+
+    if any(regressed for *_, regressed in rows):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Keypress-to-frame latency of the TUI, measured with Textual's headless pilot.
+
+Each board size gets a generated data dir with one board. Mount time is
+from starting the app until every item file is loaded and the screen is
+idle. Key latency is from pressing a key until the app has handled it and
+is idle again, which is when Textual paints the frame. The pilot's own
+cost is in every sample; "noop", an unbound key, measures it. Resize latency
+includes the layout debounce of ``BoardWidget``, since that is what a user
+waits for too.
+
+    python -m benchmarks.tui_benchmark --sizes 20,100,400
+"""
+
+import asyncio
+import click
+import tempfile
+import time
+from pathlib import Path
+
+from src.app import MKanbanApp
+from .generator import generate_data_dir
+from .results import (
+    compare_to_baseline,
+    format_comparison,
+    load_results,
+    summarize,
+    write_results,
+)
+
+BENCHMARK_DIR = Path(__file__).parent
+BOARD_NAME = "bench-0"
+
+
+async def _settle(app: MKanbanApp, pilot) -> None:
+    await pilot.pause()
+    while app.hydrator is not None:
+        await pilot.pause(0.005)
+
+
+async def _timed_keys(app: MKanbanApp, pilot, keys: tuple[str, ...]) -> float:
+    start = time.perf_counter()
+    await pilot.press(*keys)
+    await _settle(app, pilot)
+    return time.perf_counter() - start
+
+
+async def measure_mount(data_dir: Path, size: tuple[int, int], repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        app = MKanbanApp(data_dir=data_dir, initial_board=BOARD_NAME)
+        start = time.perf_counter()
+        async with app.run_test(size=size) as pilot:
+            await _settle(app, pilot)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def measure_keys(data_dir: Path, size: tuple[int, int], repeat: int) -> dict:
+    """Latency samples per key, from one app session."""
+    samples: dict[str, list[float]] = {}
+
+    def record(name: str, elapsed: float) -> None:
+        samples.setdefault(name, []).append(elapsed)
+
+    app = MKanbanApp(data_dir=data_dir, initial_board=BOARD_NAME)
+    async with app.run_test(size=size) as pilot:
+        await _settle(app, pilot)
+
+        for _ in range(repeat):
+            record("noop", await _timed_keys(app, pilot, ("f12",)))
+
+        # Pairs of opposite keys, so the focus stays in the same area
+        for first, second in (("j", "k"), ("l", "h"), ("G", "g,g"), ("L", "H")):
+            for _ in range(repeat):
+                for keys in (first, second):
+                    name = keys.replace(",", "")
+                    record(name, await _timed_keys(app, pilot, tuple(keys.split(","))))
+
+        # Inline add opens an editor; escape saves it as "New Item", which
+        # 'd' then deletes again
+        for _ in range(repeat):
+            await pilot.press("g", "g")
+            await _settle(app, pilot)
+            record("o", await _timed_keys(app, pilot, ("o",)))
+            record("o_save", await _timed_keys(app, pilot, ("escape",)))
+            await pilot.press("G")
+            await _settle(app, pilot)
+            record("d", await _timed_keys(app, pilot, ("d",)))
+
+        for _ in range(repeat):
+            record("p", await _timed_keys(app, pilot, ("p",)))
+            record("p", await _timed_keys(app, pilot, ("p",)))
+
+        width, height = size
+        for _ in range(repeat):
+            for new_size in ((width // 2, height), size):
+                start = time.perf_counter()
+                await pilot.resize_terminal(*new_size)
+                while app.board_view and app.board_view._layout_timer is not None:
+                    await pilot.pause(0.005)
+                await _settle(app, pilot)
+                record("resize", time.perf_counter() - start)
+
+    return samples
+
+
+def run_tui_benchmarks(
+    sizes: list[int],
+    columns: int,
+    description_size: int,
+    repeat: int,
+    size: tuple[int, int],
+) -> dict:
+    results = {}
+    for items in sizes:
+        with tempfile.TemporaryDirectory(prefix="mkanban-tui-bench-") as tmp:
+            data_dir = Path(tmp)
+            generate_data_dir(data_dir, 1, columns, items, description_size)
+
+            mount = asyncio.run(measure_mount(data_dir, size, repeat))
+            results[f"mount@{items}"] = summarize(mount)
+
+            keys = asyncio.run(measure_keys(data_dir, size, repeat))
+            for name, samples in keys.items():
+                results[f"{name}@{items}"] = summarize(samples)
+
+        click.echo(f"Measured {columns} columns of {items} items")
+    return results
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="20,100,400",
+    help="Comma-separated items per column, one board per size",
+)
+@click.option("--columns", default=4, help="Columns per board")
+@click.option("--description-size", default=200, help="Characters per description")
+@click.option("--repeat", default=5, help="Timed runs per operation")
+@click.option("--width", default=160, help="Terminal width")
+@click.option("--height", default=50, help="Terminal height")
+@click.option(
+    "--output",
+    default="tui_bench_output.json",
+    type=click.Path(path_type=Path),
+    help="Where to write the JSON results",
+)
+@click.option(
+    "--baseline",
+    default=str(BENCHMARK_DIR / "tui_baseline.json"),
+    type=click.Path(path_type=Path),
+    help="Baseline results to compare against",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    help="Allowed slowdown over the baseline best run (0.25 = 25%)",
+)
+@click.option(
+    "--update-baseline", is_flag=True, help="Store these results as the new baseline"
+)
+def main(
+    sizes: str,
+    columns: int,
+    description_size: int,
+    repeat: int,
+    width: int,
+    height: int,
+    output: Path,
+    baseline: Path,
+    threshold: float,
+    update_baseline: bool,
+) -> None:
+    try:
+        item_counts = [int(size) for size in sizes.split(",") if size.strip()]
+    except ValueError:
+        raise click.BadParameter(
+            "must be comma-separated numbers", param_hint="--sizes"
+        )
+    if columns < 2 or not item_counts or min(item_counts) < 1:
+        raise click.BadParameter("need at least 2 columns and 1 item per column")
+
+    config = {
+        "sizes": item_counts,
+        "columns": columns,
+        "description_size": description_size,
+        "repeat": repeat,
+        "terminal": [width, height],
+    }
+
+    results = run_tui_benchmarks(
+        item_counts, columns, description_size, repeat, (width, height)
+    )
+
+    report = write_results(output, config, results)
+    click.echo(f"Results written to {output}")
+
+    if update_baseline:
+        write_results(baseline, config, results)
+        click.echo(f"Baseline updated at {baseline}")
+        return
+
+    stored = load_results(baseline)
+    if not stored:
+        click.echo(f"No baseline at {baseline}, skipping comparison")
+        return
+
+    if stored.get("config") != config:
+        click.echo("Warning: baseline was recorded with a different configuration")
+
+    rows = compare_to_baseline(report, stored, threshold)
+    click.echo(format_comparison(rows))
+
+    if any(regressed for *_, regressed in rows):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
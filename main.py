@@ -2,15 +2,57 @@
 
 import click
 import asyncio
+import json
 import subprocess
 import tempfile
+import tracemalloc
 from pathlib import Path
 from src.app import MKanbanApp
-from src.storage.markdown_storage import MarkdownStorage
+from src.storage.markdown_storage import ITEM_FILENAMES, MarkdownStorage
+from src.storage.fsck import fsck as check_boards
+from src.storage.query import QueryEngine, QueryError, parse_query
+from src.storage.workspace import Workspace, WorkspaceBoard
+from src.models.board import Board
+from src.models.column import Column
 from src.models.item import Item
+from src.utils.config import Config
+from src.utils.memory import measure_memory
+from src.utils.metrics import (
+    load_textfile,
+    metrics,
+    summarize_io,
+    summarize_operations,
+)
+from src.utils.profiling import DEFAULT_PROFILE_DIR, profiler
+
+
+def resolve_data_dir(data_dir: Path) -> Path:
+    config = Config.load()
+    if data_dir != Path("./data"):
+        config.data_dir = str(data_dir)
+    return Path(config.data_dir).expanduser().resolve()
+
+
+def open_storage(data_dir: Path) -> MarkdownStorage:
+    return MarkdownStorage(data_dir, Config.load().item_filenames)
+
+
+def find_column(board: Board, column_name: str) -> Column | None:
+    """A column by name, also matching "to-do" for "To Do"."""
+    for column in board.columns:
+        if (
+            column.name.lower().replace(" ", "-") == column_name.lower()
+            or column.name.lower() == column_name.lower()
+        ):
+            return column
+    return None
 
 
-@click.command()
+def default_metrics_file(data_dir: Path) -> Path:
+    return resolve_data_dir(data_dir) / "metrics.prom"
+
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--data-dir",
     default="./data",
@@ -46,14 +88,87 @@ from src.models.item import Item
     is_flag=True,
     help="Create a new item with neovim editor (requires --board)",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    envvar="MKANBAN_PROFILE",
+    help="Record timing spans for storage, controller and UI operations",
+)
+@click.option(
+    "--profile-dir",
+    default=DEFAULT_PROFILE_DIR,
+    envvar="MKANBAN_PROFILE_DIR",
+    help="Where to write trace.json, profile.prof and slow.log",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--slow-threshold",
+    default=100.0,
+    envvar="MKANBAN_SLOW_MS",
+    help="Log profiled operations slower than this many milliseconds",
+    type=float,
+)
+@click.option(
+    "--metrics",
+    "write_metrics",
+    is_flag=True,
+    envvar="MKANBAN_METRICS",
+    help="Write operation metrics to an OpenMetrics textfile",
+)
+@click.option(
+    "--metrics-file",
+    default=None,
+    envvar="MKANBAN_METRICS_FILE",
+    help="OpenMetrics textfile path (default: <data-dir>/metrics.prom)",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--metrics-interval",
+    default=0.0,
+    envvar="MKANBAN_METRICS_INTERVAL",
+    help="Also write metrics every N seconds (0 = only on exit)",
+    type=float,
+)
+@click.option(
+    "--trace-memory",
+    is_flag=True,
+    envvar="MKANBAN_TRACE_MEMORY",
+    help="Trace allocations with tracemalloc for the g m memory report",
+)
+@click.pass_context
 def main(
+    ctx: click.Context,
     data_dir: Path,
     board: str,
     new_task_title: str,
     new_task_description: str,
     column: str,
     new_item: bool,
+    profile: bool,
+    profile_dir: Path,
+    slow_threshold: float,
+    write_metrics: bool,
+    metrics_file: Path | None,
+    metrics_interval: float,
+    trace_memory: bool,
 ):
+    ctx.ensure_object(dict)
+    ctx.obj["data_dir"] = data_dir
+
+    if profile:
+        profiler.enable(profile_dir, slow_threshold)
+
+    if trace_memory:
+        tracemalloc.start()
+
+    if write_metrics or metrics_file:
+        metrics.enable_textfile(
+            metrics_file or default_metrics_file(data_dir), metrics_interval
+        )
+
+    if ctx.invoked_subcommand:
+        return
+
     if new_item:
         if not board:
             click.echo("Error: --board is required when using --new-item")
@@ -74,10 +189,512 @@ def main(
     app.run()
 
 
+@main.command()
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory whose metrics to show",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--metrics-file",
+    default=None,
+    help="OpenMetrics textfile to read (default: <data-dir>/metrics.prom)",
+    type=click.Path(path_type=Path),
+)
+@click.pass_context
+def stats(ctx: click.Context, data_dir: Path | None, metrics_file: Path | None):
+    """Print recorded operation metrics for a data dir."""
+    data_dir = data_dir or ctx.obj.get("data_dir", Path("./data"))
+    metrics_file = metrics_file or default_metrics_file(data_dir)
+
+    samples = load_textfile(metrics_file)
+    if not samples:
+        click.echo(f"No metrics recorded in {metrics_file}")
+        return
+
+    click.echo(
+        f"{'board':<24} {'operation':<10} {'count':>8} {'mean ms':>10} {'p95 ms':>10}"
+    )
+    for row in summarize_operations(samples):
+        p95 = "inf" if row["p95"] == float("inf") else f"{row['p95'] * 1000:.1f}"
+        click.echo(
+            f"{row.get('board') or '-':<24} {row.get('operation', ''):<10} "
+            f"{row['count']:>8} {row['mean'] * 1000:>10.2f} {p95:>10}"
+        )
+
+    click.echo("")
+    click.echo(
+        f"{'board':<24} {'files read':>11} {'written':>9} "
+        f"{'bytes read':>12} {'written':>12}"
+    )
+    for board_name, totals in sorted(summarize_io(samples).items()):
+        click.echo(
+            f"{board_name or '-':<24} {int(totals.get('files_read', 0)):>11} "
+            f"{int(totals.get('files_written', 0)):>9} "
+            f"{int(totals.get('bytes_read', 0)):>12} "
+            f"{int(totals.get('bytes_written', 0)):>12}"
+        )
+
+
+@main.command()
+@click.argument("expression", required=False, default="")
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory to query",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Print a table, or a JSON array streamed one item at a time",
+)
+@click.option(
+    "--explain",
+    is_flag=True,
+    help="Report how many boards, columns and item files were read",
+)
+@click.pass_context
+def query(
+    ctx: click.Context,
+    expression: str,
+    data_dir: Path | None,
+    output_format: str,
+    explain: bool,
+):
+    """Find items across boards, e.g.
+
+    mkanban query 'parent = Epic and column = "In Progress" and
+    updated_at < 14d ago sort by updated_at'
+    """
+    data_dir = data_dir or ctx.obj.get("data_dir", Path("./data"))
+
+    try:
+        parsed = parse_query(expression)
+    except QueryError as e:
+        raise click.BadParameter(str(e), param_hint="EXPRESSION")
+
+    engine = QueryEngine(open_storage(resolve_data_dir(data_dir)))
+    results = engine.run(parsed)
+
+    if output_format == "json":
+        click.echo("[", nl=False)
+        for index, result in enumerate(results):
+            click.echo("," if index else "", nl=False)
+            click.echo(f"\n  {json.dumps(result.to_json())}", nl=False)
+        click.echo("\n]")
+    else:
+        click.echo(f"{'board':<16} {'column':<14} {'parent':<14} {'updated':<16} title")
+        for result in results:
+            click.echo(
+                f"{result.board[:16]:<16} {result.column[:14]:<14} "
+                f"{(result.parent or '-')[:14]:<14} "
+                f"{result.item.updated_at:%Y-%m-%d %H:%M} {result.item.title}"
+            )
+
+    if explain:
+        stats = engine.stats
+        click.echo(
+            f"boards {stats.boards_read}/{stats.boards} read, "
+            f"columns {stats.columns_read}/{stats.columns} read, "
+            f"item files {stats.item_files_read}/{stats.links} read, "
+            f"{stats.matches} matched",
+            err=True,
+        )
+
+
+@main.command()
+@click.argument("board_name", metavar="BOARD")
+@click.argument("column_name", metavar="[COLUMN]", required=False)
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory of the board",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--offset",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Items to skip, in column order",
+)
+@click.option(
+    "--limit",
+    default=50,
+    type=click.IntRange(min=1),
+    help="Items per page",
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Print a table, or a JSON array streamed one item at a time",
+)
+@click.pass_context
+def items(
+    ctx: click.Context,
+    board_name: str,
+    column_name: str | None,
+    data_dir: Path | None,
+    offset: int,
+    limit: int,
+    output_format: str,
+):
+    """List a page of a board's items, or of one column's, e.g.
+
+    mkanban items Work "In Progress" --offset 50 --limit 50
+
+    Only the item files of the page are read, so a page costs the same
+    however large the board is.
+    """
+    storage = open_storage(
+        resolve_data_dir(data_dir or ctx.obj.get("data_dir", Path("./data")))
+    )
+    summary = storage.find_board_summary(board_name)
+    outline = storage.load_board_outline(summary.kanban_file) if summary else None
+    if outline is None:
+        raise click.ClickException(f"Board '{board_name}' not found")
+
+    board, _ = outline
+    columns = board.columns
+    if column_name:
+        column = find_column(board, column_name)
+        if column is None:
+            raise click.ClickException(
+                f"Column '{column_name}' not found in board '{board.name}'; "
+                f"available columns: {', '.join(col.name for col in board.columns)}"
+            )
+        columns = [column]
+
+    def page():
+        # Whole columns before the offset are skipped by their link count
+        skip, left = offset, limit
+        for column in columns:
+            count = storage.count_items(board, column)
+            if skip >= count:
+                skip -= count
+                continue
+            for item in storage.iter_items(board, column, skip, left):
+                yield column, item
+                left -= 1
+            skip = 0
+            if left <= 0:
+                return
+
+    shown = 0
+    if output_format == "json":
+        click.echo("[", nl=False)
+        for column, item in page():
+            click.echo("," if shown else "", nl=False)
+            row = {"column": column.name, **item.model_dump(mode="json")}
+            click.echo(f"\n  {json.dumps(row)}", nl=False)
+            shown += 1
+        click.echo("\n]")
+    else:
+        click.echo(f"{'column':<14} {'parent':<14} {'updated':<16} title")
+        for column, item in page():
+            parent = board.get_parent_by_id(item.parent_id) if item.parent_id else None
+            click.echo(
+                f"{column.name[:14]:<14} {(parent.name if parent else '-')[:14]:<14} "
+                f"{item.updated_at:%Y-%m-%d %H:%M} {item.title}"
+            )
+            shown += 1
+
+    total = sum(storage.count_items(board, column) for column in columns)
+    if shown:
+        message = f"items {offset + 1}-{offset + shown} of {total}"
+    else:
+        message = f"no items after {offset} of {total}"
+    if offset + limit < total:
+        message += f"; next page: --offset {offset + limit}"
+    click.echo(message, err=True)
+
+
+@main.command()
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory to check",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--board",
+    "board_names",
+    multiple=True,
+    help="Only check this board (repeatable; default: all boards)",
+)
+@click.option("--fix", is_flag=True, help="Repair what can be repaired")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Print a table, or a JSON report",
+)
+@click.option(
+    "--jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Worker processes for large data dirs (default: CPU count)",
+)
+@click.pass_context
+def fsck(
+    ctx: click.Context,
+    data_dir: Path | None,
+    board_names: tuple[str, ...],
+    fix: bool,
+    output_format: str,
+    jobs: int | None,
+):
+    """Check boards for broken links, orphaned or duplicate item files,
+    mismatched column ids and unknown parents.
+
+    Exits with status 1 while problems remain, e.g. for a pre-commit hook.
+    """
+    data_dir = resolve_data_dir(data_dir or ctx.obj.get("data_dir", Path("./data")))
+    report = check_boards(data_dir, list(board_names), fix=fix, jobs=jobs)
+
+    if output_format == "json":
+        click.echo(json.dumps(report.to_json(), indent=2))
+    else:
+        for issue in report.issues:
+            issue_json = issue.to_json(data_dir)
+            status = "fixed" if issue.fixed else ("" if issue.fixable else "manual")
+            click.echo(
+                f"{issue.kind:<19} {status:<6} {issue_json['path']}: {issue.message}"
+            )
+        click.echo(
+            f"{report.boards} boards, {report.columns} columns, "
+            f"{report.item_files} item files: {len(report.issues)} problems, "
+            f"{len(report.issues) - len(report.unfixed)} fixed"
+        )
+
+    if report.unfixed:
+        ctx.exit(1)
+
+
+@main.command()
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory whose boards to load",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--board",
+    "board_names",
+    multiple=True,
+    help="Only load this board (repeatable; default: all boards)",
+)
+@click.option("--top", default=10, help="How many allocating files to list")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Print a table, or a JSON report",
+)
+@click.pass_context
+def mem(
+    ctx: click.Context,
+    data_dir: Path | None,
+    board_names: tuple[str, ...],
+    top: int,
+    output_format: str,
+):
+    """Load boards and report what they cost in memory, per item too.
+
+    In the app, g m shows the same report for the open boards and widgets.
+    """
+    tracemalloc.start()
+    storage = open_storage(
+        resolve_data_dir(data_dir or ctx.obj.get("data_dir", Path("./data")))
+    )
+    wanted = {name.lower() for name in board_names}
+    boards = []
+    for summary in storage.load_board_catalog():
+        if wanted and summary.name.lower() not in wanted:
+            continue
+        board = storage.load_board_from_file(summary.kanban_file)
+        if board:
+            boards.append(board)
+
+    report = measure_memory(
+        boards, {"item versions": storage.version_stamps()}, top=top
+    )
+    if output_format == "json":
+        click.echo(json.dumps(report.to_json(), indent=2))
+    else:
+        click.echo("\n".join(report.format_lines()))
+
+
+@main.command("migrate-filenames")
+@click.option(
+    "--data-dir",
+    default=None,
+    help="Data directory to migrate",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--board",
+    "board_names",
+    multiple=True,
+    help="Only migrate this board (repeatable; default: all boards)",
+)
+@click.option(
+    "--filenames",
+    "item_filenames",
+    default=None,
+    type=click.Choice(ITEM_FILENAMES),
+    help="Name item files after the title or the id, and keep doing so "
+    "(default: the configured naming)",
+)
+@click.pass_context
+def migrate_filenames(
+    ctx: click.Context,
+    data_dir: Path | None,
+    board_names: tuple[str, ...],
+    item_filenames: str | None,
+):
+    """Remove stale copies of renamed items and rename item files.
+
+    Copies of an item left behind by renames are deleted (as by fsck --fix),
+    then every item file is renamed to the configured naming, so each item
+    has exactly one file.
+    """
+    data_dir = resolve_data_dir(data_dir or ctx.obj.get("data_dir", Path("./data")))
+    config = Config.load()
+    if item_filenames and item_filenames != config.item_filenames:
+        config.item_filenames = item_filenames
+        config.save()
+        click.echo(f"Item files are now named after the {item_filenames}")
+
+    report = check_boards(data_dir, list(board_names), fix=True)
+    duplicates = sum(1 for issue in report.issues if issue.kind == "duplicate_id")
+    if report.unfixed:
+        click.echo(
+            f"{len(report.unfixed)} problems need a manual fix; "
+            "run mkanban fsck for details",
+            err=True,
+        )
+
+    storage = MarkdownStorage(data_dir, config.item_filenames)
+    wanted = {name.lower() for name in board_names}
+    renamed = items = files = 0
+    for summary in storage.load_board_catalog():
+        if wanted and summary.name.lower() not in wanted:
+            continue
+        board = storage.load_board_from_file(summary.kanban_file)
+        if not board:
+            continue
+        renamed += storage.rename_item_files(board)
+        board_dir = storage.get_kanban_file(board).parent
+        for column in board.columns:
+            items += len(column.items)
+            items_dir = board_dir / storage._get_safe_name(column.name) / "items"
+            files += sum(1 for _ in items_dir.glob("*.md"))
+
+    click.echo(
+        f"Removed {duplicates} stale item files, renamed {renamed}: "
+        f"{items} items in {files} item files"
+    )
+
+
+@main.group()
+@click.option(
+    "--root",
+    default=".",
+    envvar=["MKANBAN_WORKSPACE", "NOTE_PATH"],
+    help="Directory tree to find data dirs in ($MKANBAN_WORKSPACE or $NOTE_PATH)",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.pass_context
+def workspace(ctx: click.Context, root: Path):
+    """List, search and open boards across every data dir under a root."""
+    ctx.obj["workspace"] = Workspace(root)
+
+
+def echo_workspace_boards(workspace: Workspace, boards: list[WorkspaceBoard]):
+    click.echo(f"{'data dir':<32} {'board':<24} {'columns':>7}  updated")
+    for board in boards:
+        updated = board.summary.updated_at
+        click.echo(
+            f"{workspace.relative_name(board.data_dir)[:32]:<32} "
+            f"{board.name[:24]:<24} {board.summary.column_count:>7}  "
+            f"{f'{updated:%Y-%m-%d %H:%M}' if updated else '-'}"
+        )
+
+
+@workspace.command("list")
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    help="Report how much of the tree the scan had to read",
+)
+@click.pass_context
+def workspace_list(ctx: click.Context, show_stats: bool):
+    """List every board in the workspace."""
+    workspace = ctx.obj["workspace"]
+    echo_workspace_boards(workspace, workspace.scan())
+
+    if show_stats:
+        stats = workspace.stats
+        click.echo(
+            f"{stats.dirs_listed}/{stats.dirs} dirs listed, "
+            f"{stats.boards_read}/{stats.boards} boards read, "
+            f"{stats.data_dirs} data dirs",
+            err=True,
+        )
+
+
+@workspace.command("search")
+@click.argument("text")
+@click.pass_context
+def workspace_search(ctx: click.Context, text: str):
+    """Find boards by name, description or data dir."""
+    workspace = ctx.obj["workspace"]
+    echo_workspace_boards(workspace, workspace.search(text))
+
+
+@workspace.command("open")
+@click.argument("board")
+@click.pass_context
+def workspace_open(ctx: click.Context, board: str):
+    """Open a board, given as NAME or DATA_DIR:NAME when the name is ambiguous."""
+    workspace = ctx.obj["workspace"]
+    data_dir_name, _, board_name = board.rpartition(":")
+    matches = [
+        candidate
+        for candidate in workspace.scan()
+        if candidate.name.lower() == board_name.lower()
+        and (
+            not data_dir_name
+            or workspace.relative_name(candidate.data_dir) == data_dir_name
+        )
+    ]
+
+    if not matches:
+        raise click.ClickException(f"No board named '{board}' in {workspace.root}")
+    if len(matches) > 1:
+        echo_workspace_boards(workspace, matches)
+        raise click.ClickException(
+            f"'{board}' is in {len(matches)} data dirs; use DATA_DIR:{board_name}"
+        )
+
+    match = matches[0]
+    app = MKanbanApp(data_dir=match.data_dir, initial_board=match.name)
+    app.run()
+
+
 def create_new_task(
     data_dir: Path, board_name: str, title: str, description: str, column_name: str
 ):
-    storage = MarkdownStorage(data_dir)
+    storage = open_storage(data_dir)
 
     board = storage.load_board_by_name(board_name)
     click.echo(storage.list_board_names())
@@ -85,15 +702,7 @@ def create_new_task(
         click.echo(f"Error: Board asdfasfsf '{board_name}' not found")
         return
 
-    target_column = None
-    for column in board.columns:
-        if (
-            column.name.lower().replace(" ", "-") == column_name.lower()
-            or column.name.lower() == column_name.lower()
-        ):
-            target_column = column
-            break
-
+    target_column = find_column(board, column_name)
     if not target_column:
         click.echo(f"Error: Column '{column_name}' not found in board '{board_name}'")
         click.echo(
@@ -101,27 +710,24 @@ def create_new_task(
         )
         return
 
-    new_item = target_column.add_item(title, target_column.id)
+    new_item = board.add_item(target_column.id, title)
     new_item.description = description
 
-    storage.save_board(board)
+    # Only the new item is written, so changes other processes made to the
+    # board since it was loaded are kept
+    storage.add_item_to_column(board, new_item)
 
     click.echo(
-        f"Successfully created task '{title}' in column '{
-            target_column.name
-        }' of board '{board_name}'"
+        f"Successfully created task '{title}' in column "
+        f"'{target_column.name}' of board '{board_name}'"
     )
 
 
 def create_new_item_with_editor(data_dir: Path, board_name: str, column_name: str):
-    storage = MarkdownStorage(data_dir)
+    storage = open_storage(data_dir)
 
     board = storage.load_board_by_name(board_name)
-
-    boards = storage.load_boards()
-    if boards:
-        board = boards[0]
-    else:
+    if board is None:
         sample_board = storage.create_sample_board("default")
         storage.save_board(sample_board)
         board = sample_board
@@ -189,10 +795,12 @@ metadata:
             click.echo("No title specified. Aborting item creation.")
             return
 
-        new_item = target_column.add_item(title, target_column.id)
+        new_item = board.add_item(target_column.id, title)
         new_item.description = description
 
-        storage.save_board(board)
+        # The board was loaded before the editor opened, so only the new
+        # item is written rather than the whole, possibly stale, board
+        storage.add_item_to_column(board, new_item)
 
         click.echo(
             f"Successfully created item '{title}' in column '{target_column.name}' of board '{board_name}'"
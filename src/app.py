@@ -1,15 +1,28 @@
+import tracemalloc
 from pathlib import Path
 from typing import Optional
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
+from textual.geometry import Size
 from textual.reactive import reactive
+from textual.worker import get_current_worker
 
 from .storage.markdown_storage import MarkdownStorage
+from .storage.write_queue import WriteQueue
+from .storage.board_cache import BoardCache
+from .storage.board_hydrator import BoardHydrator, LoadedBatch
 from .models.board import Board
+from .models.column import Column
+from .models.board_summary import BoardSummary
 from .ui.widgets.board_widget import BoardWidget
+from .ui.widgets.column_widget import ColumnWidget
+from .ui.dialogs.help_dialog import HelpDialog
+from .ui.dialogs.board_picker_dialog import BoardPickerDialog
 from .controllers.board_controller import BoardController
+from .controllers.history import UndoHistory
 from .utils.config import Config
+from .utils.memory import measure_memory
 
 
 class MKanbanApp(App):
@@ -17,6 +30,8 @@ class MKanbanApp(App):
     TITLE = "MKanban"
     SUB_TITLE = "Terminal Kanban Board"
 
+    PREFETCH_COUNT = 3
+
     terminal_width: reactive[int] = reactive(80)
     terminal_height: reactive[int] = reactive(24)
 
@@ -29,16 +44,26 @@ class MKanbanApp(App):
         Binding("G", "focus_last", "Last", show=False),
         Binding("ctrl+d", "scroll_down", "Scroll Down", show=False),
         Binding("ctrl+u", "scroll_up", "Scroll Up", show=False),
-        Binding("shift+j", "column_scroll_down", "Column Scroll Down", show=False),
         Binding("H", action="move_left", description="Column Scroll Down"),
         ("L", "move_right", "Move Left"),
+        Binding("K", "move_item_up", "Move Item Up", show=False),
+        Binding("J", "move_item_down", "Move Item Down", show=False),
+        Binding("T", "move_item_to_top", "Move Item To Top", show=False),
+        Binding("B", "move_item_to_bottom", "Move Item To Bottom", show=False),
         Binding("o", "new_item", "New Item", show=False),
         Binding("d", "delete_item", "Delete", show=True),
+        Binding("u", "undo", "Undo", show=False),
+        Binding("ctrl+r", "redo", "Redo", show=False),
         Binding("i", "edit_item", "Edit", show=False),
+        Binding("space", "preview_item", "Preview", show=False),
         Binding("p", "toggle_parents", "Toggle Parents", show=False),
+        Binding("z", "toggle_column", "Toggle Column", show=False),
+        Binding("Z", "expand_columns", "Expand Columns", show=False),
+        Binding("b", "switch_board", "Switch Board", show=False),
         Binding("w", "save", "Save", show=False),
         Binding("r", "refresh", "Refresh", show=False),
         Binding("g,question_mark", "show_help", "Help", show=False),
+        Binding("g,m", "show_memory", "Memory", show=False),
         Binding("q", "quit", "Quit", show=False),
         ("ctrl+c", "quit", "Quit"),
     ]
@@ -51,9 +76,19 @@ class MKanbanApp(App):
             self.config.data_dir = str(data_dir)
 
         self.data_dir = Path(self.config.data_dir).expanduser().resolve()
-        self.storage = MarkdownStorage(self.data_dir)
+        self.storage = MarkdownStorage(self.data_dir, self.config.item_filenames)
+        self.write_queue = WriteQueue()
         self.initial_board = initial_board
         self.current_board: Optional[Board] = None
+        self.current_board_key: Optional[str] = None
+        self.board_catalog: list[BoardSummary] = []
+        self.board_cache = BoardCache()
+        # kanban.md paths of opened boards, most recent first
+        self._board_history: list[str] = []
+        # Undo history of every board opened this session, by kanban.md path
+        self._histories: dict[str, UndoHistory] = {}
+        # Loads the item files of a board painted from its skeleton
+        self.hydrator: Optional[BoardHydrator] = None
         self.board_view: Optional[BoardWidget] = None
 
     def compose(self) -> ComposeResult:
@@ -66,72 +101,343 @@ class MKanbanApp(App):
         self.update_terminal_dimensions()
         self.load_initial_board()
 
+    def on_unmount(self) -> None:
+        self.write_queue.drain()
+
     def on_resize(self, event) -> None:
-        self.update_terminal_dimensions()
+        self.update_terminal_dimensions(event.size)
         if self.board_view:
-            self.board_view.update_responsive_layout()
+            self.board_view.schedule_responsive_layout()
 
-    def update_terminal_dimensions(self) -> None:
-        size = self.console.size
+    def update_terminal_dimensions(self, size: Optional[Size] = None) -> None:
+        size = size or self.size
         self.terminal_width = size.width
         self.terminal_height = size.height
 
     def load_initial_board(self) -> None:
+        self.board_catalog = self.storage.load_board_catalog()
+
         if self.initial_board:
-            boards = self.storage.load_boards()
-            board_found = None
-            for board in boards:
-                if board.name.lower() == self.initial_board.lower():
-                    board_found = board
-                    break
-
-            if board_found:
-                self.current_board = board_found
-            else:
-                sample_board = self.storage.create_sample_board(self.initial_board)
-                self.storage.save_board(sample_board)
-                self.current_board = sample_board
+            summary = next(
+                (
+                    summary
+                    for summary in self.board_catalog
+                    if summary.name.lower() == self.initial_board.lower()
+                ),
+                None,
+            )
+            board_name = self.initial_board
         else:
-            boards = self.storage.load_boards()
-            if boards:
-                self.current_board = boards[0]
-            else:
-                sample_board = self.storage.create_sample_board("default")
-                self.storage.save_board(sample_board)
-                self.current_board = sample_board
+            summary = self.board_catalog[0] if self.board_catalog else None
+            board_name = "default"
+
+        if not summary or not self._show_board_skeleton(summary):
+            board = self.storage.create_sample_board(board_name)
+            self.storage.save_board(board)
+            self.board_catalog = self.storage.load_board_catalog()
+            self._show_board(board, str(self.storage.get_kanban_file(board)))
+
+        self.prefetch_boards()
+
+    def open_board(self, summary: Optional[BoardSummary]) -> None:
+        """Switch to a board from the catalog, using the cache when possible."""
+        if summary is None:
+            return
+
+        key = str(summary.kanban_file)
+        if key == self.current_board_key:
+            return
+
+        board = self.board_cache.get(key)
+        if board is not None:
+            self._show_board(board, key)
+        elif not self._show_board_skeleton(summary):
+            self.notify(f"Could not load board {summary.name}", severity="error")
+            return
+
+        self.prefetch_boards()
+
+    def reload_board(self) -> None:
+        """Load the open board from its files again, e.g. after a write that
+        failed halfway left them apart from the board in memory. Its undo
+        history is dropped, since the changes in it may not match the files."""
+        key = self.current_board_key
+        summary = next(
+            (s for s in self.board_catalog if str(s.kanban_file) == key), None
+        )
+        if summary is None:
+            return
+
+        self.write_queue.drain()
+        self._stop_hydration()
+        self.board_cache.discard(key)
+        self._histories.pop(key, None)
+        if not self._show_board_skeleton(summary):
+            self.notify(f"Could not load board {summary.name}", severity="error")
+
+    def _load_board(self, summary: BoardSummary) -> Optional[Board]:
+        board = self.storage.load_board_from_file(
+            summary.kanban_file, skip_collapsed=True
+        )
+        if board is None:
+            return None
+        return self.board_cache.setdefault(str(summary.kanban_file), board)
+
+    @property
+    def history(self) -> UndoHistory:
+        """Undo history of the open board."""
+        return self._histories.setdefault(self.current_board_key or "", UndoHistory())
+
+    def _show_board_skeleton(self, summary: BoardSummary) -> bool:
+        """Paint a board from kanban.md and column.md, then load its items.
+
+        Only the link titles are needed for the first paint, so it does not
+        wait for the item files; those are loaded by ``hydrate_board``.
+        Collapsed columns are not loaded until ``expand_column``.
+        """
+        loaded = self.storage.load_board_skeleton(
+            summary.kanban_file, skip_collapsed=True
+        )
+        if loaded is None:
+            return False
+
+        board, pending = loaded
+        key = str(summary.kanban_file)
+        self._show_board(board, key)
+        if pending:
+            self.hydrator = BoardHydrator(self.storage, board, pending, key)
+            self.call_after_refresh(self.hydrate_board)
+        return True
+
+    def _show_board(self, board: Board, key: str) -> None:
+        self._stop_hydration()
+        # The open board is the live copy; keep it as the cached one
+        self.board_cache.put(key, board)
+        if key in self._board_history:
+            self._board_history.remove(key)
+        self._board_history.insert(0, key)
+
+        self.current_board = board
+        self.current_board_key = key
+        self.controller = BoardController(board, self.storage)
+        if self.board_view:
+            self.board_view.set_board(board)
+
+    def hydrate_board(self) -> None:
+        """Load the pending item files on a worker, visible columns first."""
+        hydrator = self.hydrator
+        if hydrator is None or hydrator.is_complete:
+            return
+
+        if self.board_view:
+            hydrator.prioritize(self.board_view.visible_column_ids())
+        self.run_worker(
+            lambda: self._hydrate(hydrator),
+            name="hydrate-board",
+            group="hydrate",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def expand_column(self, column: Column) -> None:
+        """Load the items of a collapsed column like those of a skeleton."""
+        if column.is_loaded or not self.current_board:
+            return
+
+        pending = self.storage.load_column_skeleton(self.current_board, column)
+        if not pending:
+            return
+        if self.hydrator is None:
+            self.hydrator = BoardHydrator(
+                self.storage, self.current_board, pending, self.current_board_key
+            )
+        else:
+            self.hydrator.add(pending)
+        self.call_after_refresh(self.hydrate_board)
+
+    def _hydrate(self, hydrator: BoardHydrator) -> None:
+        worker = get_current_worker()
+        for column_id, loaded in hydrator.batches():
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(self._apply_hydrated, hydrator, column_id, loaded)
+
+    def _apply_hydrated(
+        self, hydrator: BoardHydrator, column_id: str, loaded: LoadedBatch
+    ) -> None:
+        if hydrator is not self.hydrator:
+            return
+
+        renamed = hydrator.apply(column_id, loaded)
+        if self.board_view:
+            self.board_view.update_hydrated_column(column_id, renamed)
+        if hydrator.is_complete:
+            self.hydrator = None
 
-        if self.current_board:
-            self.controller = BoardController(self.current_board, self.storage)
-            if self.board_view:
-                self.board_view.set_board(self.current_board)
+    def finish_hydration(self) -> None:
+        """Load the remaining item files now, before the board is changed.
+
+        Placeholder items have no description and a temporary id, so they
+        must not be saved, moved or edited.
+        """
+        hydrator = self.hydrator
+        if hydrator is None:
+            return
+
+        self.workers.cancel_group(self, "hydrate")
+        for column_id, loaded in hydrator.batches():
+            self._apply_hydrated(hydrator, column_id, loaded)
+
+    def _stop_hydration(self) -> None:
+        hydrator = self.hydrator
+        if hydrator is None:
+            return
+
+        self.workers.cancel_group(self, "hydrate")
+        self.hydrator = None
+        if not hydrator.is_complete and hydrator.key:
+            # A half loaded board must not be opened from the cache later
+            self.board_cache.discard(hydrator.key)
+
+    def _board_ready(self) -> bool:
+        if not self.controller or not self.board_view:
+            return False
+        self.finish_hydration()
+        return True
+
+    def _prefetch_candidates(self) -> list[BoardSummary]:
+        """Boards opened earlier, then the catalog neighbours of the current one."""
+        by_key = {str(summary.kanban_file): summary for summary in self.board_catalog}
+        current_key = self.current_board_key
+
+        keys = [key for key in self._board_history if key != current_key]
+        if current_key in by_key:
+            index = list(by_key).index(current_key)
+            for offset in (1, -1, 2, -2):
+                if 0 <= index + offset < len(self.board_catalog):
+                    keys.append(str(self.board_catalog[index + offset].kanban_file))
+
+        candidates = []
+        for key in dict.fromkeys(keys):
+            if key in by_key and key not in self.board_cache:
+                candidates.append(by_key[key])
+        return candidates[: self.PREFETCH_COUNT]
+
+    def prefetch_boards(self) -> None:
+        candidates = self._prefetch_candidates()
+        if candidates:
+            self.run_worker(
+                lambda: self._prefetch(candidates),
+                name="prefetch-boards",
+                group="prefetch",
+                exclusive=True,
+                thread=True,
+                exit_on_error=False,
+            )
+
+    def _prefetch(self, candidates: list[BoardSummary]) -> None:
+        worker = get_current_worker()
+        for summary in candidates:
+            if worker.is_cancelled:
+                return
+            if str(summary.kanban_file) not in self.board_cache:
+                self._load_board(summary)
 
     def action_new_item(self) -> None:
-        if self.controller and self.board_view:
+        if self._board_ready():
             self.board_view.show_new_item_dialog()
 
     def action_delete_item(self) -> None:
-        if self.controller and self.board_view:
+        if self._board_ready():
             self.board_view.delete_selected_item()
 
     def action_edit_item(self) -> None:
-        if self.controller and self.board_view:
+        if self._board_ready():
             self.board_view.edit_selected_item()
 
-    async def action_move_left(self) -> None:
-        if self.controller and self.board_view:
-            await self.board_view.move_left()
+    def action_preview_item(self) -> None:
+        if self._board_ready():
+            self.board_view.show_item_preview()
+
+    def action_move_left(self) -> None:
+        if self._board_ready():
+            self.board_view.move_left()
+
+    def action_move_right(self) -> None:
+        if self._board_ready():
+            self.board_view.move_right()
+
+    def action_move_item_up(self) -> None:
+        if self._board_ready():
+            self.board_view.move_item_up()
+
+    def action_move_item_down(self) -> None:
+        if self._board_ready():
+            self.board_view.move_item_down()
+
+    def action_move_item_to_top(self) -> None:
+        if self._board_ready():
+            self.board_view.move_item_to_top()
+
+    def action_move_item_to_bottom(self) -> None:
+        if self._board_ready():
+            self.board_view.move_item_to_bottom()
 
-    async def action_move_right(self) -> None:
-        if self.controller and self.board_view:
-            await self.board_view.move_right()
+    def action_undo(self) -> None:
+        self._step_history(undo=True)
+
+    def action_redo(self) -> None:
+        self._step_history(undo=False)
+
+    def _step_history(self, undo: bool) -> None:
+        if not self._board_ready():
+            return
+
+        self.write_queue.drain()
+        try:
+            if undo:
+                change = self.history.undo(self.current_board, self.storage)
+            else:
+                change = self.history.redo(self.current_board, self.storage)
+        except OSError as e:
+            self.notify(f"Error saving board: {e}", severity="error")
+            return
+
+        if change is None:
+            self.notify("Nothing to undo" if undo else "Nothing to redo")
+            return
+
+        focus_item_id = change.item_id
+        if self.current_board.get_item_by_id(focus_item_id) is None:
+            focus_item_id = None
+        self.board_view.refresh_board(focus_item_id=focus_item_id)
+        self.notify(f"{'Undid' if undo else 'Redid'} {change.label}")
 
     def action_toggle_parents(self) -> None:
         if self.board_view:
             self.board_view.toggle_parent_grouping()
 
+    def action_toggle_column(self) -> None:
+        if self.board_view and self.current_board:
+            self.board_view.toggle_selected_column()
+
+    def action_expand_columns(self) -> None:
+        if self.board_view and self.current_board:
+            self.board_view.expand_all_columns()
+
+    def action_switch_board(self) -> None:
+        self.board_catalog = self.storage.load_board_catalog()
+        current_id = self.current_board.id if self.current_board else None
+        self.push_screen(
+            BoardPickerDialog(self.board_catalog, current_id), self.open_board
+        )
+
     def action_save(self) -> None:
         if self.controller:
             try:
+                self.finish_hydration()
+                self.write_queue.drain()
                 self.controller.save()
                 self.notify("Board saved successfully")
             except Exception as e:
@@ -139,7 +445,7 @@ class MKanbanApp(App):
 
     def action_refresh(self) -> None:
         if self.board_view and self.current_board:
-            from .ui.board_view import RefreshType
+            from .ui.refresh_type import RefreshType
 
             self.board_view.refresh_board(refresh_type=RefreshType.FULL)
 
@@ -175,3 +481,41 @@ class MKanbanApp(App):
     def action_show_help(self) -> None:
         if self.board_view:
             self.board_view.show_help_dialog()
+
+    def action_show_memory(self) -> None:
+        """Show what the loaded boards, caches and widgets cost in memory."""
+        boards = self.board_cache.boards()
+        if self.current_board and all(b is not self.current_board for b in boards):
+            boards.insert(0, self.current_board)
+
+        report = measure_memory(
+            boards,
+            {
+                "board cache": self.board_cache,
+                "undo history": self._histories,
+                "item versions": self.storage.version_stamps(),
+                "board catalog": self.board_catalog,
+            },
+            self._widgets_by_column(),
+        )
+        text = "\n".join(report.format_lines())
+        if not tracemalloc.is_tracing():
+            text += "\n\nStart with --trace-memory to see where memory was allocated."
+        self.push_screen(HelpDialog(f"# Memory\n\n```\n{text}\n```"))
+
+    def _widgets_by_column(self) -> dict[str, list]:
+        groups: dict[str, list] = {}
+        in_columns: set[int] = set()
+        if self.board_view:
+            for column_widget in self.board_view.query(ColumnWidget):
+                nodes = list(column_widget.walk_children(with_self=True))
+                groups.setdefault(f"column {column_widget.column.name}", []).extend(
+                    nodes
+                )
+                in_columns.update(id(node) for node in nodes)
+        groups["other widgets"] = [
+            node
+            for node in self.screen.walk_children(with_self=True)
+            if id(node) not in in_columns
+        ]
+        return groups
@@ -1,6 +1,7 @@
 from ..models.board import Board
 from ..models.column import Column
 from ..storage.markdown_storage import MarkdownStorage
+from ..utils.profiling import traced
 
 
 class BoardController:
@@ -8,6 +9,7 @@ class BoardController:
         self.board = board
         self.storage = storage
 
+    @traced("board_controller.save")
     def save(self) -> None:
         self.storage.save_board(self.board)
 
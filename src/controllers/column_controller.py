@@ -1,10 +1,21 @@
 from csv import Error
-from datetime import datetime
-from ..storage.markdown_storage import MarkdownStorage
+from dataclasses import dataclass
+from ..storage.markdown_storage import ColumnMove, MarkdownStorage
 
 from ..models.board import Board
 from ..models.column import Column
 from ..models.item import Item
+from ..utils.profiling import traced
+
+
+@dataclass
+class ItemMove:
+    item: Item
+    source_column_id: str
+    target_column_id: str
+    source_rank: float | None
+    # What persist_move writes, so it never reads the board
+    snapshot: ColumnMove
 
 
 class ColumnController:
@@ -13,9 +24,11 @@ class ColumnController:
         self.board = board
         self.storage = storage
 
+    @traced("column_controller.save")
     def save(self) -> None:
         self.storage.save_board(self.board)
 
+    @traced("column_controller.add_item")
     def add_item(
         self,
         title: str,
@@ -23,93 +36,117 @@ class ColumnController:
         parent_id: str | None = None,
         description: str = "",
     ) -> Item:
-        item = self.column.add_item(title, column_id, parent_id)
+        item = self.board.add_item(column_id, title, parent_id)
         if description:
             item.description = description
 
-        self.storage.save_board(self.board)
+        self.storage.add_item_to_column(self.board, item)
 
         return item
 
     def get_item_by_id(self, id: str) -> Item | None:
-        for item in self.column.items:
-            if item.id == id:
-                return item
+        item = self.board.get_item_by_id(id)
+        if item and item.column_id == self.column.id:
+            return item
 
         return None
 
+    @traced("column_controller.delete_item")
     def delete_item(self, item: Item) -> bool:
         if not self.storage.delete_item_from_column(self.board, item):
             raise Error("Delete failed")
 
-        success = self.column.remove_item(item.id)
-
-        if success:
-            self.storage.save_board(self.board)
-
-        return success
+        return self.board.remove_item(item.id)
 
+    @traced("column_controller.move_item")
     def move_item(self, item_id: str, target_column_id: str) -> bool:
-        item_to_move = None
-        old_column_id = None
-
-        for column in self.board.columns:
-            for item in column.items:
-                if item.id == item_id:
-                    item_to_move = item
-                    old_column_id = column.id
-                    break
-            if item_to_move:
-                break
-
-        if not item_to_move or not old_column_id:
+        move = self.apply_move(item_id, target_column_id)
+        if not move:
             return False
 
-        if old_column_id == target_column_id:
+        if not self.persist_move(move):
+            self.revert_move(move)
             return False
 
-        target_column = self.board.get_column_by_id(target_column_id)
-        if not target_column:
-            return False
+        return True
 
-        file_moved = self.storage.move_item_between_columns(
-            self.board, item_to_move, old_column_id, target_column_id
+    def apply_move(self, item_id: str, target_column_id: str) -> ItemMove | None:
+        """Move the item to the end of the target column in memory only."""
+        item = self.board.get_item_by_id(item_id)
+        if not item or item.column_id == target_column_id:
+            return None
+
+        source_column_id = item.column_id
+        source_rank = item.rank
+        if not self.board.move_to_column(item_id, target_column_id):
+            return None
+
+        # Both columns exist and differ, so there is always a snapshot
+        return ItemMove(
+            item=item,
+            source_column_id=source_column_id,
+            target_column_id=target_column_id,
+            source_rank=source_rank,
+            snapshot=self.storage.snapshot_move(
+                self.board, item, source_column_id, target_column_id
+            ),
         )
 
-        if not file_moved:
+    @traced("column_controller.persist_move")
+    def persist_move(self, move: ItemMove) -> bool:
+        """Write a move made by ``apply_move``; safe to call off the UI thread,
+        since only the move's snapshot is read, never the board."""
+        return self.storage.write_move(move.snapshot)
+
+    def revert_move(self, move: ItemMove) -> bool:
+        """Put the item back where it was before ``move``.
+
+        A move that failed partway may have left the item file in the target
+        column, in which case it is moved back on disk too. An OSError from
+        that is raised after the board was reverted, leaving the board and
+        the files apart, so callers reload the board then.
+        """
+        item = self.board.get_item_by_id(move.item.id)
+        source_column = self.board.get_column_by_id(move.source_column_id)
+        if not item or not source_column:
             return False
 
-        old_column = self.board.get_column_by_id(old_column_id)
-        if old_column:
-            if not old_column.remove_item(item_id):
-                raise Error()
+        if item.column_id != source_column.id:
+            current_column_id = item.column_id
+            current_column = self.board.get_column_by_id(current_column_id)
+            if current_column:
+                current_column.remove_item(item.id)
+            item.move_to_column(source_column.id)
+            source_column.items.append(item)
+            self.board.regroup_item(item, item.parent_id, current_column_id)
 
-        target_column.items.append(item_to_move)
-        target_column.updated_at = datetime.now()
+        item.rank = move.source_rank
+        source_column.normalize_ranks()
 
-        self.storage.save_board(self.board)
+        self.storage.move_item_between_columns(
+            self.board, item, move.target_column_id, source_column.id
+        )
+
+        return True
+
+    @traced("column_controller.reorder_item")
+    def reorder_item(self, item_id: str, position: int) -> bool:
+        changed_items = self.column.move_item_to_position(item_id, position)
+        if not changed_items:
+            return False
+
+        self.storage.save_item_order(self.board, self.column, changed_items)
 
         return True
 
     def get_column_items(
         self, column_id: str, grouped_by_parent: bool = False
     ) -> list[Item]:
-        items = self.column.get_column_items(column_id)
-
         if not grouped_by_parent:
-            return items
-
-        orphaned_items = [item for item in items if item.parent_id is None]
-        parent_groups: dict[str, list[Item]] = {}
-
-        for item in items:
-            if item.parent_id:
-                if item.parent_id not in parent_groups:
-                    parent_groups[item.parent_id] = []
-                parent_groups[item.parent_id].append(item)
+            return self.column.get_column_items(column_id)
 
-        grouped_items = orphaned_items[:]
-        for parent_id, parent_items in parent_groups.items():
-            grouped_items.extend(parent_items)
+        grouped_items: list[Item] = []
+        for parent_id in self.board.get_group_parent_ids():
+            grouped_items.extend(self.board.get_group_items(parent_id, column_id))
 
         return grouped_items
@@ -0,0 +1,351 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from ..models.board import Board
+from ..models.item import Item
+from ..storage.markdown_storage import MarkdownStorage
+
+# Item fields an edit can change, recorded by ItemFieldsChange
+EDITABLE_FIELDS = ("title", "description", "parent_id", "rank")
+
+# Rough cost of a change besides the text it retains
+CHANGE_OVERHEAD_BYTES = 200
+
+
+class Change(ABC):
+    """An undoable board change, stored as the difference it made.
+
+    ``undo`` and ``redo`` apply the change to the board by item id and
+    persist it through the same incremental storage calls the original
+    action uses. They return False when the item is gone.
+    """
+
+    label = "change"
+    item_id: str
+
+    @abstractmethod
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool: ...
+
+    @abstractmethod
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool: ...
+
+    def size(self) -> int:
+        return CHANGE_OVERHEAD_BYTES
+
+
+@dataclass(eq=False)
+class ItemFieldsChange(Change):
+    item_id: str
+    before: dict[str, Any]
+    after: dict[str, Any]
+
+    label = "edit"
+
+    @classmethod
+    def between(
+        cls, item_id: str, before: dict[str, Any], after: dict[str, Any]
+    ) -> Optional["ItemFieldsChange"]:
+        """Keep only the fields that differ; None when nothing changed."""
+        changed = [name for name in after if before.get(name) != after[name]]
+        if not changed:
+            return None
+        return cls(
+            item_id,
+            {name: before.get(name) for name in changed},
+            {name: after[name] for name in changed},
+        )
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._set(board, storage, self.before)
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._set(board, storage, self.after)
+
+    def _set(
+        self, board: Board, storage: MarkdownStorage, values: dict[str, Any]
+    ) -> bool:
+        item = board.get_item_by_id(self.item_id)
+        if not item:
+            return False
+
+        old_parent_id = item.parent_id
+        for name, value in values.items():
+            setattr(item, name, value)
+        item.updated_at = datetime.now()
+
+        if item.parent_id != old_parent_id:
+            board.regroup_item(item, old_parent_id, item.column_id)
+        reorder = "rank" in values
+        column = board.get_column_by_id(item.column_id)
+        if reorder and column:
+            column.normalize_ranks()
+        return storage.save_item(board, item, reorder)
+
+    def size(self) -> int:
+        values = [*self.before.values(), *self.after.values()]
+        return CHANGE_OVERHEAD_BYTES + sum(len(str(value)) for value in values)
+
+
+@dataclass(eq=False)
+class ItemMoveChange(Change):
+    item_id: str
+    source_column_id: str
+    source_rank: Optional[float]
+    target_column_id: str
+    target_rank: Optional[float]
+
+    label = "move"
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._move(
+            board,
+            storage,
+            self.target_column_id,
+            self.source_column_id,
+            self.source_rank,
+        )
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._move(
+            board,
+            storage,
+            self.source_column_id,
+            self.target_column_id,
+            self.target_rank,
+        )
+
+    def _move(
+        self,
+        board: Board,
+        storage: MarkdownStorage,
+        from_column_id: str,
+        to_column_id: str,
+        rank: Optional[float],
+    ) -> bool:
+        item = board.get_item_by_id(self.item_id)
+        if not item or item.column_id != from_column_id:
+            return False
+        column = board.get_column_by_id(to_column_id)
+        if column:
+            storage.load_column_items(board, column)
+        if not board.move_to_column(item.id, to_column_id):
+            return False
+
+        item.rank = rank
+        column = board.get_column_by_id(to_column_id)
+        if column:
+            column.normalize_ranks()
+        return storage.move_item_between_columns(
+            board, item.model_copy(), from_column_id, to_column_id
+        )
+
+
+@dataclass(eq=False)
+class ItemOrderChange(Change):
+    item_id: str
+    column_id: str
+    # item id -> rank, only for the items whose rank changed
+    before: dict[str, Optional[float]]
+    after: dict[str, Optional[float]]
+
+    label = "reorder"
+
+    @classmethod
+    def between(
+        cls,
+        item_id: str,
+        column_id: str,
+        before: dict[str, Optional[float]],
+        items: list[Item],
+    ) -> Optional["ItemOrderChange"]:
+        after = {
+            item.id: item.rank for item in items if before.get(item.id) != item.rank
+        }
+        if not after:
+            return None
+        return cls(
+            item_id,
+            column_id,
+            {item_id: before.get(item_id) for item_id in after},
+            after,
+        )
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._rank(board, storage, self.before)
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._rank(board, storage, self.after)
+
+    def _rank(
+        self,
+        board: Board,
+        storage: MarkdownStorage,
+        ranks: dict[str, Optional[float]],
+    ) -> bool:
+        column = board.get_column_by_id(self.column_id)
+        if not column:
+            return False
+
+        changed = []
+        for item_id, rank in ranks.items():
+            item = board.get_item_by_id(item_id)
+            if item and item.column_id == column.id:
+                item.rank = rank
+                changed.append(item)
+        if not changed:
+            return False
+
+        column.normalize_ranks()
+        storage.save_item_order(board, column, changed)
+        return True
+
+    def size(self) -> int:
+        return CHANGE_OVERHEAD_BYTES + 100 * len(self.after)
+
+
+@dataclass(eq=False)
+class ItemDeleteChange(Change):
+    """A deleted item, kept whole so undo can write it back."""
+
+    item: Item
+    item_id: str = field(init=False)
+
+    label = "delete"
+
+    def __post_init__(self) -> None:
+        self.item_id = self.item.id
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._restore(board, storage)
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._remove(board, storage)
+
+    def _restore(self, board: Board, storage: MarkdownStorage) -> bool:
+        item = self.item.model_copy()
+        column = board.get_column_by_id(item.column_id)
+        if column:
+            storage.load_column_items(board, column)
+        if not board.insert_item(item):
+            return False
+        return storage.add_item_to_column(board, item)
+
+    def _remove(self, board: Board, storage: MarkdownStorage) -> bool:
+        item = board.get_item_by_id(self.item_id)
+        if not item:
+            return False
+
+        self.item = item.model_copy()
+        storage.delete_item_from_column(board, item)
+        return board.remove_item(item.id)
+
+    def size(self) -> int:
+        return CHANGE_OVERHEAD_BYTES + len(self.item.title) + len(self.item.description)
+
+
+class ItemAddChange(ItemDeleteChange):
+    """A created item; undo deletes it again, keeping its content for redo."""
+
+    label = "add"
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._remove(board, storage)
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> bool:
+        return self._restore(board, storage)
+
+
+class UndoHistory:
+    """Undo and redo stacks of one board, bounded by count and retained size.
+
+    The oldest changes are forgotten first, so a long session keeps a
+    constant amount of history however many edits it makes.
+    """
+
+    def __init__(self, max_changes: int = 1000, max_bytes: int = 4 * 1024 * 1024):
+        self.max_changes = max_changes
+        self.max_bytes = max_bytes
+        self._undo: deque[Change] = deque()
+        self._redo: list[Change] = []
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._undo) + len(self._redo)
+
+    @property
+    def size(self) -> int:
+        return self._bytes
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, change: Change) -> None:
+        for undone in self._redo:
+            self._bytes -= undone.size()
+        self._redo.clear()
+
+        self._undo.append(change)
+        self._bytes += change.size()
+        while self._undo and (
+            len(self._undo) > self.max_changes or self._bytes > self.max_bytes
+        ):
+            self._bytes -= self._undo.popleft().size()
+
+    def discard(self, change: Change) -> None:
+        """Forget a change whose action failed and was rolled back."""
+        if change in self._undo:
+            self._undo.remove(change)
+            self._bytes -= change.size()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+
+    def undo(self, board: Board, storage: MarkdownStorage) -> Optional[Change]:
+        """Undo the latest change; None when there is none that still applies."""
+        while self._undo:
+            change = self._undo.pop()
+            if self._apply(change, change.undo, board, storage, self._undo):
+                self._redo.append(change)
+                return change
+        return None
+
+    def redo(self, board: Board, storage: MarkdownStorage) -> Optional[Change]:
+        while self._redo:
+            change = self._redo.pop()
+            if self._apply(change, change.redo, board, storage, self._redo):
+                self._undo.append(change)
+                return change
+        return None
+
+    def _apply(
+        self,
+        change: Change,
+        action: Callable[[Board, MarkdownStorage], bool],
+        board: Board,
+        storage: MarkdownStorage,
+        stack: deque[Change] | list[Change],
+    ) -> bool:
+        size = change.size()
+        try:
+            applied = action(board, storage)
+        except Exception:
+            # Keep it so the user can try again, e.g. once the disk has space
+            stack.append(change)
+            raise
+
+        if applied:
+            self._bytes += change.size() - size
+        else:
+            # The item is gone, so this change can never apply again
+            self._bytes -= size
+        return applied
@@ -1,7 +1,10 @@
+from pathlib import Path
+
 from ..models.board import Board
 from ..models.parent import Parent
 from ..models.item import Item
 from ..storage.markdown_storage import MarkdownStorage
+from ..utils.profiling import traced
 
 
 class ItemController:
@@ -10,26 +13,60 @@ class ItemController:
         self.item = item
         self.storage = storage
 
+    @traced("item_controller.save")
     def save(self) -> None:
         self.storage.save_board(self.board)
 
+    @traced("item_controller.update_item")
     def update_item(self, item_id: str, **kwargs) -> bool:
-        for column in self.board.columns:
-            for item in column.items:
-                if item.id == item_id:
-                    item.update(**kwargs)
-                    self.storage.save_board(self.board)
-                    return True
-        return False
+        item = self.board.get_item_by_id(item_id)
+        if not item:
+            return False
+
+        old_parent_id, old_column_id = item.parent_id, item.column_id
+        item.update(**kwargs)
+        if (item.parent_id, item.column_id) != (old_parent_id, old_column_id):
+            self.board.regroup_item(item, old_parent_id, old_column_id)
+        self.storage.save_board(self.board)
+        return True
+
+    @traced("item_controller.reload_from_file")
+    def reload_from_file(self, item_file: Path) -> bool:
+        """Re-read the item from its file after it was edited outside the app.
+
+        Returns False when the file no longer holds this item. The column.md
+        link is rewritten when the title, parent or rank changed.
+        """
+        item = self.item
+        loaded = self.storage.load_item_from_title_file(item_file, item.column_id)
+        if not loaded or loaded.id != item.id:
+            return False
 
+        old = (item.title, item.parent_id, item.rank)
+        item.title = loaded.title
+        item.description = loaded.description
+        item.parent_id = loaded.parent_id
+        item.rank = loaded.rank
+        item.updated_at = loaded.updated_at
+
+        if item.parent_id != old[1]:
+            self.board.regroup_item(item, old[1], item.column_id)
+        reorder = item.rank != old[2]
+        if reorder:
+            column = self.board.get_column_by_id(item.column_id)
+            if column:
+                column.normalize_ranks()
+        if (item.title, item.parent_id, item.rank) != old:
+            self.storage.update_item_link(self.board, item, item_file, reorder)
+        return True
+
+    @traced("item_controller.set_item_parent")
     def set_item_parent(self, item_id: str, parent_id: str | None) -> bool:
-        for column in self.board.columns:
-            for item in column.items:
-                if item.id == item_id:
-                    item.set_parent(parent_id)
-                    self.storage.save_board(self.board)
-                    return True
-        return False
+        if not self.board.set_item_parent(item_id, parent_id):
+            return False
+
+        self.storage.save_board(self.board)
+        return True
 
     def add_parent(self, name: str, color: str = "blue") -> Parent:
         return self.board.add_parent(name, color)
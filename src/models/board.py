@@ -1,7 +1,8 @@
 from datetime import datetime
 from uuid import uuid4
 from pathlib import Path
-from pydantic import BaseModel, Field
+from typing import Any
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .column import Column
 from .item import Item
@@ -18,6 +19,41 @@ class Board(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    _columns_by_id: dict[str, Column] = PrivateAttr(default_factory=dict)
+    _items_by_id: dict[str, Item] = PrivateAttr(default_factory=dict)
+    _parents_by_id: dict[str, Parent] = PrivateAttr(default_factory=dict)
+    _parents_by_name: dict[str, Parent] = PrivateAttr(default_factory=dict)
+    # parent id (None for items without one) -> column id -> item id -> item
+    _groups: dict[str | None, dict[str, dict[str, Item]]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the id/name indexes after bulk changes to columns or parents."""
+        # Locals avoid pydantic's private attribute lookup once per item
+        columns_by_id: dict[str, Column] = {}
+        items_by_id: dict[str, Item] = {}
+        groups: dict[str | None, dict[str, dict[str, Item]]] = {}
+        for column in self.columns:
+            columns_by_id.setdefault(column.id, column)
+            for item in column.items:
+                if item.id not in items_by_id:
+                    items_by_id[item.id] = item
+                    cells = groups.setdefault(item.parent_id, {})
+                    cells.setdefault(item.column_id, {})[item.id] = item
+        self._columns_by_id = columns_by_id
+        self._items_by_id = items_by_id
+        self._groups = groups
+
+        self._parents_by_id = {}
+        self._parents_by_name = {}
+        for parent in self.parents:
+            self._parents_by_id.setdefault(parent.id, parent)
+            self._parents_by_name.setdefault(parent.name, parent)
+
     def update(self, **kwargs) -> None:
         for key, value in kwargs.items():
             if hasattr(self, key):
@@ -31,19 +67,114 @@ class Board(BaseModel):
         column = Column(name=name, position=position)
         self.columns.append(column)
         self.columns.sort(key=lambda c: c.position)
+        self._columns_by_id[column.id] = column
         self.updated_at = datetime.now()
         return column
 
     def remove_column(self, column_id: str) -> bool:
         self.columns = [col for col in self.columns if col.id != column_id]
+        self.reindex()
         self.updated_at = datetime.now()
         return True
 
     def get_column_by_id(self, column_id: str) -> Column | None:
-        for column in self.columns:
-            if column.id == column_id:
-                return column
-        return None
+        return self._columns_by_id.get(column_id)
+
+    def get_item_by_id(self, item_id: str) -> Item | None:
+        return self._items_by_id.get(item_id)
+
+    def get_parent_by_id(self, parent_id: str) -> Parent | None:
+        return self._parents_by_id.get(parent_id)
+
+    def get_parent_by_name(self, name: str) -> Parent | None:
+        return self._parents_by_name.get(name)
+
+    def add_item(
+        self, column_id: str, title: str, parent_id: str | None = None
+    ) -> Item | None:
+        column = self.get_column_by_id(column_id)
+        if not column:
+            return None
+
+        item = column.add_item(title, column_id, parent_id)
+        self._items_by_id[item.id] = item
+        self._group_add(item)
+        self.updated_at = datetime.now()
+        return item
+
+    def insert_item(self, item: Item) -> bool:
+        """Put an existing item, e.g. a restored one, in its column by rank."""
+        column = self.get_column_by_id(item.column_id)
+        if not column or item.id in self._items_by_id:
+            return False
+
+        column.items.append(item)
+        column.normalize_ranks()
+        self._items_by_id[item.id] = item
+        self._group_add(item)
+        self.updated_at = datetime.now()
+        return True
+
+    def remove_item(self, item_id: str) -> bool:
+        item = self._items_by_id.pop(item_id, None)
+        if not item:
+            return False
+
+        self._group_discard(item)
+
+        column = self.get_column_by_id(item.column_id)
+        if column:
+            column.remove_item(item_id)
+        self.updated_at = datetime.now()
+        return True
+
+    def move_to_column(self, item_id: str, column_id: str) -> bool:
+        item = self.get_item_by_id(item_id)
+        target_column = self.get_column_by_id(column_id)
+        if not item or not target_column or item.column_id == column_id:
+            return False
+
+        old_column = self.get_column_by_id(item.column_id)
+        if old_column:
+            old_column.remove_item(item_id)
+
+        self._group_discard(item)
+        target_column.move_item_to_end_of_column(item)
+        self._group_add(item)
+        self.updated_at = datetime.now()
+        return True
+
+    def set_item_parent(self, item_id: str, parent_id: str | None) -> bool:
+        item = self.get_item_by_id(item_id)
+        if not item:
+            return False
+
+        self._group_discard(item)
+        item.set_parent(parent_id)
+        self._group_add(item)
+        self.updated_at = datetime.now()
+        return True
+
+    def regroup_item(
+        self, item: Item, old_parent_id: str | None, old_column_id: str
+    ) -> None:
+        """Refile an item whose parent or column was changed on the item itself."""
+        self._group_discard(item, old_parent_id, old_column_id)
+        self._group_add(item)
+
+    def reindex_item(
+        self,
+        item: Item,
+        old_id: str,
+        old_parent_id: str | None,
+        old_column_id: str,
+    ) -> None:
+        """Re-index an item whose id, parent or column was changed on the item."""
+        if self._items_by_id.get(old_id) is item:
+            del self._items_by_id[old_id]
+        self._group_discard(item, old_parent_id, old_column_id, old_id)
+        self._items_by_id.setdefault(item.id, item)
+        self._group_add(item)
 
     def get_orphaned_items(self) -> list[Item]:
         items: list[Item] = []
@@ -54,13 +185,67 @@ class Board(BaseModel):
     def add_parent(self, name: str, color: str = "blue") -> Parent:
         parent = Parent(name=name, color=color)
         self.parents.append(parent)
+        self._parents_by_id[parent.id] = parent
+        self._parents_by_name.setdefault(parent.name, parent)
         self.updated_at = datetime.now()
         return parent
 
     def remove_parent(self, parent_id: str) -> bool:
-        original_count = len(self.parents)
-        self.parents = [parent for parent in self.parents if parent.id != parent_id]
-        if len(self.parents) < original_count:
-            self.updated_at = datetime.now()
-            return True
-        return False
+        parent = self._parents_by_id.pop(parent_id, None)
+        if not parent:
+            return False
+
+        self.parents = [p for p in self.parents if p.id != parent_id]
+        if self._parents_by_name.get(parent.name) is parent:
+            del self._parents_by_name[parent.name]
+            for other in self.parents:
+                if other.name == parent.name:
+                    self._parents_by_name[other.name] = other
+                    break
+        self.updated_at = datetime.now()
+        return True
+
+    def get_group_parent_ids(self) -> list[str | None]:
+        """Parent ids that have items: None for items without a parent first,
+        then the board's parents in order, then ids of unknown parents."""
+        known = [parent.id for parent in self.parents if parent.id in self._groups]
+        known_ids = set(known)
+        unknown = [
+            parent_id
+            for parent_id in self._groups
+            if parent_id is not None and parent_id not in known_ids
+        ]
+        orphans = [None] if None in self._groups else []
+        return orphans + known + unknown
+
+    def get_group_items(self, parent_id: str | None, column_id: str) -> list[Item]:
+        cell = self._groups.get(parent_id, {}).get(column_id, {})
+        return sorted(
+            cell.values(), key=lambda item: item.rank if item.rank is not None else 0
+        )
+
+    def count_group_items(self, parent_id: str | None) -> int:
+        return sum(len(cell) for cell in self._groups.get(parent_id, {}).values())
+
+    def _group_add(self, item: Item) -> None:
+        cells = self._groups.setdefault(item.parent_id, {})
+        cells.setdefault(item.column_id, {})[item.id] = item
+
+    def _group_discard(
+        self,
+        item: Item,
+        parent_id: str | None = None,
+        column_id: str | None = None,
+        item_id: str | None = None,
+    ) -> None:
+        if column_id is None:
+            parent_id, column_id = item.parent_id, item.column_id
+
+        cells = self._groups.get(parent_id, {})
+        cell = cells.get(column_id, {})
+        if cell.pop(item_id or item.id, None) is None:
+            return
+        if not cell:
+            del cells[column_id]
+        if not cells:
+            del self._groups[parent_id]
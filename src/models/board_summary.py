@@ -0,0 +1,14 @@
+from datetime import datetime
+from pathlib import Path
+from pydantic import BaseModel
+
+
+class BoardSummary(BaseModel):
+    """Catalog entry for a board, read from its kanban.md alone."""
+
+    id: str
+    name: str
+    description: str = ""
+    kanban_file: Path
+    column_count: int = 0
+    updated_at: datetime | None = None
@@ -2,7 +2,9 @@ from datetime import datetime
 from uuid import uuid4
 
 from .item import Item
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+RANK_STEP = 1024.0
 
 
 class Column(BaseModel):
@@ -13,6 +15,28 @@ class Column(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     items: list[Item] = Field(default_factory=list)
+    collapsed: bool = False
+
+    # Number of items of a column loaded without them, None once loaded
+    _unloaded_count: int | None = PrivateAttr(default=None)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._unloaded_count is None
+
+    @property
+    def item_count(self) -> int:
+        if self._unloaded_count is not None:
+            return self._unloaded_count
+        return len(self.items)
+
+    def mark_unloaded(self, item_count: int) -> None:
+        """Leave the items on disk; only their count is known."""
+        self.items = []
+        self._unloaded_count = item_count
+
+    def mark_loaded(self) -> None:
+        self._unloaded_count = None
 
     def update(self, **kwargs) -> None:
         for key, value in kwargs.items():
@@ -23,13 +47,19 @@ class Column(BaseModel):
     def add_item(
         self, title: str, column_id: str, parent_id: str | None = None
     ) -> Item:
-        item = Item(title=title, column_id=column_id, parent_id=parent_id)
+        item = Item(
+            title=title,
+            column_id=column_id,
+            parent_id=parent_id,
+            rank=self.next_rank(),
+        )
         self.items.append(item)
         self.updated_at = datetime.now()
         return item
 
     def move_item_to_end_of_column(self, item: Item) -> bool:
         item.move_to_column(self.id)
+        item.rank = self.next_rank()
 
         self.items.append(item)
 
@@ -47,3 +77,70 @@ class Column(BaseModel):
 
     def get_column_items(self, column_id: str) -> list[Item]:
         return [item for item in self.items if item.column_id == column_id]
+
+    def next_rank(self) -> float:
+        if self.items and self.items[-1].rank is not None:
+            return self.items[-1].rank + RANK_STEP
+        return (len(self.items) + 1) * RANK_STEP
+
+    def normalize_ranks(self) -> None:
+        """Give unranked items a rank after their predecessor, then sort by rank."""
+        last_rank = 0.0
+        for item in self.items:
+            if item.rank is None:
+                item.rank = last_rank + RANK_STEP
+            last_rank = item.rank
+        self.items.sort(key=lambda item: item.rank)
+
+    def rebalance_ranks(self) -> None:
+        for index, item in enumerate(self.items):
+            item.rank = (index + 1) * RANK_STEP
+
+    def move_item_to_position(self, item_id: str, position: int) -> list[Item]:
+        """Move an item within the column and return the items whose rank changed.
+
+        Normally only the moved item gets a new rank, placed between its new
+        neighbours. When the gap between them is exhausted the whole column is
+        rebalanced and every item is returned.
+        """
+        current = next(
+            (index for index, item in enumerate(self.items) if item.id == item_id),
+            None,
+        )
+        if current is None:
+            return []
+
+        position = max(0, min(position, len(self.items) - 1))
+        if position == current:
+            return []
+
+        item = self.items.pop(current)
+        self.items.insert(position, item)
+
+        if any(other.rank is None for other in self.items):
+            self.rebalance_ranks()
+            self.updated_at = datetime.now()
+            return list(self.items)
+
+        previous_item = self.items[position - 1] if position > 0 else None
+        next_item = self.items[position + 1] if position + 1 < len(self.items) else None
+
+        if previous_item and next_item:
+            rank = (previous_item.rank + next_item.rank) / 2
+        elif previous_item:
+            rank = previous_item.rank + RANK_STEP
+        elif next_item:
+            rank = next_item.rank - RANK_STEP
+        else:
+            rank = RANK_STEP
+
+        if (previous_item and rank <= previous_item.rank) or (
+            next_item and rank >= next_item.rank
+        ):
+            self.rebalance_ranks()
+            self.updated_at = datetime.now()
+            return list(self.items)
+
+        item.rank = rank
+        self.updated_at = datetime.now()
+        return [item]
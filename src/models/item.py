@@ -9,6 +9,7 @@ class Item(BaseModel):
     description: str = ""
     parent_id: str | None = None
     column_id: str
+    rank: float | None = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from ..models.board import Board
+
+# Rough in-memory cost of an Item model besides its title and description,
+# measured with tracemalloc on generated boards
+ITEM_OVERHEAD_BYTES = 1500
+BOARD_OVERHEAD_BYTES = 4096
+
+
+def estimate_board_size(board: Board) -> int:
+    size = BOARD_OVERHEAD_BYTES
+    for column in board.columns:
+        for item in column.items:
+            size += ITEM_OVERHEAD_BYTES + len(item.title) + len(item.description)
+    return size
+
+
+class BoardCache:
+    """Least recently used cache of loaded boards, bounded by count and size.
+
+    Boards are keyed by the path of their kanban.md. The cache may be filled
+    from a prefetch thread while the UI thread reads it.
+    """
+
+    def __init__(self, max_boards: int = 8, max_bytes: int = 64 * 1024 * 1024):
+        self.max_boards = max_boards
+        self.max_bytes = max_bytes
+        self._boards: OrderedDict[str, tuple[Board, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._boards
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._boards)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._boards.values())
+
+    def keys(self) -> list[str]:
+        """Cached keys, most recently used first."""
+        with self._lock:
+            return list(reversed(self._boards))
+
+    def boards(self) -> list[Board]:
+        """Cached boards, most recently used first, without using them."""
+        with self._lock:
+            return [board for board, _ in reversed(self._boards.values())]
+
+    def get(self, key: str) -> Optional[Board]:
+        with self._lock:
+            entry = self._boards.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._boards.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, board: Board) -> None:
+        size = estimate_board_size(board)
+        with self._lock:
+            self._boards[key] = (board, size)
+            self._boards.move_to_end(key)
+            self._evict()
+
+    def setdefault(self, key: str, board: Board) -> Board:
+        """Cache ``board`` unless the key is already cached, and return the
+        cached board. A board opened in the UI and the same board loaded by
+        the prefetcher therefore never end up as two diverging copies."""
+        size = estimate_board_size(board)
+        with self._lock:
+            entry = self._boards.get(key)
+            if entry is None:
+                entry = self._boards[key] = (board, size)
+            self._boards.move_to_end(key)
+            self._evict()
+            return entry[0]
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._boards.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
+
+    def _evict(self) -> None:
+        # The most recently added board is kept even when it alone is too big
+        total = sum(size for _, size in self._boards.values())
+        while len(self._boards) > 1 and (
+            len(self._boards) > self.max_boards or total > self.max_bytes
+        ):
+            _, (_, size) = self._boards.popitem(last=False)
+            total -= size
@@ -0,0 +1,148 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from ..models.board import Board
+from ..models.item import Item
+
+if TYPE_CHECKING:
+    from .markdown_storage import MarkdownStorage
+
+# Placeholder items paired with the item they were loaded as, None if missing
+LoadedBatch = list[tuple["PendingItem", Optional[Item]]]
+
+
+@dataclass
+class PendingItem:
+    """A placeholder item built from a column.md link, not loaded yet."""
+
+    item: Item
+    items_dir: Path
+    filename: str
+    parent_name: Optional[str] = None
+    rank: Optional[float] = field(default=None, compare=False)
+    done: bool = field(default=False, compare=False)
+
+    @property
+    def item_file(self) -> Path:
+        return self.items_dir / f"{self.filename}.md"
+
+
+class BoardHydrator:
+    """Replaces the placeholder items of a skeleton board with their files.
+
+    ``batches()`` only reads files and may run on a worker thread, while
+    ``apply()`` changes the board and must run where the board is used.
+    Placeholders are filled in place, so the card widgets showing them keep
+    their item objects; only the ids change, which ``apply()`` reports.
+    """
+
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        storage: "MarkdownStorage",
+        board: Board,
+        pending: list[PendingItem],
+        key: Optional[str] = None,
+    ):
+        self.storage = storage
+        self.board = board
+        self.key = key
+        self._columns: dict[str, list[PendingItem]] = {}
+        for pending_item in pending:
+            self._columns.setdefault(pending_item.item.column_id, []).append(
+                pending_item
+            )
+        self._order = list(self._columns)
+        self._titles_cache: dict[Path, dict[str, Item]] = {}
+
+    @property
+    def remaining(self) -> int:
+        return sum(
+            1
+            for column in self._columns.values()
+            for pending_item in column
+            if not pending_item.done
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        return all(
+            pending_item.done
+            for column in self._columns.values()
+            for pending_item in column
+        )
+
+    def add(self, pending: list[PendingItem]) -> None:
+        """Hydrate ``pending`` too, e.g. the items of a column just expanded."""
+        for pending_item in pending:
+            column_id = pending_item.item.column_id
+            if column_id not in self._columns:
+                self._columns[column_id] = []
+                self._order.append(column_id)
+            self._columns[column_id].append(pending_item)
+
+    def prioritize(self, column_ids: list[str]) -> None:
+        """Hydrate ``column_ids`` (e.g. the columns on screen) first."""
+        first = [column_id for column_id in column_ids if column_id in self._columns]
+        self._order = first + [
+            column_id for column_id in self._columns if column_id not in first
+        ]
+
+    def batches(self) -> Iterator[tuple[str, LoadedBatch]]:
+        for column_id in list(self._order):
+            pending = [item for item in self._columns[column_id] if not item.done]
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                batch = pending[start : start + self.BATCH_SIZE]
+                yield column_id, [(item, self._load(item)) for item in batch]
+
+    def _load(self, pending_item: PendingItem) -> Optional[Item]:
+        return self.storage.load_linked_item(
+            pending_item.item_file,
+            pending_item.item.title,
+            pending_item.item.column_id,
+            self._titles_cache,
+        )
+
+    def apply(self, column_id: str, loaded: LoadedBatch) -> dict[str, str]:
+        """Fill placeholders with their loaded items; returns old id -> new id.
+
+        Placeholders whose file is missing, or that load as an item already
+        on the board, are dropped like a full load would skip them.
+        """
+        renamed: dict[str, str] = {}
+
+        for pending_item, item in loaded:
+            if pending_item.done:
+                continue
+            pending_item.done = True
+
+            placeholder = pending_item.item
+            old_id, old_parent_id = placeholder.id, placeholder.parent_id
+            existing = self.board.get_item_by_id(item.id) if item else None
+            if item is None or existing:
+                self.board.remove_item(old_id)
+                continue
+
+            # Ranks are applied once the whole column is loaded, so cards keep
+            # the column.md order in the meantime
+            pending_item.rank = item.rank
+            for name in Item.model_fields:
+                if name != "rank":
+                    setattr(placeholder, name, getattr(item, name))
+            if pending_item.parent_name:
+                parent = self.board.get_parent_by_name(pending_item.parent_name)
+                if parent:
+                    placeholder.parent_id = parent.id
+
+            self.board.reindex_item(placeholder, old_id, old_parent_id, column_id)
+            renamed[old_id] = placeholder.id
+
+        column = self.board.get_column_by_id(column_id)
+        if column and all(item.done for item in self._columns[column_id]):
+            for pending_item in self._columns[column_id]:
+                pending_item.item.rank = pending_item.rank
+            column.normalize_ranks()
+
+        return renamed
@@ -0,0 +1,93 @@
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+LOCK_FILENAME = ".lock"
+
+
+class BoardLockTimeout(TimeoutError):
+    pass
+
+
+class BoardLock:
+    """Advisory lock on a board directory, shared by every mkanban process.
+
+    The lock is an ``flock`` on ``<board>/.lock``. It is reentrant within a
+    process, so a storage write may call other storage writes while holding
+    it, and threads of one process take turns through a plain ``RLock``.
+    Writers hold it for one storage call at a time, never while a user edits.
+    """
+
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, board_dir: Path, timeout: float = 10.0):
+        self.path = board_dir / LOCK_FILENAME
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self) -> "BoardLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise BoardLockTimeout(f"Timed out waiting for {self.path}")
+        if self._depth == 0:
+            try:
+                self._file = self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._file is not None:
+            if fcntl is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    def _lock_file(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, "a")
+        if fcntl is None:
+            return lock_file
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return lock_file
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    raise BoardLockTimeout(
+                        f"Another mkanban process holds {self.path}"
+                    ) from None
+                time.sleep(self.POLL_INTERVAL)
+
+
+_locks: dict[Path, BoardLock] = {}
+_locks_guard = threading.Lock()
+
+
+def board_lock(board_dir: Path) -> BoardLock:
+    """The lock of ``board_dir``, the same object for every caller in a process."""
+    key = board_dir.resolve()
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = BoardLock(key)
+        return lock
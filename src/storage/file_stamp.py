@@ -0,0 +1,38 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class FileStamp:
+    """Modification time, size and content hash of a file.
+
+    Comparing against a stamp only hashes the file again when its mtime or
+    size moved, so an untouched file costs a single stat.
+    """
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+    @classmethod
+    def of(cls, path: Path) -> Optional["FileStamp"]:
+        try:
+            stat = path.stat()
+            data = path.read_bytes()
+        except OSError:
+            return None
+        return cls(stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).hexdigest())
+
+    def matches(self, path: Path) -> bool:
+        """Whether ``path`` still has the content this stamp was taken of."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size):
+            return True
+
+        current = FileStamp.of(path)
+        return current is not None and current.digest == self.digest
@@ -0,0 +1,616 @@
+"""Find, and optionally repair, what loading a board silently skips.
+
+Checks, per board:
+
+- broken_link: a column.md link to a missing item file
+- title_mismatch: a link whose title differs from the item file's title
+- duplicate_link: two links of a column to the same file
+- orphan_file: an item file no link references
+- duplicate_id: item files sharing an id, e.g. left behind by a rename
+- column_id_mismatch: an item file whose column_id is not its column's
+- unknown_parent: a parent_id or link parent the board does not define
+- invalid_file: a kanban.md, column.md or item file that cannot be parsed
+- missing_column: a kanban.md link to a column without column.md
+- empty_column_dir / unlinked_column: a column dir kanban.md does not link,
+  without or with item files
+
+Reading and parsing the files is the expensive part, so columns are
+scanned in worker processes when there are enough files to pay for them.
+"""
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import frontmatter
+import yaml
+from frontmatter.default_handlers import YAMLHandler
+
+from .board_lock import board_lock
+from .item_version import file_version
+from .markdown_storage import (
+    COLUMN_LINK_PATTERN,
+    ITEM_LINK_PATTERN,
+    format_item_link,
+)
+
+# Below this many item files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 2000
+
+
+class _FastYAMLHandler(YAMLHandler):
+    def load(self, fm: str, **kwargs: object) -> Any:
+        kwargs.setdefault("Loader", getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        return super().load(fm, **kwargs)
+
+
+_YAML_HANDLER = _FastYAMLHandler()
+
+
+def _parse(path: Path) -> frontmatter.Post:
+    with open(path, "r", encoding="utf-8") as f:
+        return frontmatter.loads(f.read(), handler=_YAML_HANDLER)
+
+
+def _metadata(post: frontmatter.Post) -> dict[str, Any]:
+    return post.metadata.get("metadata", post.metadata)
+
+
+@dataclass
+class Issue:
+    kind: str
+    board: str
+    path: Path
+    message: str
+    fixable: bool = True
+    fixed: bool = False
+
+    def to_json(self, data_dir: Path) -> dict[str, Any]:
+        try:
+            path = self.path.relative_to(data_dir)
+        except ValueError:
+            path = self.path
+        return {
+            "kind": self.kind,
+            "board": self.board,
+            "path": path.as_posix(),
+            "message": self.message,
+            "fixable": self.fixable,
+            "fixed": self.fixed,
+        }
+
+
+@dataclass
+class ItemRecord:
+    path: Path
+    filename: str
+    id: Optional[str] = None
+    title: Optional[str] = None
+    column_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    updated_at: Optional[datetime | str] = None
+    error: Optional[str] = None
+    duplicate: bool = False
+
+
+@dataclass
+class ColumnScan:
+    """Everything fsck needs from one column dir, read in a worker."""
+
+    column_dir: Path
+    column_id: Optional[str] = None
+    # (title, filename, parent name) of each link, in file order
+    links: list[tuple[str, str, Optional[str]]] = field(default_factory=list)
+    files: list[ItemRecord] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def column_file(self) -> Path:
+        return self.column_dir / "column.md"
+
+    @property
+    def items_dir(self) -> Path:
+        return self.column_dir / "items"
+
+
+def scan_column(column_dir: Path, filenames: list[str]) -> ColumnScan:
+    scan = ColumnScan(column_dir)
+    if scan.column_file.exists():
+        try:
+            post = _parse(scan.column_file)
+            scan.column_id = _metadata(post).get("id")
+            for line in post.content.split("\n"):
+                line = line.strip()
+                match = ITEM_LINK_PATTERN.match(line)
+                if match:
+                    title, filename, parent_name = match.groups()
+                    scan.links.append((title.strip(), filename, parent_name))
+        except Exception as e:
+            scan.error = _error_text(e)
+
+    items_dir = scan.items_dir
+    for filename in filenames:
+        record = ItemRecord(items_dir / f"{filename}.md", filename)
+        try:
+            with open(record.path, "r", encoding="utf-8") as f:
+                metadata = _item_metadata(f.read())
+            record.id = _text(metadata.get("id"))
+            record.title = _text(metadata.get("title"))
+            record.column_id = _text(metadata.get("column_id"))
+            record.parent_id = _text(metadata.get("parent_id"))
+            record.updated_at = metadata.get("updated_at")
+            if not record.id or not record.title:
+                record.error = "missing id or title"
+        except Exception as e:
+            record.error = _error_text(e)
+        scan.files.append(record)
+    return scan
+
+
+def _item_metadata(text: str) -> dict[str, Any]:
+    """The front matter of an item file, as ``frontmatter.loads`` reads it for
+    storage, but without a Post or a stripped copy of the content."""
+    try:
+        front_matter, _ = _YAML_HANDLER.split(text.strip())
+    except ValueError:
+        return {}
+    metadata = _YAML_HANDLER.load(front_matter)
+    if not isinstance(metadata, dict):
+        return {}
+    return metadata.get("metadata", metadata)
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _scan_column_job(job: tuple[Path, list[str]]) -> ColumnScan:
+    return scan_column(*job)
+
+
+def _item_filenames(column_dir: Path) -> list[str]:
+    try:
+        with os.scandir(column_dir / "items") as entries:
+            return sorted(
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            )
+    except OSError:
+        return []
+
+
+@dataclass
+class BoardPlan:
+    """A board's kanban.md, and the column dirs to scan for it."""
+
+    board_dir: Path
+    name: str
+    parents: dict[str, str] = field(default_factory=dict)  # id -> name
+    # folder -> column name, for columns kanban.md links
+    linked: dict[str, str] = field(default_factory=dict)
+    unlinked: list[str] = field(default_factory=list)
+    issues: list[Issue] = field(default_factory=list)
+
+
+@dataclass
+class FsckReport:
+    data_dir: Path
+    boards: int = 0
+    columns: int = 0
+    item_files: int = 0
+    issues: list[Issue] = field(default_factory=list)
+
+    @property
+    def unfixed(self) -> list[Issue]:
+        return [issue for issue in self.issues if not issue.fixed]
+
+    def to_json(self) -> dict[str, Any]:
+        counts: dict[str, int] = {}
+        for issue in self.issues:
+            counts[issue.kind] = counts.get(issue.kind, 0) + 1
+        return {
+            "data_dir": str(self.data_dir),
+            "boards": self.boards,
+            "columns": self.columns,
+            "item_files": self.item_files,
+            "counts": counts,
+            "fixed": len(self.issues) - len(self.unfixed),
+            "issues": [issue.to_json(self.data_dir) for issue in self.issues],
+        }
+
+
+def fsck(
+    data_dir: Path,
+    board_names: Optional[list[str]] = None,
+    fix: bool = False,
+    jobs: Optional[int] = None,
+) -> FsckReport:
+    """Check the boards of ``data_dir`` (or only ``board_names``)."""
+    boards_dir = data_dir / "boards"
+    report = FsckReport(data_dir)
+    wanted = {name.lower() for name in board_names or []}
+
+    plans = []
+    for board_dir in sorted(boards_dir.iterdir()) if boards_dir.exists() else []:
+        if not board_dir.is_dir() or board_dir.name.startswith("."):
+            continue
+        plan = _plan_board(board_dir, report)
+        if plan and (not wanted or plan.name.lower() in wanted):
+            plans.append(plan)
+            report.issues.extend(plan.issues)
+    report.boards = len(plans)
+
+    scan_jobs = [
+        (plan.board_dir / folder, _item_filenames(plan.board_dir / folder))
+        for plan in plans
+        for folder in [*plan.linked, *plan.unlinked]
+    ]
+    report.columns = len(scan_jobs)
+    report.item_files = sum(len(filenames) for _, filenames in scan_jobs)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(scan_jobs) > 1 and report.item_files >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            scans = list(pool.map(_scan_column_job, scan_jobs))
+    else:
+        scans = [_scan_column_job(job) for job in scan_jobs]
+
+    by_dir = {scan.column_dir: scan for scan in scans}
+    for plan in plans:
+        checker = _BoardCheck(plan, by_dir, report)
+        checker.check()
+        if fix and checker.has_fixes:
+            with board_lock(plan.board_dir):
+                checker.apply()
+
+    return report
+
+
+def _plan_board(board_dir: Path, report: FsckReport) -> Optional[BoardPlan]:
+    kanban_file = board_dir / "kanban.md"
+    if not kanban_file.exists():
+        return None
+
+    try:
+        post = _parse(kanban_file)
+        metadata = _metadata(post)
+        plan = BoardPlan(board_dir, metadata["name"])
+    except Exception as e:
+        report.issues.append(
+            Issue(
+                "invalid_file",
+                board_dir.name,
+                kanban_file,
+                _error_text(e),
+                fixable=False,
+            )
+        )
+        return None
+
+    for parent in metadata.get("parents") or []:
+        if isinstance(parent, dict) and "id" in parent:
+            plan.parents[parent["id"]] = parent.get("name", "")
+
+    for line in post.content.split("\n"):
+        match = COLUMN_LINK_PATTERN.match(line.strip())
+        if match:
+            folder = match.group(2).strip()
+            if (board_dir / folder / "column.md").exists():
+                plan.linked[folder] = match.group(1).strip()
+            else:
+                plan.issues.append(
+                    Issue(
+                        "missing_column",
+                        plan.name,
+                        board_dir / folder,
+                        f"Column '{match.group(1).strip()}' has no column.md",
+                        fixable=False,
+                    )
+                )
+
+    for entry in sorted(board_dir.iterdir()):
+        if (
+            entry.is_dir()
+            and not entry.name.startswith(".")
+            and entry.name not in plan.linked
+        ):
+            plan.unlinked.append(entry.name)
+    return plan
+
+
+class _BoardCheck:
+    """Issues of one board, and the file edits that repair them."""
+
+    def __init__(
+        self, plan: BoardPlan, scans: dict[Path, ColumnScan], report: FsckReport
+    ):
+        self.plan = plan
+        self.scans = scans
+        self.report = report
+        self.parent_names = set(plan.parents.values())
+        # column dir -> index of a link -> replacement line, or None to remove it
+        self.link_edits: dict[Path, dict[int, Optional[str]]] = {}
+        self.link_appends: dict[Path, list[str]] = {}
+        # item file -> metadata changes
+        self.item_edits: dict[Path, dict[str, Any]] = {}
+        self.deletions: list[Path] = []
+        self.removed_dirs: list[Path] = []
+        self._fixes: list[Issue] = []
+
+    @property
+    def has_fixes(self) -> bool:
+        return bool(self._fixes)
+
+    def _issue(
+        self, kind: str, path: Path, message: str, fixable: bool = True
+    ) -> Issue:
+        issue = Issue(kind, self.plan.name, path, message, fixable)
+        self.report.issues.append(issue)
+        if fixable:
+            self._fixes.append(issue)
+        return issue
+
+    def check(self) -> None:
+        linked_files: dict[Path, set[str]] = {}
+        for folder in self.plan.linked:
+            scan = self.scans[self.plan.board_dir / folder]
+            linked_files[scan.column_dir] = self._check_links(scan)
+
+        self._check_duplicates(linked_files)
+
+        for folder in self.plan.linked:
+            scan = self.scans[self.plan.board_dir / folder]
+            self._check_files(scan, linked_files[scan.column_dir])
+
+        for folder in self.plan.unlinked:
+            self._check_unlinked_dir(self.scans[self.plan.board_dir / folder])
+
+    def _check_links(self, scan: ColumnScan) -> set[str]:
+        """Check the links of a column; returns the filenames they reach."""
+        if scan.error:
+            self._issue("invalid_file", scan.column_file, scan.error, fixable=False)
+            return set()
+
+        files = {record.filename: record for record in scan.files if not record.error}
+        by_title: dict[str, ItemRecord] = {}
+        for record in files.values():
+            by_title.setdefault(record.title, record)
+
+        reached: set[str] = set()
+        edits = self.link_edits.setdefault(scan.column_dir, {})
+        for index, (title, filename, parent_name) in enumerate(scan.links):
+            record = files.get(filename)
+            relink = False
+            if record is None and title in by_title:
+                record = by_title[title]
+                self._issue(
+                    "broken_link",
+                    scan.column_file,
+                    f"'{title}' links items/{filename}.md, which is gone; "
+                    f"relinking items/{record.filename}.md",
+                )
+                relink = True
+            elif record is None:
+                self._issue(
+                    "broken_link",
+                    scan.column_file,
+                    f"'{title}' links items/{filename}.md, which is gone",
+                )
+                edits[index] = None
+                continue
+            elif record.title != title:
+                self._issue(
+                    "title_mismatch",
+                    scan.column_file,
+                    f"Link '{title}' points at '{record.title}'",
+                )
+                relink = True
+
+            if record.filename in reached:
+                self._issue(
+                    "duplicate_link",
+                    scan.column_file,
+                    f"'{record.title}' is linked more than once",
+                )
+                edits[index] = None
+                continue
+            reached.add(record.filename)
+
+            if parent_name and parent_name not in self.parent_names:
+                self._issue(
+                    "unknown_parent",
+                    scan.column_file,
+                    f"'{record.title}' names parent '{parent_name}', "
+                    "which the board does not define",
+                )
+                parent_name = self.plan.parents.get(record.parent_id)
+                relink = True
+
+            if relink:
+                edits[index] = format_item_link(
+                    record.title, record.filename, parent_name
+                )
+
+        return reached
+
+    def _check_duplicates(self, linked_files: dict[Path, set[str]]) -> None:
+        """Report item files sharing an id and mark all but one duplicate."""
+        by_id: dict[str, list[ItemRecord]] = {}
+        for folder in self.plan.linked:
+            for record in self.scans[self.plan.board_dir / folder].files:
+                if not record.error:
+                    by_id.setdefault(record.id, []).append(record)
+
+        for item_id, copies in by_id.items():
+            if len(copies) == 1:
+                continue
+
+            # Prefer a copy a link reaches, then the most recently updated
+            kept = max(
+                copies,
+                key=lambda copy: (
+                    copy.filename in linked_files[copy.path.parent.parent],
+                    _timestamp(copy.updated_at),
+                ),
+            )
+            kept_name = kept.path.relative_to(self.plan.board_dir).as_posix()
+            for record in copies:
+                if record is kept:
+                    continue
+                record.duplicate = True
+                self._issue(
+                    "duplicate_id",
+                    record.path,
+                    f"'{record.title}' duplicates {item_id} of {kept_name}",
+                )
+                self.deletions.append(record.path)
+                column_dir = record.path.parent.parent
+                links = self.scans[column_dir].links
+                for index, (_, filename, _) in enumerate(links):
+                    if filename == record.filename:
+                        self.link_edits.setdefault(column_dir, {})[index] = None
+
+    def _check_files(self, scan: ColumnScan, linked: set[str]) -> None:
+        for record in scan.files:
+            item_file = record.path
+            if record.error:
+                self._issue("invalid_file", item_file, record.error, fixable=False)
+                continue
+            if record.duplicate:
+                continue
+
+            changes = {}
+            if scan.column_id and record.column_id != scan.column_id:
+                self._issue(
+                    "column_id_mismatch",
+                    item_file,
+                    f"'{record.title}' has column_id {record.column_id}, "
+                    f"but is in column {scan.column_id}",
+                )
+                changes["column_id"] = scan.column_id
+            if record.parent_id and record.parent_id not in self.plan.parents:
+                self._issue(
+                    "unknown_parent",
+                    item_file,
+                    f"'{record.title}' has parent_id {record.parent_id}, "
+                    "which the board does not define",
+                )
+                changes["parent_id"] = None
+            if changes:
+                self.item_edits[item_file] = changes
+
+            if record.filename not in linked:
+                self._issue(
+                    "orphan_file",
+                    item_file,
+                    f"'{record.title}' is not linked from column.md; linking it",
+                )
+                parent_name = (
+                    None
+                    if "parent_id" in changes
+                    else self.plan.parents.get(record.parent_id)
+                )
+                self.link_appends.setdefault(scan.column_dir, []).append(
+                    format_item_link(record.title, record.filename, parent_name)
+                )
+
+    def _check_unlinked_dir(self, scan: ColumnScan) -> None:
+        if scan.files:
+            self._issue(
+                "unlinked_column",
+                scan.column_dir,
+                f"{len(scan.files)} item files in a column kanban.md does not link",
+                fixable=False,
+            )
+        elif not scan.links:
+            self._issue(
+                "empty_column_dir",
+                scan.column_dir,
+                "Column dir without items that kanban.md does not link",
+            )
+            self.removed_dirs.append(scan.column_dir)
+        else:
+            self._issue(
+                "unlinked_column",
+                scan.column_dir,
+                "column.md with links that kanban.md does not link",
+                fixable=False,
+            )
+
+    def apply(self) -> None:
+        for item_file, changes in self.item_edits.items():
+            post = frontmatter.load(item_file)
+            metadata = _metadata(post)
+            metadata.update(changes)
+            metadata["version"] = file_version(metadata) + 1
+            item_file.write_text(frontmatter.dumps(post), encoding="utf-8")
+
+        for item_file in self.deletions:
+            item_file.unlink(missing_ok=True)
+
+        for column_dir in {*self.link_edits, *self.link_appends}:
+            self._rewrite_links(
+                column_dir / "column.md",
+                self.link_edits.get(column_dir, {}),
+                self.link_appends.get(column_dir, []),
+            )
+
+        for column_dir in self.removed_dirs:
+            shutil.rmtree(column_dir, ignore_errors=True)
+
+        for issue in self._fixes:
+            issue.fixed = True
+
+    def _rewrite_links(
+        self, column_file: Path, edits: dict[int, Optional[str]], appends: list[str]
+    ) -> None:
+        if not edits and not appends:
+            return
+
+        lines = []
+        last_link = None
+        placeholder = None
+        link_index = 0
+        for line in column_file.read_text(encoding="utf-8").split("\n"):
+            stripped = line.strip()
+            if ITEM_LINK_PATTERN.match(stripped):
+                edit = edits.get(link_index, stripped)
+                link_index += 1
+                if edit is None:
+                    continue
+                line = edit
+                last_link = len(lines)
+            elif stripped == "*No items*":
+                placeholder = len(lines)
+            lines.append(line)
+
+        if appends:
+            if last_link is not None:
+                lines[last_link + 1 : last_link + 1] = appends
+            elif placeholder is not None:
+                lines[placeholder : placeholder + 1] = appends
+            else:
+                lines.extend(appends)
+        elif last_link is None and placeholder is None:
+            lines.append("*No items*")
+
+        column_file.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _error_text(error: Exception) -> str:
+    # YAML errors span several lines; reports keep one line per issue
+    return " ".join(str(error).split())
+
+
+def _timestamp(value: Any) -> float:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return 0.0
+    return value.timestamp() if isinstance(value, datetime) else 0.0
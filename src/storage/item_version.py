@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..models.item import Item
+
+# Item fields that concurrent writers may change independently of each other
+MERGED_FIELDS = ("title", "description", "parent_id", "rank")
+
+
+class WriteConflict(OSError):
+    """Another writer changed a field of an item that this write changes too."""
+
+    def __init__(self, conflicts: dict[str, list[str]]):
+        # item title -> names of the conflicting fields
+        self.conflicts = conflicts
+        details = "; ".join(
+            f"'{title}' ({', '.join(fields)})" for title, fields in conflicts.items()
+        )
+        super().__init__(f"Changed by another writer: {details}")
+
+
+def file_fields(metadata: dict[str, Any], content: str) -> dict[str, Any]:
+    """The mergeable fields of an item file."""
+    return {
+        "title": metadata.get("title"),
+        "description": description_body(content),
+        "parent_id": metadata.get("parent_id"),
+        "rank": metadata.get("rank"),
+    }
+
+
+def item_fields(item: Item) -> dict[str, Any]:
+    """The mergeable fields of an item, comparable with ``file_fields``."""
+    return {
+        "title": item.title,
+        "description": description_body(item.description),
+        "parent_id": item.parent_id,
+        "rank": item.rank,
+    }
+
+
+def description_body(text: str) -> str:
+    """A description without its "# title" heading.
+
+    Item files start with a heading of the title, which loading keeps in the
+    description, so a renamed item would otherwise look like it also changed
+    its description.
+    """
+    text = (text or "").strip()
+    if text.startswith("# "):
+        text = text.partition("\n")[2].strip()
+    return text
+
+
+def file_version(metadata: dict[str, Any]) -> int:
+    try:
+        return int(metadata.get("version") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass(frozen=True)
+class ItemVersion:
+    """What this process last read from or wrote to an item file.
+
+    ``version`` is the counter stored in the file, bumped on every write.
+    Fields are kept as digests only, which is enough to tell which side of
+    a merge changed them. ``path`` is where the file was.
+    """
+
+    version: int
+    digests: tuple[int, ...]
+    path: Optional[Path] = None
+
+    @classmethod
+    def of(
+        cls, version: int, fields: dict[str, Any], path: Optional[Path] = None
+    ) -> "ItemVersion":
+        digests = tuple(_digest(fields[name]) for name in MERGED_FIELDS)
+        return cls(version, digests, path)
+
+    def changed(self, name: str, value: Any) -> bool:
+        """Whether ``value`` differs from the field as it was read."""
+        return _digest(value) != self.digests[MERGED_FIELDS.index(name)]
+
+
+def merge_fields(
+    base: Optional[ItemVersion], ours: dict[str, Any], theirs: dict[str, Any]
+) -> tuple[dict[str, Any], list[str]]:
+    """Three-way merge of item fields; returns the merge and the conflicts.
+
+    A field changed on one side only takes that side's value. A field both
+    sides changed to different values is a conflict and keeps ours. Without
+    a base, e.g. for an item this process never read, ours wins.
+    """
+    if base is None:
+        return dict(ours), []
+
+    merged: dict[str, Any] = {}
+    conflicts: list[str] = []
+    for name, base_digest in zip(MERGED_FIELDS, base.digests):
+        our_value, their_value = ours[name], theirs[name]
+        if our_value == their_value or _digest(their_value) == base_digest:
+            merged[name] = our_value
+        elif _digest(our_value) == base_digest:
+            merged[name] = their_value
+        else:
+            merged[name] = our_value
+            conflicts.append(name)
+    return merged, conflicts
+
+
+def _digest(value: Any) -> int:
+    # Digests never leave the process, so the builtin hash is enough
+    return hash(value)
@@ -1,43 +1,254 @@
+import os
+import re
 import click
 import frontmatter
+from dataclasses import dataclass, replace
+from functools import wraps
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Sequence
 from uuid import uuid4
 
 from ..models.board import Board
-from ..models.column import Column
+from ..models.board_summary import BoardSummary
+from ..models.column import RANK_STEP, Column
 from ..models.item import Item
 from ..models.parent import Parent
+from ..utils.metrics import measured, metrics
+from ..utils.profiling import traced
+from .board_hydrator import PendingItem
+from .board_lock import BoardLock, board_lock
+from .item_version import (
+    ItemVersion,
+    WriteConflict,
+    file_fields,
+    file_version,
+    item_fields,
+    merge_fields,
+)
+
+# (title, item filename without .md, parent name) of a column.md item link
+ItemLink = tuple[str, str, str | None]
+
+COLUMN_LINK_PATTERN = re.compile(r"^- \[(.+?)\]\((.+?)/column\.md\)$")
+ITEM_LINK_PATTERN = re.compile(r"^- \[(.+?)\]\(items/(.+?)\.md\)(?:\s*\*\((.+?)\)\*)?$")
+
+# How item files are named: after the item's title, or after its id, which
+# never changes and so never needs a rename
+ITEM_FILENAMES = ("title", "id")
+
+
+def format_item_link(title: str, item_filename: str, parent_name: str | None) -> str:
+    item_link = f"[{title}](items/{item_filename}.md)"
+    if parent_name:
+        item_link += f" *({parent_name})*"
+    return f"- {item_link}"
+
+
+@dataclass(frozen=True)
+class ColumnMove:
+    """A move of an item between columns, as values taken from the board.
+
+    The UI thread keeps changing the board's columns, so a move written on
+    another thread carries its own copy of everything it needs.
+    """
+
+    item: Item  # a copy, already in the target column
+    board_dir: Path
+    source_dir: Path
+    target_dir: Path
+    # The target column's item ids in order, the moved item included
+    target_ids: tuple[str, ...]
+    parent_names: Mapping[str, str]  # parent id -> name, for the link
+
+
+def board_locked(method):
+    """Run a storage write that takes the board first under the board lock."""
+
+    @wraps(method)
+    def wrapper(self, board, *args, **kwargs):
+        with self.lock_board(board):
+            return method(self, board, *args, **kwargs)
+
+    return wrapper
 
 
 class MarkdownStorage:
-    def __init__(self, data_dir: Path):
+    """Boards as markdown files, safe to share with other mkanban processes.
+
+    Every write holds the board's advisory lock for the duration of one
+    storage call. Item files carry a version counter, and an item file that
+    changed on disk since this process read it is merged field by field
+    rather than overwritten; see ``save_item_with_title``.
+
+    An item file that no longer has the name ``item_filenames`` gives it,
+    e.g. after the title changed, is renamed with ``os.replace`` when the
+    item is next written, so each item keeps exactly one file.
+    """
+
+    def __init__(self, data_dir: Path, item_filenames: str = "title"):
+        if item_filenames not in ITEM_FILENAMES:
+            raise ValueError(
+                f"item_filenames must be one of {', '.join(ITEM_FILENAMES)}, "
+                f"not {item_filenames!r}"
+            )
+        self.item_filenames = item_filenames
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
         self.boards_dir = self.data_dir / "boards"
         self.boards_dir.mkdir(exist_ok=True)
 
+        # Item id -> version of its file as last read or written here
+        self._versions: dict[str, ItemVersion] = {}
+
+    def version_stamps(self) -> Mapping[str, ItemVersion]:
+        """Item id -> version of its file as last read or written here, read-only."""
+        return MappingProxyType(self._versions)
+
+    def lock_board(self, board: Board) -> BoardLock:
+        return board_lock(self._get_board_directory(board))
+
+    @traced("storage.load_boards")
     def load_boards(self) -> list[Board]:
-        boards: list[Board] = []
+        return list(self.iter_boards())
+
+    def iter_boards(self) -> Iterator[Board]:
+        """Load the boards one at a time, so only one is held by the loop."""
+        for board_dir in sorted(self.boards_dir.iterdir()):
+            kanban_file = board_dir / "kanban.md"
+            if board_dir.is_dir() and kanban_file.exists():
+                board = self.load_board_from_file(kanban_file)
+                if board:
+                    yield board
+
+    @traced("storage.load_board_catalog")
+    def load_board_catalog(self) -> list[BoardSummary]:
+        """List every board from its kanban.md, without reading columns or items."""
+        catalog: list[BoardSummary] = []
+
+        for board_dir in sorted(self.boards_dir.iterdir()):
+            kanban_file = board_dir / "kanban.md"
+            if not board_dir.is_dir() or not kanban_file.exists():
+                continue
+
+            summary = self.read_board_summary(kanban_file)
+            if summary:
+                catalog.append(summary)
 
-        for board_dir in self.boards_dir.iterdir():
-            if board_dir.is_dir():
-                kanban_file = board_dir / "kanban.md"
-                if kanban_file.exists():
-                    board = self.load_board_from_file(kanban_file)
-                    if board:
-                        boards.append(board)
+        return catalog
 
-        return boards
+    def read_board_summary(self, kanban_file: Path) -> BoardSummary | None:
+        try:
+            post = frontmatter.loads(self._read_text(kanban_file))
+        except Exception:
+            return None
 
-    def load_board_from_file(self, kanban_file: Path) -> Board | None:
+        metadata = post.metadata.get("metadata", post.metadata)
+        if "id" not in metadata or "name" not in metadata:
+            return None
+
+        column_count = sum(
+            1
+            for line in post.content.split("\n")
+            if line.strip().startswith("- [") and "/column.md)" in line
+        )
+        return BoardSummary(
+            id=metadata["id"],
+            name=metadata["name"],
+            description=metadata.get("description", ""),
+            kanban_file=kanban_file,
+            column_count=column_count,
+            updated_at=metadata.get("updated_at"),
+        )
+
+    @traced("storage.load_board_from_file")
+    @measured("load")
+    def load_board_from_file(
+        self, kanban_file: Path, skip_collapsed: bool = False
+    ) -> Board | None:
+        """Load a board with all its items.
+
+        With ``skip_collapsed``, collapsed columns only get their item count
+        from column.md; ``load_column_items`` loads them later.
+        """
         if not kanban_file.exists():
             return None
 
-        with open(kanban_file, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
+        post = frontmatter.loads(self._read_text(kanban_file))
+        board = self._board_from_kanban(post)
+        fill_column = self._load_items_for_column
+        if skip_collapsed:
+            fill_column = self._skipping_collapsed(fill_column)
+        self._parse_columns_from_content(
+            board, post.content, kanban_file.parent, fill_column
+        )
+        board.reindex()
+
+        return board
+
+    @traced("storage.load_board_skeleton")
+    def load_board_skeleton(
+        self, kanban_file: Path, skip_collapsed: bool = False
+    ) -> tuple[Board, list[PendingItem]] | None:
+        """Load a board from kanban.md and its column.md files only.
+
+        Items are placeholders built from the column.md links, with the link
+        title, parent and order. They are returned as pending items for a
+        BoardHydrator to fill in from their item files. ``skip_collapsed`` is
+        as for ``load_board_from_file``.
+        """
+        if not kanban_file.exists():
+            return None
+
+        post = frontmatter.loads(self._read_text(kanban_file))
+        board = self._board_from_kanban(post)
+        pending: list[PendingItem] = []
+
+        def fill_column(board: Board, column: Column, column_dir: Path) -> None:
+            pending.extend(
+                self._placeholder_items_for_column(board, column, column_dir)
+            )
+
+        if skip_collapsed:
+            fill_column = self._skipping_collapsed(fill_column)
+        self._parse_columns_from_content(
+            board, post.content, kanban_file.parent, fill_column
+        )
+        board.reindex()
+
+        return board, pending
+
+    @traced("storage.load_board_outline")
+    def load_board_outline(
+        self, kanban_file: Path
+    ) -> tuple[Board, dict[str, Path]] | None:
+        """Load a board's parents and columns without any items.
 
+        Returns the board and the directory of each column by column id, for
+        callers that read column.md links or item files themselves.
+        """
+        if not kanban_file.exists():
+            return None
+
+        post = frontmatter.loads(self._read_text(kanban_file))
+        board = self._board_from_kanban(post)
+        column_dirs: dict[str, Path] = {}
+        self._parse_columns_from_content(
+            board,
+            post.content,
+            kanban_file.parent,
+            lambda board, column, column_dir: column_dirs.setdefault(
+                column.id, column_dir
+            ),
+        )
+        board.reindex()
+
+        return board, column_dirs
+
+    def _board_from_kanban(self, post: frontmatter.Post) -> Board:
         metadata = post.metadata.get("metadata", post.metadata)
 
         board = Board(
@@ -48,8 +259,6 @@ class MarkdownStorage:
             updated_at=metadata.get("updated_at", datetime.now()),
         )
 
-        self._parse_columns_from_content(board, post.content, kanban_file.parent)
-
         for parent_data in metadata.get("parents", []):
             parent = Parent(
                 id=parent_data["id"],
@@ -61,19 +270,26 @@ class MarkdownStorage:
             )
             board.parents.append(parent)
 
+        # Parents are indexed first so column loading can resolve them by name
+        board.reindex()
         return board
 
     def _parse_columns_from_content(
-        self, board: Board, content: str, board_dir: Path
+        self,
+        board: Board,
+        content: str,
+        board_dir: Path,
+        fill_column: Callable[[Board, Column, Path], None] | None = None,
     ) -> None:
-        import re
-
+        """Add the columns linked from kanban.md and fill each one with
+        ``fill_column(board, column, column_dir)``, by default its items."""
+        fill_column = fill_column or self._load_items_for_column
         lines = content.split("\n")
 
         for line in lines:
             line = line.strip()
 
-            column_match = re.match(r"^- \[(.+?)\]\((.+?)/column\.md\)$", line)
+            column_match = COLUMN_LINK_PATTERN.match(line)
             if column_match:
                 column_name = column_match.group(1).strip()
                 column_folder = column_match.group(2).strip()
@@ -85,113 +301,271 @@ class MarkdownStorage:
                     )
                     if column:
                         board.columns.append(column)
-                        self._load_items_for_column(
-                            board, column, board_dir / column_folder
-                        )
+                        fill_column(board, column, board_dir / column_folder)
+
+    def _skipping_collapsed(
+        self, fill_column: Callable[[Board, Column, Path], None]
+    ) -> Callable[[Board, Column, Path], None]:
+        def fill_unless_collapsed(board: Board, column: Column, column_dir: Path):
+            if column.collapsed:
+                column.mark_unloaded(
+                    len(self.read_item_links(column_dir / "column.md"))
+                )
+            else:
+                fill_column(board, column, column_dir)
+
+        return fill_unless_collapsed
+
+    @traced("storage.load_column_items")
+    def load_column_items(self, board: Board, column: Column) -> None:
+        """Load the items of a column the board was loaded without."""
+        if column.is_loaded:
+            return
+        column.mark_loaded()
+        self._load_items_for_column(
+            board, column, self._get_column_directory(board, column)
+        )
+        board.reindex()
+
+    def load_column_skeleton(self, board: Board, column: Column) -> list[PendingItem]:
+        """Like ``load_column_items``, but with placeholders to hydrate."""
+        if column.is_loaded:
+            return []
+        column.mark_loaded()
+        pending = self._placeholder_items_for_column(
+            board, column, self._get_column_directory(board, column)
+        )
+        board.reindex()
+        return pending
 
+    @traced("storage.load_board")
     def load_board(self, board_id: str) -> Board | None:
-        for board_dir in self.boards_dir.iterdir():
-            if board_dir.is_dir():
-                kanban_file = board_dir / "kanban.md"
-                if kanban_file.exists():
-                    board = self.load_board_from_file(kanban_file)
-                    if board and board.id == board_id:
-                        return board
+        for summary in self.load_board_catalog():
+            if summary.id == board_id:
+                return self.load_board_from_file(summary.kanban_file)
 
         return None
 
+    @traced("storage.load_board_by_name")
     def load_board_by_name(self, board_name: str) -> Board | None:
-        boards = self.load_boards()
-        for board in boards:
-            if board.name.lower() == board_name.lower():
-                return board
+        summary = self.find_board_summary(board_name)
+        if summary is None:
+            return None
+        return self.load_board_from_file(summary.kanban_file)
+
+    def find_board_summary(self, board_name: str) -> BoardSummary | None:
+        for summary in self.load_board_catalog():
+            if summary.name.lower() == board_name.lower():
+                return summary
 
         return None
 
+    @traced("storage.iter_items")
+    def iter_items(
+        self,
+        board: Board,
+        column: Column,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[Item]:
+        """Load a page of a column's items, in column.md link order.
+
+        Only the item files of the links from ``offset`` on are read, at most
+        ``limit`` of them, so a page costs memory for its own items. The
+        board and column only need names and parents, as from
+        ``load_board_outline``. Offsets count links: a page is short when a
+        linked file is missing or repeats an item of the same page.
+        """
+        column_dir = self._get_column_directory(board, column)
+        items_dir = column_dir / "items"
+        titles_cache: dict[Path, dict[str, Item]] = {}
+        seen: set[str] = set()
+
+        stop = None if limit is None else offset + limit
+        links = self._iter_item_links(column_dir / "column.md")
+        for item_title, item_filename, parent_name in islice(links, offset, stop):
+            item = self.load_linked_item(
+                items_dir / f"{item_filename}.md", item_title, column.id, titles_cache
+            )
+            if not item or item.id in seen:
+                continue
+            seen.add(item.id)
+            if parent_name:
+                parent = board.get_parent_by_name(parent_name)
+                if parent:
+                    item.parent_id = parent.id
+            yield item
+
+    def count_items(self, board: Board, column: Column | None = None) -> int:
+        """Number of item links of a column, or of the whole board.
+
+        Only column.md files are read, never item files.
+        """
+        count = 0
+        for counted in [column] if column else board.columns:
+            column_file = self._get_column_directory(board, counted) / "column.md"
+            count += sum(1 for _ in self._iter_item_links(column_file))
+        return count
+
     def load_column_from_file(
         self, column_file: Path, column_name: str, position: int
     ) -> Column | None:
         if not column_file.exists():
             return None
 
-        with open(column_file, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
+        post = frontmatter.loads(self._read_text(column_file))
 
         metadata = post.metadata.get("metadata", post.metadata)
 
         column = Column(
-            id=metadata.get("id", str(uuid4())), name=column_name, position=position
+            id=metadata.get("id", str(uuid4())),
+            name=column_name,
+            position=position,
+            collapsed=bool(metadata.get("collapsed", False)),
         )
         return column
 
+    def read_item_links(self, column_file: Path) -> list[ItemLink]:
+        """The (title, filename, parent name) of every item link in column.md."""
+        return list(self._iter_item_links(column_file))
+
+    def _iter_item_links(self, column_file: Path) -> Iterator[ItemLink]:
+        if not column_file.exists():
+            return
+
+        post = frontmatter.loads(self._read_text(column_file))
+        for line in post.content.split("\n"):
+            item_match = ITEM_LINK_PATTERN.match(line.strip())
+            if item_match:
+                yield (
+                    item_match.group(1).strip(),
+                    item_match.group(2),
+                    item_match.group(3) if item_match.group(3) else None,
+                )
+
     def _load_items_for_column(
         self, board: Board, column: Column, column_dir: Path
     ) -> None:
-        import re
-
-        column_file = column_dir / "column.md"
-        if column_file.exists():
-            with open(column_file, "r", encoding="utf-8") as f:
-                post = frontmatter.load(f)
-
-            referenced_items = set()
-            parent_info = {}
-
-            lines = post.content.split("\n")
-            for line in lines:
-                line = line.strip()
+        items_dir = column_dir / "items"
+        titles_cache: dict[Path, dict[str, Item]] = {}
+        referenced_items = set()
+        parent_info = {}
 
-                item_match = re.match(
-                    r"^- \[(.+?)\]\(items/(.+?)\.md\)(?:\s*\*\((.+?)\)\*)?$", line
-                )
-                if item_match:
-                    item_title = item_match.group(1).strip()
-                    parent_name = item_match.group(3) if item_match.group(3) else None
-
-                    items_dir = column_dir / "items"
-                    if items_dir.exists():
-                        for item_file in items_dir.glob("*.md"):
-                            item = self.load_item_from_title_file(item_file, column.id)
-                            if item and item.title == item_title:
-                                if item.id not in referenced_items:
-                                    referenced_items.add(item.id)
-                                    if parent_name:
-                                        parent_info[item.id] = parent_name
-                                    column.items.append(item)
-                                break
-
-            # Set parent IDs based on parent names
-            for item in column.items:
-                if item.id in parent_info:
-                    parent_name = parent_info[item.id]
-                    for parent in board.parents:
-                        if parent.name == parent_name:
-                            item.parent_id = parent.id
-                            break
+        for item_title, item_filename, parent_name in self.read_item_links(
+            column_dir / "column.md"
+        ):
+            item = self.load_linked_item(
+                items_dir / f"{item_filename}.md", item_title, column.id, titles_cache
+            )
+            if item and item.id not in referenced_items:
+                referenced_items.add(item.id)
+                if parent_name:
+                    parent_info[item.id] = parent_name
+                column.items.append(item)
+
+        # Set parent IDs based on parent names
+        for item in column.items:
+            if item.id in parent_info:
+                parent = board.get_parent_by_name(parent_info[item.id])
+                if parent:
+                    item.parent_id = parent.id
+
+        column.normalize_ranks()
+
+    def _placeholder_items_for_column(
+        self, board: Board, column: Column, column_dir: Path
+    ) -> list[PendingItem]:
+        items_dir = column_dir / "items"
+        pending: list[PendingItem] = []
+        now = datetime.now()
 
+        for index, (item_title, item_filename, parent_name) in enumerate(
+            self.read_item_links(column_dir / "column.md")
+        ):
+            parent = board.get_parent_by_name(parent_name) if parent_name else None
+            # Built without validation and with a cheap temporary id, since a
+            # skeleton has one placeholder per link of every column
+            item = Item.model_construct(
+                id=f"pending:{column.id}:{index}",
+                title=item_title,
+                column_id=column.id,
+                parent_id=parent.id if parent else None,
+                rank=(index + 1) * RANK_STEP,
+                description="",
+                created_at=now,
+                updated_at=now,
+            )
+            column.items.append(item)
+            pending.append(PendingItem(item, items_dir, item_filename, parent_name))
+
+        return pending
+
+    def load_linked_item(
+        self,
+        item_file: Path,
+        title: str,
+        column_id: str,
+        titles_cache: dict[Path, dict[str, Item]] | None = None,
+    ) -> Item | None:
+        """Load the item a column.md link points at.
+
+        When the file is missing or holds another item, e.g. after a rename by
+        hand, the item is looked up by title in its items directory. The
+        title index of the directory is kept in ``titles_cache``.
+        """
+        item = self.load_item_from_title_file(item_file, column_id)
+        if item and item.title == title:
+            return item
+
+        items_dir = item_file.parent
+        if titles_cache is None:
+            titles_cache = {}
+        if items_dir not in titles_cache:
+            titles_cache[items_dir] = self._load_items_by_title(items_dir, column_id)
+        return titles_cache[items_dir].get(title)
+
+    def _load_items_by_title(self, items_dir: Path, column_id: str) -> dict[str, Item]:
+        items_by_title: dict[str, Item] = {}
+        if items_dir.exists():
+            for item_file in items_dir.glob("*.md"):
+                item = self.load_item_from_title_file(item_file, column_id)
+                if item:
+                    items_by_title.setdefault(item.title, item)
+        return items_by_title
+
+    @traced("storage.load_item_from_title_file")
     def load_item_from_title_file(self, item_file: Path, column_id: str) -> Item | None:
         if not item_file.exists():
             return None
 
-        with open(item_file, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
+        post = frontmatter.loads(self._read_text(item_file))
 
         item_metadata = post.metadata.get("metadata", post.metadata)
-        return Item(
+        item = Item(
             id=item_metadata.get("id", str(uuid4())),
             title=item_metadata["title"],
             description=post.content.strip(),
             column_id=column_id,
             parent_id=item_metadata.get("parent_id"),
+            rank=item_metadata.get("rank"),
             created_at=item_metadata.get("created_at", datetime.now()),
             updated_at=item_metadata.get("updated_at", datetime.now()),
             metadata=item_metadata.get("metadata", {}),
         )
+        self._versions[item.id] = ItemVersion.of(
+            file_version(item_metadata),
+            file_fields(item_metadata, post.content),
+            item_file,
+        )
+        return item
 
     def save_boards(self, boards: list[Board]) -> None:
         for board in boards:
             self.save_board(board)
 
+    @traced("storage.save_board")
+    @measured("save")
+    @board_locked
     def save_board(self, board: Board) -> None:
         board_dir = self._get_board_directory(board)
         board_dir.mkdir(exist_ok=True)
@@ -228,9 +602,10 @@ class MarkdownStorage:
 
         post = frontmatter.Post(content="\n".join(content_lines), metadata=board_data)
 
-        with open(kanban_file, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+        self._write_text(kanban_file, frontmatter.dumps(post))
 
+    @traced("storage.save_column_with_items")
+    @board_locked
     def save_column_with_items(self, board: Board, column: Column) -> None:
         board_dir = self._get_board_directory(board)
         column_safe_name = self._get_safe_name(column.name)
@@ -240,50 +615,209 @@ class MarkdownStorage:
         items_dir = column_dir / "items"
         items_dir.mkdir(exist_ok=True)
 
-        column_data = {
-            "id": column.id,
-            "name": column.name,
-            "position": column.position,
-        }
+        column_data = self._column_metadata(column)
+        column_file = column_dir / "column.md"
+        if not column.is_loaded:
+            # Its items were never loaded, so its links are kept as they are
+            self._write_column_metadata(column_file, column_data)
+            return
 
         content_lines = [f"# {column.name}", "", "## Items", ""]
+        conflicts: dict[str, list[str]] = {}
+        written: set[str] = set()
+
+        for item in column.items:
+            item_filename = self._place_item_file(items_dir, item)
+            written.add(item_filename)
 
-        if not column.items:
+            # Save individual item file
+            try:
+                saved = self.save_item_with_title(items_dir, item, item_filename)
+            except WriteConflict as e:
+                conflicts.update(e.conflicts)
+                if not (items_dir / f"{item_filename}.md").exists():
+                    # Deleted or moved by another writer; not brought back
+                    continue
+                saved = item
+            content_lines.append(self._format_item_link(board, saved, item_filename))
+
+        # Items another process added since this board was loaded
+        content_lines.extend(self._foreign_item_links(board, column_file, written))
+        if len(content_lines) == 4:
             content_lines.append("*No items*")
-        else:
-            for item in column.items:
-                item_filename = self._get_unique_filename(items_dir, item)
-                item_link = f"[{item.title}](items/{item_filename}.md)"
 
-                if item.parent_id:
-                    parent_name = "Unknown Parent"
-                    for parent in board.parents:
-                        if parent.id == item.parent_id:
-                            parent_name = parent.name
-                            break
-                    item_link += f" *({parent_name})*"
+        post = frontmatter.Post(content="\n".join(content_lines), metadata=column_data)
+        self._write_text(column_file, frontmatter.dumps(post))
 
-                content_lines.append(f"- {item_link}")
+        if conflicts:
+            raise WriteConflict(conflicts)
 
-                # Save individual item file
-                self.save_item_with_title(items_dir, item, item_filename)
+    @board_locked
+    def save_column_metadata(self, board: Board, column: Column) -> None:
+        """Write a column's own fields, e.g. ``collapsed``, but not its items."""
+        column_file = self._get_column_directory(board, column) / "column.md"
+        self._write_column_metadata(column_file, self._column_metadata(column))
 
-        post = frontmatter.Post(content="\n".join(content_lines), metadata=column_data)
+    def _column_metadata(self, column: Column) -> dict:
+        column_data = {
+            "id": column.id,
+            "name": column.name,
+            "position": column.position,
+        }
+        if column.collapsed:
+            column_data["collapsed"] = True
+        return column_data
 
-        column_file = column_dir / "column.md"
-        with open(column_file, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+    def _write_column_metadata(self, column_file: Path, column_data: dict) -> None:
+        try:
+            content = frontmatter.loads(self._read_text(column_file)).content
+        except OSError:
+            content = f"# {column_data['name']}\n\n## Items\n\n*No items*"
+        post = frontmatter.Post(content=content, metadata=column_data)
+        self._write_text(column_file, frontmatter.dumps(post))
+
+    def _foreign_item_links(
+        self, board: Board, column_file: Path, written: set[str]
+    ) -> list[str]:
+        """Links of column.md to item files that are not on ``board``."""
+        links = []
+        for line in self._read_column_link_lines(column_file):
+            filename = ITEM_LINK_PATTERN.match(line).group(2)
+            if filename in written:
+                continue
+            item_file = column_file.parent / "items" / f"{filename}.md"
+            try:
+                metadata = frontmatter.loads(self._read_text(item_file)).metadata
+            except Exception:
+                continue
+            item_id = metadata.get("metadata", metadata).get("id")
+            if item_id and not board.get_item_by_id(item_id):
+                links.append(line)
+        return links
+
+    def _read_column_link_lines(self, column_file: Path) -> list[str]:
+        if not column_file.exists():
+            return []
+        lines = (line.strip() for line in self._read_text(column_file).split("\n"))
+        return [line for line in lines if ITEM_LINK_PATTERN.match(line)]
+
+    def _format_item_link(self, board: Board, item: Item, item_filename: str) -> str:
+        parent_name = None
+        if item.parent_id:
+            parent = board.get_parent_by_id(item.parent_id)
+            parent_name = parent.name if parent else "Unknown Parent"
 
+        return format_item_link(item.title, item_filename, parent_name)
+
+    @traced("storage.save_item_with_title")
     def save_item_with_title(
-        self, items_dir: Path, item: Item, item_filename: str
-    ) -> None:
+        self,
+        items_dir: Path,
+        item: Item,
+        item_filename: str,
+        merge_from: Path | None = None,
+    ) -> Item:
+        """Write an item file and return the item as written.
+
+        If the file (or ``merge_from``, the file a moved item comes from)
+        changed on disk since this process last read or wrote it, fields only
+        the other writer changed are kept, so the returned item may differ
+        from ``item``, which is left alone. Fields both sides changed raise
+        WriteConflict and nothing is written. An unchanged file is not
+        rewritten.
+
+        A file another writer renamed is found by id, merged and moved to
+        ``item_filename``. One that was deleted, or moved to another column,
+        since this process read it raises WriteConflict rather than being
+        written back.
+        """
         item_file = items_dir / f"{item_filename}.md"
 
+        with board_lock(items_dir.parent.parent):
+            base = self._versions.get(item.id)
+            version = base.version if base else 0
+            post = self._item_post(item)
+            post.metadata["version"] = version
+            ours = item_fields(item)
+            saved = item
+
+            source = merge_from or item_file
+            text = self._read_item_text(source)
+            if source == item_file and text == frontmatter.dumps(post):
+                # Nobody changed the file and neither did we
+                return saved
+
+            their_post = self._item_post_with_id(text, item.id)
+            if their_post is None and base and base.path and base.path != source:
+                # Written under a new name, e.g. after a rename
+                their_post = self._item_post_with_id(
+                    self._read_item_text(base.path), item.id
+                )
+            if their_post is None and base is not None and text is None:
+                live_file = self._find_item_file_by_id(items_dir, item.id)
+                if live_file is None:
+                    raise WriteConflict({item.title: ["deleted"]})
+                # Renamed by another writer; the merge keeps their name only
+                # if the caller did not give the item another one
+                os.replace(live_file, item_file)
+                text = self._read_item_text(item_file)
+                their_post = self._item_post_with_id(text, item.id)
+                source = item_file
+            if their_post is not None:
+                their_metadata = their_post.metadata.get(
+                    "metadata", their_post.metadata
+                )
+                version = max(version, file_version(their_metadata))
+                merged, conflicts = merge_fields(
+                    base, ours, file_fields(their_metadata, their_post.content)
+                )
+                if conflicts:
+                    raise WriteConflict({item.title: conflicts})
+                theirs_only = {
+                    name: value for name, value in merged.items() if value != ours[name]
+                }
+                if theirs_only:
+                    saved = item.model_copy(update=theirs_only)
+                    post = self._item_post(saved)
+
+            post.metadata["version"] = version
+            if source == item_file and text == frontmatter.dumps(post):
+                self._versions[item.id] = ItemVersion.of(version, ours, item_file)
+                return saved
+
+            post.metadata["version"] = version + 1
+            self._write_text(item_file, frontmatter.dumps(post))
+            # Our own fields stay the base, so values merged in from another
+            # writer still count as theirs while the caller's copy lacks them
+            self._versions[item.id] = ItemVersion.of(version + 1, ours, item_file)
+            return saved
+
+    def _read_item_text(self, item_file: Path) -> str | None:
+        try:
+            return self._read_text(item_file)
+        except OSError:
+            return None
+
+    def _item_post_with_id(
+        self, text: str | None, item_id: str
+    ) -> frontmatter.Post | None:
+        """The parsed item file, None if missing or holding another item."""
+        if text is None:
+            return None
+        try:
+            post = frontmatter.loads(text)
+        except Exception:
+            return None
+        metadata = post.metadata.get("metadata", post.metadata)
+        return post if metadata.get("id") == item_id else None
+
+    def _item_post(self, item: Item) -> frontmatter.Post:
         item_metadata = {
             "id": item.id,
             "title": item.title,
             "column_id": item.column_id,
             "parent_id": item.parent_id,
+            "rank": item.rank,
             "created_at": item.created_at,
             "updated_at": item.updated_at,
         }
@@ -302,20 +836,147 @@ class MarkdownStorage:
         else:
             content_lines = [f"# {item.title}", "", description]
 
-        post = frontmatter.Post(
+        return frontmatter.Post(
             content="\n".join(content_lines), metadata=item_metadata
         )
 
-        with open(item_file, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+    @traced("storage.save_item_order")
+    @measured("reorder")
+    @board_locked
+    def save_item_order(
+        self, board: Board, column: Column, changed_items: list[Item]
+    ) -> None:
+        if len(changed_items) != 1:
+            self.save_column_with_items(board, column)
+            return
 
-    def delete_item_from_column(self, board: Board, item: Item) -> bool:
-        column = None
-        for col in board.columns:
-            if col.id == item.column_id:
-                column = col
-                break
+        item = changed_items[0]
+        board_dir = self._get_board_directory(board)
+        column_dir = board_dir / self._get_safe_name(column.name)
+        items_dir = column_dir / "items"
+
+        old_file = self._current_item_file(items_dir, item)
+        item_filename = self._place_item_file(items_dir, item, old_file)
+        saved = self.save_item_with_title(items_dir, item, item_filename)
+
+        column_file = column_dir / "column.md"
+        if old_file and old_file.stem != item_filename:
+            self._replace_column_link(
+                column_file,
+                old_file.stem,
+                self._format_item_link(board, saved, item_filename),
+            )
+        elif saved is not item:
+            self._replace_column_link(
+                column_file,
+                item_filename,
+                self._format_item_link(board, saved, item_filename),
+            )
+        if not self._patch_column_link_order(
+            column_file, [other.id for other in column.items], item.id, item_filename
+        ):
+            self.save_column_with_items(board, column)
+
+    def _patch_column_link_order(
+        self,
+        column_file: Path,
+        item_ids: Sequence[str],
+        item_id: str,
+        item_filename: str,
+    ) -> bool:
+        """Move an item's link to its position among ``item_ids``, the ids of
+        the column's items in order."""
+        if not column_file.exists():
+            return False
+
+        lines = self._read_text(column_file).split("\n")
+
+        link_indexes = []
+        moved_index = None
+        for index, line in enumerate(lines):
+            link_match = ITEM_LINK_PATTERN.match(line.strip())
+            if link_match:
+                link_indexes.append(index)
+                if link_match.group(2) == item_filename:
+                    moved_index = index
+
+        if moved_index is None:
+            return False
+
+        moved_line = lines.pop(moved_index)
+        remaining = [
+            index if index < moved_index else index - 1
+            for index in link_indexes
+            if index != moved_index
+        ]
+
+        if item_id not in item_ids:
+            return False
+        position = item_ids.index(item_id)
+        if position < len(remaining):
+            insert_at = remaining[position]
+        elif remaining:
+            insert_at = remaining[-1] + 1
+        else:
+            insert_at = moved_index
+        lines.insert(insert_at, moved_line)
+
+        self._write_text(column_file, "\n".join(lines))
+
+        return True
 
+    @traced("storage.add_item_to_column")
+    @board_locked
+    def add_item_to_column(self, board: Board, item: Item) -> bool:
+        """Write one item file and append its link, e.g. to restore a deleted item."""
+        column = board.get_column_by_id(item.column_id)
+        if not column:
+            return False
+
+        column_dir = self._get_board_directory(board) / self._get_safe_name(column.name)
+        items_dir = column_dir / "items"
+        items_dir.mkdir(parents=True, exist_ok=True)
+
+        item_filename = self._item_filename(items_dir, item)
+        saved = self.save_item_with_title(items_dir, item, item_filename)
+
+        column_file = column_dir / "column.md"
+        link_line = self._format_item_link(board, saved, item_filename)
+        if not self._append_column_link(column_file, link_line):
+            self.save_column_with_items(board, column)
+        elif not self._patch_column_link_order(
+            column_file, [other.id for other in column.items], item.id, item_filename
+        ):
+            self.save_column_with_items(board, column)
+        return True
+
+    @traced("storage.save_item")
+    @board_locked
+    def save_item(self, board: Board, item: Item, reorder: bool = False) -> bool:
+        """Rewrite one item file in place and its column.md link."""
+        column = board.get_column_by_id(item.column_id)
+        if not column:
+            return False
+
+        items_dir = (
+            self._get_board_directory(board)
+            / self._get_safe_name(column.name)
+            / "items"
+        )
+        item_file = self._find_item_file_by_id(items_dir, item.id, item.title)
+        if not item_file:
+            return False
+
+        saved = self.save_item_with_title(items_dir, item, item_file.stem)
+        if not self.update_item_link(board, saved, item_file, reorder):
+            self.save_column_with_items(board, column)
+        return True
+
+    @traced("storage.delete_item_from_column")
+    @measured("delete")
+    @board_locked
+    def delete_item_from_column(self, board: Board, item: Item) -> bool:
+        column = board.get_column_by_id(item.column_id)
         if not column:
             return False
 
@@ -325,81 +986,281 @@ class MarkdownStorage:
         items_dir = column_dir / "items"
 
         # Find the item file by scanning metadata for the ID
-        item_file = self._find_item_file_by_id(items_dir, item.id)
+        item_file = self._find_item_file_by_id(items_dir, item.id, item.title)
         if item_file and item_file.exists():
             item_file.unlink()
+            # A restore by undo writes a new item, not a deleted one
+            self._versions.pop(item.id, None)
+            if not self._remove_column_link(column_dir / "column.md", item_file.stem):
+                remaining = column.model_copy(
+                    update={"items": [i for i in column.items if i.id != item.id]}
+                )
+                self.save_column_with_items(board, remaining)
             return True
         return False
 
+    @traced("storage.move_item_between_columns")
+    @measured("move")
+    @board_locked
     def move_item_between_columns(
         self, board: Board, item: Item, old_column_id: str, new_column_id: str
     ) -> bool:
-        old_column = None
-        new_column = None
-
-        for col in board.columns:
-            if col.id == old_column_id:
-                old_column = col
-            elif col.id == new_column_id:
-                new_column = col
+        move = self.snapshot_move(board, item, old_column_id, new_column_id)
+        if move is None:
+            return False
 
-        if not old_column or not new_column:
+        placed = self._write_move(move)
+        if placed is None:
             return False
 
+        unlinked, linked = placed
+        if not unlinked:
+            self.save_column_with_items(board, board.get_column_by_id(old_column_id))
+        if not linked:
+            # The link goes where the item is in memory, e.g. back to its
+            # old place on undo, since neighbours may have no stored rank
+            self.save_column_with_items(board, board.get_column_by_id(new_column_id))
+        return True
+
+    def snapshot_move(
+        self, board: Board, item: Item, old_column_id: str, new_column_id: str
+    ) -> ColumnMove | None:
+        """Take what ``write_move`` needs from the board, which has to be done
+        on the thread that changes it, after the item was moved in memory."""
+        old_column = board.get_column_by_id(old_column_id)
+        new_column = board.get_column_by_id(new_column_id)
+        if old_column_id == new_column_id or not old_column or not new_column:
+            return None
+
         board_dir = self._get_board_directory(board)
+        return ColumnMove(
+            item=item.model_copy(
+                update={"column_id": new_column_id, "updated_at": datetime.now()}
+            ),
+            board_dir=board_dir,
+            source_dir=board_dir / self._get_safe_name(old_column.name),
+            target_dir=board_dir / self._get_safe_name(new_column.name),
+            target_ids=tuple(other.id for other in new_column.items),
+            parent_names=MappingProxyType(
+                {parent.id: parent.name for parent in board.parents}
+            ),
+        )
+
+    @traced("storage.write_move")
+    @measured("move")
+    def write_move(self, move: ColumnMove) -> bool:
+        """Write a move taken by ``snapshot_move``; safe to call off the UI
+        thread. False when the item file is gone, or when its link could not
+        be removed from or placed in a column.md."""
+        with board_lock(move.board_dir):
+            return self._write_move(move) == (True, True)
+
+    def _write_move(self, move: ColumnMove) -> tuple[bool, bool] | None:
+        """Move the item file; returns whether its link was removed from the
+        source column.md and placed in the target one, or None when the item
+        file is gone."""
+        item = move.item
+        old_item_file = self._find_item_file_by_id(
+            move.source_dir / "items", item.id, item.title
+        )
+        if not old_item_file or not old_item_file.exists():
+            return None
 
-        old_column_safe_name = self._get_safe_name(old_column.name)
-        old_column_dir = board_dir / old_column_safe_name
-        old_items_dir = old_column_dir / "items"
+        new_items_dir = move.target_dir / "items"
+        new_items_dir.mkdir(exist_ok=True)
+        new_item_filename = self._item_filename(new_items_dir, item)
+        saved = self.save_item_with_title(
+            new_items_dir, item, new_item_filename, merge_from=old_item_file
+        )
+        old_item_file.unlink()
 
-        # Find the item file by scanning metadata for the ID
-        old_item_file = self._find_item_file_by_id(old_items_dir, item.id)
+        # Only the two affected link lists are patched, not the whole board
+        unlinked = self._remove_column_link(
+            move.source_dir / "column.md", old_item_file.stem
+        )
+        parent_name = None
+        if saved.parent_id:
+            parent_name = move.parent_names.get(saved.parent_id, "Unknown Parent")
+        new_column_file = move.target_dir / "column.md"
+        linked = self._append_column_link(
+            new_column_file,
+            format_item_link(saved.title, new_item_filename, parent_name),
+        ) and self._patch_column_link_order(
+            new_column_file, move.target_ids, item.id, new_item_filename
+        )
+        return unlinked, linked
 
-        new_column_safe_name = self._get_safe_name(new_column.name)
-        new_column_dir = board_dir / new_column_safe_name
-        new_items_dir = new_column_dir / "items"
-        new_items_dir.mkdir(exist_ok=True)  # Ensure target directory exists
+    @traced("storage.update_item_link")
+    @board_locked
+    def update_item_link(
+        self, board: Board, item: Item, item_file: Path, reorder: bool = False
+    ) -> bool:
+        """Rewrite the column.md link of an item whose file was edited, and
+        move the link to the item's position when ``reorder`` is set.
+
+        A file named after the item's old title is renamed first."""
+        column_file = item_file.parent.parent / "column.md"
+        item_filename = self._place_item_file(item_file.parent, item, item_file)
+        link_line = self._format_item_link(board, item, item_filename)
+        if not self._replace_column_link(column_file, item_file.stem, link_line):
+            return False
 
-        if old_item_file and old_item_file.exists():
-            item.column_id = new_column_id
-            item.updated_at = datetime.now()
+        column = board.get_column_by_id(item.column_id)
+        if reorder and column:
+            self._patch_column_link_order(
+                column_file,
+                [other.id for other in column.items],
+                item.id,
+                item_filename,
+            )
+        return True
 
-            # Get unique filename for the new location
-            new_item_filename = self._get_unique_filename(new_items_dir, item)
-            self.save_item_with_title(new_items_dir, item, new_item_filename)
+    def _replace_column_link(
+        self, column_file: Path, item_filename: str, link_line: str
+    ) -> bool:
+        if not column_file.exists():
+            return False
 
-            old_item_file.unlink()
+        lines = self._read_text(column_file).split("\n")
 
-            return True
+        for index, line in enumerate(lines):
+            link_match = ITEM_LINK_PATTERN.match(line.strip())
+            if link_match and link_match.group(2) == item_filename:
+                if line.strip() != link_line:
+                    lines[index] = link_line
+                    self._write_text(column_file, "\n".join(lines))
+                return True
 
         return False
 
+    def _remove_column_link(self, column_file: Path, item_filename: str) -> bool:
+        if not column_file.exists():
+            return False
+
+        lines = self._read_text(column_file).split("\n")
+
+        link_indexes = []
+        removed_index = None
+        for index, line in enumerate(lines):
+            link_match = ITEM_LINK_PATTERN.match(line.strip())
+            if link_match:
+                link_indexes.append(index)
+                if link_match.group(2) == item_filename:
+                    removed_index = index
+
+        if removed_index is None:
+            return False
+
+        if len(link_indexes) == 1:
+            lines[removed_index] = "*No items*"
+        else:
+            del lines[removed_index]
+
+        self._write_text(column_file, "\n".join(lines))
+
+        return True
+
+    def _append_column_link(self, column_file: Path, link_line: str) -> bool:
+        if not column_file.exists():
+            return False
+
+        lines = self._read_text(column_file).split("\n")
+
+        last_link = None
+        placeholder = None
+        for index, line in enumerate(lines):
+            stripped = line.strip()
+            if ITEM_LINK_PATTERN.match(stripped):
+                last_link = index
+            elif stripped == "*No items*":
+                placeholder = index
+
+        if last_link is not None:
+            lines.insert(last_link + 1, link_line)
+        elif placeholder is not None:
+            lines[placeholder] = link_line
+        else:
+            return False
+
+        self._write_text(column_file, "\n".join(lines))
+
+        return True
+
+    def _read_text(self, path: Path) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        metrics.record_file_read(self._metrics_board(path), len(text.encode("utf-8")))
+        return text
+
+    def _write_text(self, path: Path, text: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        metrics.record_file_written(
+            self._metrics_board(path), len(text.encode("utf-8"))
+        )
+
+    def _metrics_board(self, value: Board | ColumnMove | Path | str) -> str:
+        if isinstance(value, ColumnMove):
+            value = value.board_dir
+        if isinstance(value, Board):
+            return self._get_board_directory(value).name
+        if isinstance(value, Path):
+            try:
+                return value.relative_to(self.boards_dir).parts[0]
+            except (ValueError, IndexError):
+                return ""
+        return self._get_safe_name(value) if value else ""
+
+    def get_kanban_file(self, board: Board) -> Path:
+        return self._get_board_directory(board) / "kanban.md"
+
     def _get_board_directory(self, board: Board) -> Path:
         safe_name = self._get_safe_name(board.name)
         return self.boards_dir / safe_name
 
-    def _get_safe_name(self, name: str) -> str:
-        import re
+    def _get_column_directory(self, board: Board, column: Column) -> Path:
+        return self._get_board_directory(board) / self._get_safe_name(column.name)
 
+    def _get_safe_name(self, name: str) -> str:
         safe_name = re.sub(r"[^a-zA-Z0-9\s-]", "", name.lower())
         safe_name = re.sub(r"\s+", "-", safe_name.strip())
         return safe_name or "unnamed"
 
     def _get_title_filename(self, title: str) -> str:
-        import re
-
         safe_title = re.sub(r"[^a-zA-Z0-9\s-]", "", title.lower())
         safe_title = re.sub(r"\s+", "_", safe_title.strip())
         return safe_title or "unnamed"
 
-    def _find_item_file_by_id(self, items_dir: Path, item_id: str) -> Path | None:
+    @traced("storage._find_item_file_by_id")
+    def _find_item_file_by_id(
+        self,
+        items_dir: Path,
+        item_id: str,
+        title: str | None = None,
+        scan: bool = True,
+    ) -> Path | None:
         if not items_dir.exists():
             return None
 
+        # The file is usually where it was last read, or named after the id
+        # or the title, so try those before scanning
+        candidates = []
+        base = self._versions.get(item_id)
+        if base and base.path and base.path.parent == items_dir:
+            candidates.append(base.path)
+        candidates.append(items_dir / f"{self._get_id_filename(item_id)}.md")
+        if title:
+            base_filename = self._get_title_filename(title)
+            candidates.extend(sorted(items_dir.glob(f"{base_filename}*.md")))
+        for candidate in candidates:
+            if candidate.exists() and self._item_file_has_id(candidate, item_id):
+                return candidate
+        if not scan:
+            return None
+
         for item_file in items_dir.glob("*.md"):
             try:
-                with open(item_file, "r", encoding="utf-8") as f:
-                    post = frontmatter.load(f)
+                post = frontmatter.loads(self._read_text(item_file))
 
                 item_metadata = post.metadata.get("metadata", post.metadata)
                 if item_metadata.get("id") == item_id:
@@ -410,16 +1271,105 @@ class MarkdownStorage:
 
         return None
 
-    def _get_unique_filename(self, items_dir: Path, item: Item) -> str:
-        base_filename = self._get_title_filename(item.title)
+    def _item_file_has_id(self, item_file: Path, item_id: str) -> bool:
+        try:
+            post = frontmatter.loads(self._read_text(item_file))
+        except Exception:
+            return False
+
+        item_metadata = post.metadata.get("metadata", post.metadata)
+        return item_metadata.get("id") == item_id
+
+    def _get_id_filename(self, item_id: str) -> str:
+        return re.sub(r"[^a-zA-Z0-9_-]", "", item_id) or "unnamed"
+
+    def _item_filename(self, items_dir: Path, item: Item) -> str:
+        """The filename, without .md, that ``item`` gets in ``items_dir``."""
+        if self.item_filenames == "id":
+            return self._get_unique_filename(
+                items_dir, item, self._get_id_filename(item.id)
+            )
+        return self._get_unique_filename(items_dir, item)
+
+    def _current_item_file(self, items_dir: Path, item: Item) -> Path | None:
+        """The file of ``item`` in ``items_dir`` as this process last saw it."""
+        base = self._versions.get(item.id)
+        if base and base.path and base.path.parent == items_dir:
+            return base.path
+        return None
+
+    def _place_item_file(
+        self, items_dir: Path, item: Item, current: Path | None = None
+    ) -> str:
+        """Like ``_item_filename``, but first rename the item's existing file
+        (``current``, or where it was last read) to that name.
+
+        Without the rename, an item whose title changed would be written to a
+        new file next to the old one. A file another writer renamed since is
+        looked up by id first, and keeps its name unless this item's title
+        changed too.
+        """
+        item_filename = self._item_filename(items_dir, item)
+        current = current or self._current_item_file(items_dir, item)
+        if current is not None and not current.exists():
+            # Renamed by another writer since this process read it
+            current = self._find_item_file_by_id(items_dir, item.id)
+            base = self._versions.get(item.id)
+            if (
+                current is not None
+                and self.item_filenames == "title"
+                and base
+                and not base.changed("title", item.title)
+            ):
+                # Their title wins the merge, so their name is the right one
+                self._versions[item.id] = replace(base, path=current)
+                return current.stem
+        if (
+            current is None
+            or current.stem == item_filename
+            or not self._item_file_has_id(current, item.id)
+        ):
+            return item_filename
+
+        item_file = items_dir / f"{item_filename}.md"
+        os.replace(current, item_file)
+        base = self._versions.get(item.id)
+        if base:
+            self._versions[item.id] = replace(base, path=item_file)
+        return item_filename
+
+    @board_locked
+    def rename_item_files(self, board: Board) -> int:
+        """Give every item file of ``board`` the name ``item_filenames`` gives
+        it, rewriting the links; returns how many files were renamed."""
+        renamed = 0
+        board_dir = self._get_board_directory(board)
+        for column in board.columns:
+            column_dir = board_dir / self._get_safe_name(column.name)
+            items_dir = column_dir / "items"
+            changed = False
+            for item in column.items:
+                current = self._current_item_file(items_dir, item)
+                self._place_item_file(items_dir, item, current)
+                if self._current_item_file(items_dir, item) != current:
+                    renamed += 1
+                    changed = True
+            if changed:
+                self.save_column_with_items(board, column)
+        return renamed
+
+    @traced("storage._get_unique_filename")
+    def _get_unique_filename(
+        self, items_dir: Path, item: Item, base_filename: str | None = None
+    ) -> str:
+        base_filename = base_filename or self._get_title_filename(item.title)
         potential_file = items_dir / f"{base_filename}.md"
 
         if not potential_file.exists():
             return base_filename
 
         try:
-            with open(potential_file, "r", encoding="utf-8") as f:
-                post = frontmatter.load(f)
+            post = frontmatter.loads(self._read_text(potential_file))
 
             existing_metadata = post.metadata.get("metadata", post.metadata)
             if existing_metadata.get("id") == item.id:
@@ -437,8 +1387,7 @@ class MarkdownStorage:
                 return test_filename
 
             try:
-                with open(test_file, "r", encoding="utf-8") as f:
-                    post = frontmatter.load(f)
+                post = frontmatter.loads(self._read_text(test_file))
 
                 existing_metadata = post.metadata.get("metadata", post.metadata)
                 if existing_metadata.get("id") == item.id:
@@ -467,7 +1416,7 @@ class MarkdownStorage:
         review_col = board.add_column("Review", 2)
         done_col = board.add_column("Done", 3)
 
-        item1 = todo_col.add_item("Learn keyboard shortcuts", todo_col.id)
+        item1 = board.add_item(todo_col.id, "Learn keyboard shortcuts")
         item1.description = (
             "Press 'g?' to view help dialog with all available shortcuts.\n\n"
             "Basic navigation:\n"
@@ -479,7 +1428,7 @@ class MarkdownStorage:
             "- H/L: Move item between columns"
         )
 
-        item2 = todo_col.add_item("Explore markdown files", todo_col.id)
+        item2 = board.add_item(todo_col.id, "Explore markdown files")
         item2.description = (
             "Your boards are stored as markdown files in the data/boards/ directory.\n\n"
             "Each board has its own folder with:\n"
@@ -488,7 +1437,7 @@ class MarkdownStorage:
             "- Item files in items/ subfolders"
         )
 
-        item3 = progress_col.add_item("Create your first board", progress_col.id)
+        item3 = board.add_item(progress_col.id, "Create your first board")
         item3.description = (
             "Try creating a new board by:\n"
             "1. Exiting MKanban (press 'q')\n"
@@ -496,14 +1445,14 @@ class MarkdownStorage:
             "3. Or modify this sample board to suit your needs"
         )
 
-        item4 = review_col.add_item("Organize with parents", review_col.id)
+        item4 = board.add_item(review_col.id, "Organize with parents")
         item4.description = (
             "Parents help organize related items across columns.\n\n"
             "Toggle parent grouping with 'p' to see items grouped by their parent.\n"
             "Items with the same parent are shown together regardless of column."
         )
 
-        item5 = done_col.add_item("Install MKanban", done_col.id)
+        item5 = board.add_item(done_col.id, "Install MKanban")
         item5.description = "Great! You've successfully installed and launched MKanban."
 
         return board
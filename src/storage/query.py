@@ -0,0 +1,522 @@
+"""Filter and sort items across boards with a small expression language.
+
+    parent = "Epic" and column = "In Progress" and updated_at < 14d ago
+    title ~ bug or not parent = none sort by updated_at desc, title limit 20
+
+Fields are board, column, parent, title, id, created_at and updated_at.
+Operators are = and != (case-insensitive), ~ (contains) and < <= > >=.
+Dates are ISO dates or durations like 14d, 2w, 3h or 30m, meaning that long
+before now ("ago" is optional). ``parent = none`` matches items without one.
+
+Queries are answered from the cheapest file that can decide them: board
+names from the catalog (kanban.md), columns from kanban.md links, title and
+parent from column.md links. An item file is only read once the link can
+no longer rule the item out. Conditions are evaluated with three-valued
+logic, where a field that is not known yet at a stage is "unknown".
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from ..models.board import Board
+from ..models.column import Column
+from ..models.item import Item
+from .markdown_storage import MarkdownStorage
+
+FIELDS = ("board", "column", "parent", "title", "id", "created_at", "updated_at")
+DATE_FIELDS = ("created_at", "updated_at")
+
+DURATION_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+_TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>!=|<=|>=|=|~|<|>)
+      | (?P<paren>[(),])
+      | (?P<word>[^\s()=!~<>,"']+)
+    )""",
+    re.VERBOSE,
+)
+_DURATION_PATTERN = re.compile(r"^(\d+)([mhdw])$")
+
+
+class QueryError(ValueError):
+    pass
+
+
+class _Unknown:
+    def __repr__(self) -> str:
+        return "UNKNOWN"
+
+
+# A field whose value is not known at the current stage
+UNKNOWN: Any = _Unknown()
+
+Row = dict[str, Any]
+
+
+@dataclass
+class Comparison:
+    field: str
+    op: str
+    value: Any
+
+    def evaluate(self, row: Row) -> Optional[bool]:
+        actual = row.get(self.field, UNKNOWN)
+        if actual is UNKNOWN:
+            return None
+
+        expected = self.value
+        if actual is None or expected is None:
+            if self.op == "=":
+                return actual is expected
+            if self.op == "!=":
+                return actual is not expected
+            return False
+
+        if isinstance(actual, str):
+            actual = actual.lower()
+        if self.op == "=":
+            return actual == expected
+        if self.op == "!=":
+            return actual != expected
+        if self.op == "~":
+            return expected in actual
+        try:
+            if self.op == "<":
+                return actual < expected
+            if self.op == "<=":
+                return actual <= expected
+            if self.op == ">":
+                return actual > expected
+            return actual >= expected
+        except TypeError:
+            return False
+
+
+@dataclass
+class And:
+    terms: list
+
+    def evaluate(self, row: Row) -> Optional[bool]:
+        result: Optional[bool] = True
+        for term in self.terms:
+            value = term.evaluate(row)
+            if value is False:
+                return False
+            if value is None:
+                result = None
+        return result
+
+
+@dataclass
+class Or:
+    terms: list
+
+    def evaluate(self, row: Row) -> Optional[bool]:
+        result: Optional[bool] = False
+        for term in self.terms:
+            value = term.evaluate(row)
+            if value is True:
+                return True
+            if value is None:
+                result = None
+        return result
+
+
+@dataclass
+class Not:
+    term: Any
+
+    def evaluate(self, row: Row) -> Optional[bool]:
+        value = self.term.evaluate(row)
+        return None if value is None else not value
+
+
+@dataclass
+class Query:
+    condition: Optional[Any] = None
+    # (field, descending)
+    sort: list[tuple[str, bool]] = field(default_factory=list)
+    limit: Optional[int] = None
+
+    def matches(self, row: Row) -> Optional[bool]:
+        """True or False once decided; None while a needed field is unknown."""
+        if self.condition is None:
+            return True
+        return self.condition.evaluate(row)
+
+    def required_ids(self) -> Optional[set[str]]:
+        """The ids a matching item must have one of, or None for any id."""
+        return _required_ids(self.condition)
+
+
+def _required_ids(condition: Any) -> Optional[set[str]]:
+    if isinstance(condition, Comparison):
+        if condition.field == "id" and condition.op == "=":
+            return {condition.value} if isinstance(condition.value, str) else set()
+        return None
+    if isinstance(condition, And):
+        ids = None
+        for term in condition.terms:
+            term_ids = _required_ids(term)
+            if term_ids is not None:
+                ids = term_ids if ids is None else ids & term_ids
+        return ids
+    if isinstance(condition, Or):
+        ids = set()
+        for term in condition.terms:
+            term_ids = _required_ids(term)
+            if term_ids is None:
+                return None
+            ids |= term_ids
+        return ids
+    return None
+
+
+@dataclass
+class QueryResult:
+    board: str
+    column: str
+    parent: Optional[str]
+    item: Item
+
+    def row(self) -> Row:
+        return {
+            "board": self.board,
+            "column": self.column,
+            "parent": self.parent,
+            "title": self.item.title,
+            "id": self.item.id,
+            "created_at": self.item.created_at,
+            "updated_at": self.item.updated_at,
+        }
+
+    def to_json(self) -> dict[str, Any]:
+        row = self.row()
+        for name in DATE_FIELDS:
+            row[name] = row[name].isoformat()
+        return row
+
+
+@dataclass
+class QueryStats:
+    """What a query had to read, for ``mkanban query --explain``."""
+
+    boards: int = 0
+    boards_read: int = 0
+    columns: int = 0
+    columns_read: int = 0
+    links: int = 0
+    item_files_read: int = 0
+    matches: int = 0
+
+
+def parse_query(text: str, now: Optional[datetime] = None) -> Query:
+    return _Parser(text, now or datetime.now()).parse()
+
+
+class _Parser:
+    def __init__(self, text: str, now: datetime):
+        self.now = now
+        self.tokens: list[tuple[str, str]] = []
+        position = 0
+        text = text.strip()
+        while position < len(text):
+            match = _TOKEN_PATTERN.match(text, position)
+            if not match or match.end() == position:
+                raise QueryError(f"Unexpected input at: {text[position:]!r}")
+            kind = match.lastgroup or "word"
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+            while position < len(text) and text[position].isspace():
+                position += 1
+        self.index = 0
+
+    def _peek(self) -> Optional[tuple[str, str]]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _peek_word(self) -> Optional[str]:
+        token = self._peek()
+        return token[1].lower() if token and token[0] == "word" else None
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise QueryError("Unexpected end of query")
+        self.index += 1
+        return token
+
+    def parse(self) -> Query:
+        query = Query()
+        if self._peek() and self._peek_word() not in ("sort", "limit"):
+            query.condition = self._or()
+
+        if self._peek_word() == "sort":
+            self._next()
+            if self._peek_word() != "by":
+                raise QueryError("Expected 'by' after 'sort'")
+            self._next()
+            query.sort = self._sort_keys()
+
+        if self._peek_word() == "limit":
+            self._next()
+            _, value = self._next()
+            if not value.isdigit():
+                raise QueryError(f"Limit must be a number, not {value!r}")
+            query.limit = int(value)
+
+        if self._peek() is not None:
+            raise QueryError(f"Unexpected {self._peek()[1]!r}")
+        return query
+
+    def _sort_keys(self) -> list[tuple[str, bool]]:
+        keys = []
+        while True:
+            _, name = self._next()
+            name = self._field(name)
+            descending = False
+            if self._peek_word() in ("asc", "desc"):
+                descending = self._next()[1].lower() == "desc"
+            keys.append((name, descending))
+            if self._peek() != ("paren", ","):
+                return keys
+            self._next()
+
+    def _or(self):
+        terms = [self._and()]
+        while self._peek_word() == "or":
+            self._next()
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else Or(terms)
+
+    def _and(self):
+        terms = [self._not()]
+        while self._peek_word() == "and":
+            self._next()
+            terms.append(self._not())
+        return terms[0] if len(terms) == 1 else And(terms)
+
+    def _not(self):
+        if self._peek_word() == "not":
+            self._next()
+            return Not(self._not())
+        if self._peek() == ("paren", "("):
+            self._next()
+            term = self._or()
+            if self._next() != ("paren", ")"):
+                raise QueryError("Expected ')'")
+            return term
+        return self._comparison()
+
+    def _comparison(self) -> Comparison:
+        kind, name = self._next()
+        if kind != "word":
+            raise QueryError(f"Expected a field name, not {name!r}")
+        name = self._field(name)
+
+        kind, op = self._next()
+        if kind != "op":
+            raise QueryError(f"Expected an operator after {name}, not {op!r}")
+
+        kind, raw = self._next()
+        if kind not in ("word", "string"):
+            raise QueryError(f"Expected a value after {name} {op}")
+        value = self._value(name, op, raw, kind == "string")
+        return Comparison(name, op, value)
+
+    def _field(self, name: str) -> str:
+        name = name.lower()
+        if name not in FIELDS:
+            raise QueryError(f"Unknown field {name!r}; use one of {', '.join(FIELDS)}")
+        return name
+
+    def _value(self, name: str, op: str, raw: str, quoted: bool) -> Any:
+        if quoted:
+            raw = re.sub(r"\\(.)", r"\1", raw[1:-1])
+
+        if name in DATE_FIELDS:
+            if op == "~":
+                raise QueryError(f"{name} cannot be matched with ~")
+            if self._peek_word() == "ago":
+                self._next()
+            duration = _DURATION_PATTERN.match(raw.lower())
+            if duration:
+                amount, unit = duration.groups()
+                return self.now - timedelta(**{DURATION_UNITS[unit]: int(amount)})
+            try:
+                return datetime.fromisoformat(raw)
+            except ValueError:
+                raise QueryError(f"Invalid date for {name}: {raw!r}") from None
+
+        if name == "parent" and not quoted and raw.lower() == "none":
+            if op not in ("=", "!="):
+                raise QueryError("parent none only works with = and !=")
+            return None
+        return raw.lower()
+
+
+class QueryEngine:
+    """Run a query over every board of a storage and stream the matches."""
+
+    def __init__(self, storage: MarkdownStorage):
+        self.storage = storage
+        self.stats = QueryStats()
+
+    def run(self, query: Query) -> Iterator[QueryResult]:
+        if not query.sort:
+            results = self._scan(query)
+            if query.limit is not None:
+                results = (r for _, r in zip(range(query.limit), results))
+            yield from results
+            return
+
+        results = list(self._scan(query))
+        for name, descending in reversed(query.sort):
+            results.sort(key=lambda r: _sort_key(r.row()[name]), reverse=descending)
+        yield from results[: query.limit]
+
+    def _scan(self, query: Query) -> Iterator[QueryResult]:
+        ids = query.required_ids()
+        found: set[str] = set()
+        if ids is not None:
+            # Files named after the id, or where this process last read the
+            # item, are found without reading the other item files
+            for board, column, column_dir in self._columns(query):
+                yield from self._lookup(query, board, column, column_dir, ids, found)
+                if found == ids:
+                    return
+
+        for board, column, column_dir in self._columns(query):
+            yield from self._read_links(query, board, column, column_dir, ids, found)
+            if ids is not None and found >= ids:
+                return
+
+    def _columns(self, query: Query) -> Iterator[tuple[Board, Column, Path]]:
+        """The columns whose board and column name do not rule the query out."""
+        stats = self.stats
+        for summary in self.storage.load_board_catalog():
+            stats.boards += 1
+            if query.matches({"board": summary.name}) is False:
+                continue
+
+            outline = self.storage.load_board_outline(summary.kanban_file)
+            if outline is None:
+                continue
+            stats.boards_read += 1
+            board, column_dirs = outline
+
+            for column in board.columns:
+                stats.columns += 1
+                if query.matches({"board": board.name, "column": column.name}) is False:
+                    continue
+
+                stats.columns_read += 1
+                yield board, column, column_dirs[column.id]
+
+    def _lookup(
+        self,
+        query: Query,
+        board: Board,
+        column: Column,
+        column_dir: Path,
+        ids: set[str],
+        found: set[str],
+    ) -> Iterator[QueryResult]:
+        links: Optional[dict[str, tuple[str, Optional[str]]]] = None
+        for item_id in sorted(ids - found):
+            item_file = self.storage._find_item_file_by_id(
+                column_dir / "items", item_id, scan=False
+            )
+            if item_file is None:
+                continue
+
+            if links is None:
+                links = {
+                    filename: (title, parent_name)
+                    for title, filename, parent_name in self.storage.read_item_links(
+                        column_dir / "column.md"
+                    )
+                }
+                self.stats.links += len(links)
+            if item_file.stem not in links:
+                # Not linked, so not on the board
+                continue
+
+            title, parent_name = links[item_file.stem]
+            self.stats.item_files_read += 1
+            item = self.storage.load_linked_item(item_file, title, column.id)
+            if not item or item.id in found:
+                continue
+            found.add(item.id)
+
+            result = self._result(board, column, parent_name, item)
+            if query.matches(result.row()):
+                self.stats.matches += 1
+                yield result
+
+    def _read_links(
+        self,
+        query: Query,
+        board: Board,
+        column: Column,
+        column_dir: Path,
+        ids: Optional[set[str]],
+        found: set[str],
+    ) -> Iterator[QueryResult]:
+        stats = self.stats
+        known: Row = {"board": board.name, "column": column.name}
+        titles_cache: dict[Path, dict[str, Item]] = {}
+        seen: set[str] = set()
+        for title, filename, parent_name in self.storage.read_item_links(
+            column_dir / "column.md"
+        ):
+            stats.links += 1
+            # Loading takes the parent from the link when the board
+            # knows it; otherwise the file decides, so it is unknown
+            link_parent = board.get_parent_by_name(parent_name or "")
+            link_row = {**known, "title": title}
+            if link_parent:
+                link_row["parent"] = link_parent.name
+            if query.matches(link_row) is False:
+                continue
+
+            stats.item_files_read += 1
+            item = self.storage.load_linked_item(
+                column_dir / "items" / f"{filename}.md",
+                title,
+                column.id,
+                titles_cache,
+            )
+            if not item or item.id in seen or item.id in found:
+                continue
+            seen.add(item.id)
+            if ids is not None and item.id in ids:
+                found.add(item.id)
+
+            result = self._result(board, column, parent_name, item)
+            if query.matches(result.row()):
+                stats.matches += 1
+                yield result
+
+    def _result(
+        self, board: Board, column: Column, parent_name: Optional[str], item: Item
+    ) -> QueryResult:
+        parent = board.get_parent_by_name(parent_name or "")
+        if parent is None and item.parent_id:
+            parent = board.get_parent_by_id(item.parent_id)
+        return QueryResult(
+            board.name, column.name, parent.name if parent else None, item
+        )
+
+
+def _sort_key(value: Any) -> tuple:
+    # Missing values sort first; strings compare case-insensitively
+    if value is None:
+        return (0, "")
+    if isinstance(value, str):
+        return (1, value.lower())
+    return (1, value)
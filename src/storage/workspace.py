@@ -0,0 +1,203 @@
+"""Find the data dirs of a workspace and the boards in them.
+
+A workspace is a directory tree, such as the notes tree ``script.sh`` maps
+tmux sessions into, with mkanban data dirs anywhere below its root. A data
+dir is any directory holding a ``boards/`` directory. Data dirs may nest:
+one data dir can hold the boards of a session and other data dirs as well.
+
+The scan is kept in a manifest with the mtime of every directory. A
+directory's mtime only changes when entries are added, removed or renamed
+in it. An unchanged directory reuses its child list from the manifest, and
+an unchanged kanban.md reuses its board summary. A repeat scan therefore
+costs one stat per directory plus reads for what changed, instead of
+listing the whole tree.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..models.board_summary import BoardSummary
+from .markdown_storage import MarkdownStorage
+
+DEFAULT_MANIFEST_DIR = Path.home() / ".mkanban" / "workspaces"
+MANIFEST_VERSION = 1
+
+# Directories that never hold data dirs, besides hidden ones
+SKIPPED_DIRS = {"node_modules", "__pycache__", "venv"}
+
+
+@dataclass
+class WorkspaceBoard:
+    data_dir: Path
+    summary: BoardSummary
+
+    @property
+    def name(self) -> str:
+        return self.summary.name
+
+
+@dataclass
+class WorkspaceStats:
+    """What the last scan had to do, for ``mkanban workspace list --stats``."""
+
+    dirs: int = 0
+    dirs_listed: int = 0
+    data_dirs: int = 0
+    boards: int = 0
+    boards_read: int = 0
+
+
+class Workspace:
+    def __init__(self, root: Path, manifest_file: Optional[Path] = None):
+        self.root = Path(root).expanduser().resolve()
+        self.manifest_file = manifest_file or default_manifest_file(self.root)
+        self.stats = WorkspaceStats()
+        self._manifest = self._load_manifest()
+
+    def scan(self) -> list[WorkspaceBoard]:
+        """Bring the manifest up to date and return every board, by data dir."""
+        self.stats = WorkspaceStats()
+        old_dirs: dict[str, Any] = self._manifest["dirs"]
+        old_data_dirs: dict[str, Any] = self._manifest["data_dirs"]
+        dirs: dict[str, Any] = {}
+        data_dirs: dict[str, Any] = {}
+
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            path = self.root / relative
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            self.stats.dirs += 1
+
+            entry = old_dirs.get(relative)
+            if entry is None or entry["mtime_ns"] != mtime_ns:
+                entry = {"mtime_ns": mtime_ns, "children": self._list_children(path)}
+                self.stats.dirs_listed += 1
+            dirs[relative] = entry
+
+            for child in entry["children"]:
+                if child == "boards":
+                    data_dirs[relative] = self._scan_data_dir(
+                        path, old_data_dirs.get(relative)
+                    )
+                else:
+                    stack.append(f"{relative}/{child}" if relative else child)
+
+        self._manifest = {
+            "version": MANIFEST_VERSION,
+            "root": str(self.root),
+            "dirs": dirs,
+            "data_dirs": data_dirs,
+        }
+        self._save_manifest()
+        return self.boards()
+
+    def boards(self) -> list[WorkspaceBoard]:
+        """Boards as of the last scan, without touching the tree."""
+        boards = []
+        for relative, data_dir in sorted(self._manifest["data_dirs"].items()):
+            for board in data_dir["boards"].values():
+                summary = BoardSummary.model_validate(board["summary"])
+                boards.append(WorkspaceBoard(self.root / relative, summary))
+        return boards
+
+    def search(self, text: str) -> list[WorkspaceBoard]:
+        """Boards whose name, description or data dir contains ``text``."""
+        text = text.lower()
+        return [
+            board
+            for board in self.scan()
+            if text in board.name.lower()
+            or text in board.summary.description.lower()
+            or text in self.relative_name(board.data_dir).lower()
+        ]
+
+    def relative_name(self, data_dir: Path) -> str:
+        return data_dir.relative_to(self.root).as_posix()
+
+    def _list_children(self, path: Path) -> list[str]:
+        children = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if (
+                        not entry.name.startswith(".")
+                        and entry.name not in SKIPPED_DIRS
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        children.append(entry.name)
+        except OSError:
+            pass
+        return sorted(children)
+
+    def _scan_data_dir(self, path: Path, old: Optional[dict[str, Any]]) -> dict:
+        self.stats.data_dirs += 1
+        boards_dir = path / "boards"
+        try:
+            boards_mtime_ns = os.stat(boards_dir).st_mtime_ns
+        except OSError:
+            return {"mtime_ns": 0, "board_dirs": [], "boards": {}}
+        self.stats.dirs += 1
+
+        if old is not None and old["mtime_ns"] == boards_mtime_ns:
+            board_dirs = old["board_dirs"]
+        else:
+            board_dirs = self._list_children(boards_dir)
+            self.stats.dirs_listed += 1
+
+        old_boards = old["boards"] if old else {}
+        boards = {}
+        storage: Optional[MarkdownStorage] = None
+        for name in board_dirs:
+            kanban_file = boards_dir / name / "kanban.md"
+            try:
+                mtime_ns = os.stat(kanban_file).st_mtime_ns
+            except OSError:
+                continue
+
+            board = old_boards.get(name)
+            if board is None or board["mtime_ns"] != mtime_ns:
+                storage = storage or MarkdownStorage(path)
+                summary = storage.read_board_summary(kanban_file)
+                self.stats.boards_read += 1
+                if summary is None:
+                    continue
+                board = {
+                    "mtime_ns": mtime_ns,
+                    "summary": summary.model_dump(mode="json"),
+                }
+            boards[name] = board
+            self.stats.boards += 1
+
+        return {"mtime_ns": boards_mtime_ns, "board_dirs": board_dirs, "boards": boards}
+
+    def _load_manifest(self) -> dict[str, Any]:
+        empty = {"version": MANIFEST_VERSION, "dirs": {}, "data_dirs": {}}
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        root = manifest.get("root")
+        if manifest.get("version") != MANIFEST_VERSION or root != str(self.root):
+            return empty
+        return manifest
+
+    def _save_manifest(self) -> None:
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.manifest_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f)
+        os.replace(temp_file, self.manifest_file)
+
+
+def default_manifest_file(root: Path) -> Path:
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return DEFAULT_MANIFEST_DIR / f"{digest}.json"
@@ -0,0 +1,108 @@
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+logger = logging.getLogger("mkanban.writer")
+
+
+@dataclass
+class WriteJob:
+    key: str
+    run: Callable[[], bool]
+    on_failure: Optional[Callable[[Optional[Exception]], None]] = None
+    on_success: Optional[Callable[[], None]] = None
+    cancelled: bool = field(default=False, compare=False)
+
+
+class WriteQueue:
+    """Apply storage writes on one background thread, in submission order.
+
+    A job fails when it raises or returns False. Its ``on_failure`` callback
+    runs on the writer thread, and jobs queued or submitted later under the
+    same key are dropped until ``resume(key)``, since those writes build on
+    the one that failed.
+    """
+
+    def __init__(self, name: str = "mkanban-writer"):
+        self.name = name
+        self._jobs: deque[WriteJob] = deque()
+        self._condition = threading.Condition()
+        self._running: Optional[WriteJob] = None
+        self._thread: Optional[threading.Thread] = None
+        self._failed: set[str] = set()
+
+    def submit(
+        self,
+        key: str,
+        run: Callable[[], bool],
+        on_failure: Optional[Callable[[Optional[Exception]], None]] = None,
+        on_success: Optional[Callable[[], None]] = None,
+    ) -> WriteJob:
+        job = WriteJob(key, run, on_failure, on_success)
+        with self._condition:
+            if key in self._failed:
+                job.cancelled = True
+                return job
+
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._work, name=self.name, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return job
+
+    def resume(self, key: str) -> None:
+        with self._condition:
+            self._failed.discard(key)
+
+    def pending(self, key: Optional[str] = None) -> int:
+        with self._condition:
+            jobs = [*self._jobs, *([self._running] if self._running else [])]
+            return sum(1 for job in jobs if key is None or job.key == key)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted job has run; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._jobs and self._running is None, timeout
+            )
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._jobs)
+                job = self._running = self._jobs.popleft()
+
+            error: Optional[Exception] = None
+            try:
+                succeeded = bool(job.run())
+            except Exception as e:
+                succeeded = False
+                error = e
+
+            try:
+                if succeeded:
+                    if job.on_success:
+                        job.on_success()
+                else:
+                    self._cancel_queued(job.key)
+                    if job.on_failure:
+                        job.on_failure(error)
+            except Exception:
+                logger.exception("write callback for %s failed", job.key)
+
+            with self._condition:
+                self._running = None
+                self._condition.notify_all()
+
+    def _cancel_queued(self, key: str) -> None:
+        with self._condition:
+            self._failed.add(key)
+            for queued in self._jobs:
+                if queued.key == key:
+                    queued.cancelled = True
+            self._jobs = deque(job for job in self._jobs if not job.cancelled)
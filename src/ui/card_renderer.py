@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import Optional
+
+from rich.console import Console
+from rich.text import Text
+
+CardKey = tuple[str, Optional[str], int, int]
+
+
+class CardRenderer:
+    """Builds the Rich text shown on a board card and caches it.
+
+    A card only shows the item title and its parent, so there is no need to
+    parse markdown for it. The title is wrapped to the card width and cut
+    with an ellipsis when it does not fit above the parent line.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._cache: OrderedDict[CardKey, Text] = OrderedDict()
+        self._console = Console(width=80, color_system=None, legacy_windows=False)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def render(
+        self, title: str, parent_name: Optional[str], width: int, height: int
+    ) -> Text:
+        key = (title, parent_name, width, height)
+        text = self._cache.get(key)
+        if text is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return text
+
+        self.misses += 1
+        text = self._build(title, parent_name, width, height)
+        self._cache[key] = text
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def _build(
+        self, title: str, parent_name: Optional[str], width: int, height: int
+    ) -> Text:
+        title_lines = height
+        if parent_name:
+            title_lines -= 2
+
+        text = Text(overflow="ellipsis", no_wrap=True)
+        if width > 0 and title_lines > 0:
+            lines = Text(title).wrap(self._console, width)
+            for index, line in enumerate(lines[:title_lines]):
+                line.rstrip()
+                if index == title_lines - 1 and len(lines) > title_lines:
+                    line.truncate(width - 1)
+                    line.append("…")
+                text.append_text(line)
+                text.append("\n")
+        elif width <= 0:
+            text.append(f"{title}\n")
+
+        if parent_name:
+            text.append("\n")
+            text.append(f"Parent: {parent_name}", style="italic")
+        else:
+            text.rstrip()
+
+        return text
+
+
+card_renderer = CardRenderer()
@@ -0,0 +1,58 @@
+from typing import Optional
+from textual.widgets import OptionList, Static
+from textual.widgets.option_list import Option
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+
+from ...models.board_summary import BoardSummary
+
+
+class BoardPickerDialog(ModalScreen[Optional[BoardSummary]]):
+    """Pick a board from the catalog; dismisses with the chosen summary."""
+
+    def __init__(
+        self, catalog: list[BoardSummary], current_board_id: Optional[str] = None
+    ):
+        super().__init__()
+        self.catalog = catalog
+        self.current_board_id = current_board_id
+
+    def compose(self) -> ComposeResult:
+        with Vertical(classes="dialog board-picker-dialog"):
+            yield Static("Switch board", classes="dialog-title")
+            yield OptionList(
+                *(
+                    Option(f"{summary.name} ({summary.column_count} columns)")
+                    for summary in self.catalog
+                ),
+                classes="board-list",
+            )
+
+    def on_mount(self) -> None:
+        option_list = self.query_one(OptionList)
+        for index, summary in enumerate(self.catalog):
+            if summary.id == self.current_board_id:
+                option_list.highlighted = index
+                break
+        option_list.focus()
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(self.catalog[event.option_index])
+
+    def on_key(self, event) -> None:
+        option_list = self.query_one(OptionList)
+        if event.key == "j":
+            option_list.action_cursor_down()
+        elif event.key == "k":
+            option_list.action_cursor_up()
+        elif event.key == "g":
+            option_list.action_first()
+        elif event.key == "G":
+            option_list.action_last()
+        # Close dialog
+        elif event.key in ("escape", "q"):
+            self.dismiss(None)
+        else:
+            return
+        event.stop()
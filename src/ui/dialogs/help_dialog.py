@@ -19,16 +19,20 @@ class HelpDialog(ModalScreen):
 - G         : Go to last item
 
 ## Scrolling
-- Shift+J   : Scroll column down
-- Shift+K   : Scroll column up
 - Ctrl+D    : Scroll down (page)
 - Ctrl+U    : Scroll up (page)
 
 ## Item Operations
 - o         : Create new item (inline markdown editor)
 - i         : Edit item (inline markdown editor)
+- Space     : Preview item (full markdown)
 - dd        : Delete item
 - m         : Move item to different column
+- H/L       : Move item to previous/next column
+- K/J       : Move item up/down in its column
+- T/B       : Move item to top/bottom of its column
+- u         : Undo last change
+- Ctrl+R    : Redo
 
 ## Text Editing (Vim Motions)
 ### Normal Mode
@@ -73,11 +77,15 @@ class HelpDialog(ModalScreen):
 
 ## View Operations
 - p         : Toggle parent grouping
+- z         : Collapse/expand column
+- Z         : Expand all columns
+- b         : Switch board
 - w         : Save board
 - r         : Refresh view
 
 ## Other
 - g?        : Show this help
+- gm        : Memory report
 - q/Escape  : Quit
 - Ctrl+C    : Force quit""",
     ):
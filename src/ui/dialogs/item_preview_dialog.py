@@ -0,0 +1,55 @@
+from typing import Optional
+from textual.widgets import Markdown
+from textual.containers import Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+
+from ...models.item import Item
+
+
+class ItemPreviewDialog(ModalScreen):
+    """Read-only view of an item rendered as full markdown."""
+
+    def __init__(self, item: Item, parent_name: Optional[str] = None):
+        super().__init__()
+        self.item = item
+        self.parent_name = parent_name
+
+    def markdown_content(self) -> str:
+        description = (self.item.description or "").strip()
+        lines = description.split("\n")
+        if lines and lines[0].strip() == f"# {self.item.title}":
+            body = "\n".join(lines[1:]).strip()
+        else:
+            body = description
+
+        markdown_content = f"# {self.item.title}"
+        if self.parent_name:
+            markdown_content += f"\n\n*Parent: {self.parent_name}*"
+        if body:
+            markdown_content += f"\n\n{body}"
+
+        return markdown_content
+
+    def compose(self) -> ComposeResult:
+        with Vertical(classes="dialog preview-dialog"):
+            with VerticalScroll(classes="vertical-scroll"):
+                yield Markdown(self.markdown_content())
+
+    def on_key(self, event) -> None:
+        scroll_container = self.query_one(VerticalScroll)
+        if event.key == "j":
+            scroll_container.scroll_down()
+        elif event.key == "k":
+            scroll_container.scroll_up()
+        elif event.key == "ctrl+d":
+            scroll_container.scroll_page_down()
+        elif event.key == "ctrl+u":
+            scroll_container.scroll_page_up()
+        elif event.key == "g":
+            scroll_container.scroll_home()
+        elif event.key == "G":
+            scroll_container.scroll_end()
+        # Close dialog
+        elif event.key in ("escape", "q", "enter", "space"):
+            self.dismiss()
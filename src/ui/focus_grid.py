@@ -0,0 +1,172 @@
+from typing import Optional
+
+Position = tuple[str, int]
+
+
+class FocusGrid:
+    """Column x row model of the board used for vim-style focus movement.
+
+    Columns register their item ids whenever their item list changes, so
+    locating an item and answering next/previous/left/right/first/last does
+    not depend on how many cards the board has.
+    """
+
+    def __init__(self):
+        self._columns: list[str] = []
+        self._column_index: dict[str, int] = {}
+        self._rows: dict[str, list[str]] = {}
+        self._item_position: dict[str, Position] = {}
+        self._remembered_rows: dict[str, int] = {}
+        self._previous_filled: list[Optional[int]] = []
+        self._next_filled: list[Optional[int]] = []
+
+    def set_columns(self, column_ids: list[str]) -> None:
+        self._columns = list(column_ids)
+        self._column_index = {
+            column_id: index for index, column_id in enumerate(self._columns)
+        }
+        for column_id in list(self._rows):
+            if column_id not in self._column_index:
+                self.remove_column(column_id)
+        self._update_filled()
+
+    def set_rows(self, column_id: str, item_ids: list[str]) -> None:
+        for item_id in self._rows.get(column_id, []):
+            if self._item_position.get(item_id, (None,))[0] == column_id:
+                del self._item_position[item_id]
+
+        self._rows[column_id] = list(item_ids)
+        for row, item_id in enumerate(item_ids):
+            self._item_position[item_id] = (column_id, row)
+        self._update_filled()
+
+    def remove_column(self, column_id: str) -> None:
+        for item_id in self._rows.pop(column_id, []):
+            if self._item_position.get(item_id, (None,))[0] == column_id:
+                del self._item_position[item_id]
+        self._remembered_rows.pop(column_id, None)
+        self._update_filled()
+
+    def _update_filled(self) -> None:
+        count = len(self._columns)
+        self._previous_filled = [None] * count
+        self._next_filled = [None] * count
+
+        last_filled = None
+        for index, column_id in enumerate(self._columns):
+            self._previous_filled[index] = last_filled
+            if self._rows.get(column_id):
+                last_filled = index
+
+        last_filled = None
+        for index in range(count - 1, -1, -1):
+            self._next_filled[index] = last_filled
+            if self._rows.get(self._columns[index]):
+                last_filled = index
+
+    def _row_count(self, column_index: int) -> int:
+        return len(self._rows.get(self._columns[column_index], []))
+
+    def _first_filled(self) -> Optional[int]:
+        if not self._columns:
+            return None
+        if self._row_count(0):
+            return 0
+        return self._next_filled[0]
+
+    def _last_filled(self) -> Optional[int]:
+        if not self._columns:
+            return None
+        if self._row_count(len(self._columns) - 1):
+            return len(self._columns) - 1
+        return self._previous_filled[-1]
+
+    def locate(self, item_id: str) -> Optional[Position]:
+        position = self._item_position.get(item_id)
+        if position and position[0] in self._column_index:
+            return position
+        return None
+
+    def item_at(self, column_id: str, row: int) -> Optional[str]:
+        rows = self._rows.get(column_id, [])
+        return rows[row] if 0 <= row < len(rows) else None
+
+    def remember(self, item_id: str) -> None:
+        position = self.locate(item_id)
+        if position:
+            self._remembered_rows[position[0]] = position[1]
+
+    def first(self) -> Optional[Position]:
+        column_index = self._first_filled()
+        if column_index is None:
+            return None
+        return self._columns[column_index], 0
+
+    def last(self) -> Optional[Position]:
+        column_index = self._last_filled()
+        if column_index is None:
+            return None
+        return self._columns[column_index], self._row_count(column_index) - 1
+
+    def next(self, item_id: Optional[str]) -> Optional[Position]:
+        position = self.locate(item_id) if item_id else None
+        if not position:
+            return self.first()
+
+        column_id, row = position
+        column_index = self._column_index[column_id]
+        if row + 1 < self._row_count(column_index):
+            return column_id, row + 1
+
+        next_index = self._next_filled[column_index]
+        if next_index is None:
+            return None
+        return self._columns[next_index], 0
+
+    def previous(self, item_id: Optional[str]) -> Optional[Position]:
+        position = self.locate(item_id) if item_id else None
+        if not position:
+            return self.first()
+
+        column_id, row = position
+        if row > 0:
+            return column_id, row - 1
+
+        previous_index = self._previous_filled[self._column_index[column_id]]
+        if previous_index is None:
+            return None
+        return self._columns[previous_index], self._row_count(previous_index) - 1
+
+    def left(
+        self, item_id: Optional[str], column_id: Optional[str] = None
+    ) -> Optional[Position]:
+        """The card left of ``item_id``, or of ``column_id`` without an item."""
+        return self._sideways(item_id, column_id, self._previous_filled)
+
+    def right(
+        self, item_id: Optional[str], column_id: Optional[str] = None
+    ) -> Optional[Position]:
+        return self._sideways(item_id, column_id, self._next_filled)
+
+    def _sideways(
+        self,
+        item_id: Optional[str],
+        column_id: Optional[str],
+        neighbours: list[Optional[int]],
+    ) -> Optional[Position]:
+        position = self.locate(item_id) if item_id else None
+        if not position and column_id in self._column_index:
+            # e.g. a focused collapsed column, which has no rows
+            position = column_id, 0
+        if not position:
+            return None
+
+        column_id, row = position
+        target_index = neighbours[self._column_index[column_id]]
+        if target_index is None:
+            return None
+
+        target_id = self._columns[target_index]
+        row_count = self._row_count(target_index)
+        target_row = self._remembered_rows.get(target_id, row)
+        return target_id, max(0, min(target_row, row_count - 1))
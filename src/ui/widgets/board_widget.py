@@ -1,33 +1,75 @@
 from typing import Optional
 from pathlib import Path
-from textual.containers import Horizontal, Vertical
+from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.widget import Widget
+from textual.widgets import Static
 from textual.reactive import reactive
+from textual.timer import Timer
 from ...models.board import Board
+from ...models.column import Column
 from ...models.item import Item
+from ..focus_grid import FocusGrid
 from ..refresh_type import RefreshType
-from .markdown_widget import MarkDownWidget
 from .item_widget import ItemWidget
-from .column_widget import ColumnWidget
-from ...controllers.column_controller import ColumnController
-from ...controllers.item_controller import ItemController
+from .column_widget import ColumnWidget, cell_key
+from ...controllers.column_controller import ColumnController, ItemMove
+from ...controllers.history import (
+    EDITABLE_FIELDS,
+    ItemDeleteChange,
+    ItemFieldsChange,
+    ItemMoveChange,
+    ItemOrderChange,
+)
+from ...storage.file_stamp import FileStamp
+from ...utils.profiling import traced
 
 from ..dialogs.help_dialog import HelpDialog
+from ..dialogs.item_preview_dialog import ItemPreviewDialog
+
+
+class Swimlane(Vertical):
+    """One parent's row of column cells in the swimlane view."""
+
+    def __init__(self, parent_id: Optional[str], title: str, cells: list[Widget]):
+        super().__init__(classes="parent-group")
+        self.parent_id = parent_id
+        self.header = Static(title, classes="parent-header")
+        self.row = Horizontal(*cells, classes="swimlane-row")
+
+    def compose(self):
+        yield self.header
+        yield self.row
 
 
 class BoardWidget(Widget):
+    LAYOUT_DEBOUNCE = 0.1
+    COMPACT_COLUMNS = 2
+
     show_parents: reactive[bool] = reactive(False)
 
     def __init__(self):
         super().__init__(classes="board-view")
         self.board: Optional[Board] = None
         self.selected_item: Optional[Item] = None
-        self._current_column_width = 27
+        self._compact = False
+        self._item_height = 4
+        self._layout_timer: Optional[Timer] = None
+        self._columns_container: Optional[Horizontal] = None
+        self._swimlanes_container: Optional[VerticalScroll] = None
+        self._swimlanes: dict[Optional[str], Swimlane] = {}
+        self._column_widgets_by_id: dict[str, ColumnWidget] = {}
+        # (focus grid key, column index) of every rendered column or cell
+        self._grid_cells: list[tuple[str, int]] = []
+        # Parent ids of the rendered swimlanes
+        self._lane_parent_ids: list[Optional[str]] = []
+        self.focus_grid = FocusGrid()
 
     def set_board(self, board: Board) -> None:
         self.board = board
         self.refresh_board()
 
+    @traced("board_widget.refresh_board")
     def refresh_board(
         self,
         focus_item_id: Optional[str] = None,
@@ -49,68 +91,106 @@ class BoardWidget(Widget):
             self.call_after_refresh(self._restore_focus_to_item, focus_item_id)
 
     def _full_refresh(self) -> None:
-        self.remove_children()
+        container = (
+            self._swimlanes_container if self.show_parents else self._columns_container
+        )
+        if container is None:
+            # Switching views: the other view's widgets have no counterpart
+            focused_item = self.get_selected_item()
+            position = self.focus_grid.locate(focused_item.id) if focused_item else None
+
+            self._column_widgets_by_id = {}
+            self._swimlanes = {}
+            self._columns_container = None
+            self._swimlanes_container = None
+            self.remove_children()
+            if self.show_parents:
+                self._render_parent_grouped_view()
+            else:
+                self._render_column_view()
+
+            if focused_item:
+                self.call_after_refresh(self._refocus_item, focused_item, position)
+            return
 
+        focused_item = self.get_selected_item()
+        position = self.focus_grid.locate(focused_item.id) if focused_item else None
         if self.show_parents:
-            self._render_parent_grouped_view()
+            self._reconcile_swimlanes()
         else:
-            self._render_column_view()
+            self._reconcile_columns()
+
+        if position and not self._has_card(focused_item):
+            if not self._find_column_widget(position[0]):
+                position = self.focus_grid.first()
+            self._focus_position(position)
+
+    def _reconcile_columns(self) -> None:
+        """Bring the column widgets in line with the board, keyed by column id."""
+        if not self.board or self._columns_container is None:
+            return
+
+        container = self._columns_container
+        desired = sorted(self.board.columns, key=lambda c: c.position)
+        desired_ids = {column.id for column in desired}
+        existing = self._column_widgets_by_id
+
+        for column_id, column_widget in list(existing.items()):
+            if column_id not in desired_ids:
+                self._remove_widget(column_widget)
+                del existing[column_id]
+
+        ordered = []
+        self._grid_cells = []
+        for index, column in enumerate(desired):
+            items = column.get_column_items(column.id)
+            column_widget = existing.get(column.id)
+            if column_widget:
+                column_widget.update_column(self.board, column)
+                column_widget.set_items(items)
+            else:
+                column_widget = ColumnWidget(
+                    column,
+                    items,
+                    ColumnController(self.board, column, self.app.storage),
+                    self.focus_grid,
+                    item_height=self._item_height,
+                )
+                container.mount(column_widget)
+                existing[column.id] = column_widget
+            column_widget.set_class(index >= self.COMPACT_COLUMNS, "column-overflow")
+            self._grid_cells.append((column_widget.grid_key, index))
+            ordered.append(column_widget)
+
+        self.focus_grid.set_columns(self._navigable_column_ids())
+
+        self._order_children(container, ordered)
+
+    def _remove_widget(self, widget: Widget) -> None:
+        focused = self.screen.focused
+        if focused and widget in focused.ancestors_with_self:
+            self.screen.set_focus(None)
+            # Auto focus could pick a widget that is still being removed
+            self.call_after_refresh(self._focus_first)
+        widget.remove()
 
     def _refresh_items_only(self) -> None:
         if not self.board:
             return
 
-        for item_widget in self.query(ItemWidget):
-            updated_item = None
-            for column in self.board.columns:
-                for item in column.items:
-                    if item.id == item_widget.item.id:
-                        updated_item = item
-                        break
-                if updated_item:
-                    break
-
-            if updated_item:
-                item_widget.item = updated_item
-                markdown_widget = item_widget.query_one(MarkDownWidget)
-                if markdown_widget:
-                    parent_name = None
-                    if updated_item.parent_id:
-                        parent = next(
-                            (
-                                p
-                                for p in self.board.columns[0].parents
-                                if p.id == updated_item.parent_id
-                            ),
-                            None,
-                        )
-                        if parent:
-                            parent_name = parent.name
-
-                    markdown_content = updated_item.title
-                    if parent_name:
-                        markdown_content += f"\n\n*Parent: {parent_name}*"
-
-                    markdown_widget.update(markdown_content)
+        for column_widget in self.query(ColumnWidget):
+            column_widget.refresh_cards()
 
     def _refresh_columns_only(self) -> None:
         if not self.board:
             return
 
         for column_widget in self.query(ColumnWidget):
-            updated_column = None
-            for column in self.board.columns:
-                if column.id == column_widget.column.id:
-                    updated_column = column
-                    break
+            updated_column = self.board.get_column_by_id(column_widget.column.id)
 
             if updated_column:
                 column_widget.column = updated_column
-                items = self.board.get_column_by_id(updated_column.id).get_column_items(
-                    updated_column.id
-                )
-                column_widget.items = items
-                column_widget.border_title = f"{updated_column.name} ({len(items)})"
+                column_widget.reload_items()
 
     def _refresh_layout_only(self) -> None:
         pass
@@ -119,39 +199,141 @@ class BoardWidget(Widget):
         if not self.board:
             return
 
-        columns_container = Horizontal()
-        self.mount(columns_container)
-
-        for column in sorted(self.board.columns, key=lambda c: c.position):
-            items = self.board.get_column_by_id(column.id).get_column_items(column.id)
-            column_widget = ColumnWidget(
-                column,
-                items,
-                ColumnController(self.board, column, self.app.storage),
-            )
-            columns_container.mount(column_widget)
+        self._columns_container = Horizontal()
+        self.mount(self._columns_container)
+        self._reconcile_columns()
 
         # Apply responsive layout after mounting
         self.call_after_refresh(self.update_responsive_layout)
 
+    @traced("board_widget._render_parent_grouped_view")
     def _render_parent_grouped_view(self) -> None:
         if not self.board:
             return
 
-        container = Vertical()
-        self.mount(container)
+        self._swimlanes_container = VerticalScroll(classes="swimlanes")
+        self.mount(self._swimlanes_container)
+        self._reconcile_swimlanes()
 
-        parent_groups = {}
-        orphaned_items = []
+    def _reconcile_swimlanes(self) -> None:
+        """Bring the swimlanes in line with the board: a lane per parent, keyed
+        by parent id, with a cell per column, keyed by its focus grid key.
 
-        for column in self.board.columns:
-            for item in column.items:
-                if item.parent_id:
-                    if item.parent_id not in parent_groups:
-                        parent_groups[item.parent_id] = []
-                    parent_groups[item.parent_id].append(item)
+        Cells are filled from the board's parent/column group index, so
+        switching to this view does not walk every item.
+        """
+        if not self.board or self._swimlanes_container is None:
+            return
+
+        columns = sorted(self.board.columns, key=lambda c: c.position)
+        self._lane_parent_ids = self.board.get_group_parent_ids()
+        desired_keys = {
+            cell_key(column.id, parent_id, True)
+            for parent_id in self._lane_parent_ids
+            for column in columns
+        }
+        existing = self._column_widgets_by_id
+
+        for parent_id, lane in list(self._swimlanes.items()):
+            if parent_id not in self._lane_parent_ids:
+                self._remove_widget(lane)
+                del self._swimlanes[parent_id]
+                for column_widget in lane.query(ColumnWidget):
+                    existing.pop(column_widget.grid_key, None)
+        for key, column_widget in list(existing.items()):
+            if key not in desired_keys:
+                self._remove_widget(column_widget)
+                del existing[key]
+
+        lanes = []
+        self._grid_cells = []
+        for parent_id in self._lane_parent_ids:
+            lane = self._swimlanes.get(parent_id)
+            cells = []
+            new_cells = []
+            for index, column in enumerate(columns):
+                items = self.board.get_group_items(parent_id, column.id)
+                cell = existing.get(cell_key(column.id, parent_id, True))
+                if cell:
+                    cell.update_column(self.board, column)
+                    cell.set_items(items)
                 else:
-                    orphaned_items.append(item)
+                    cell = ColumnWidget(
+                        column,
+                        items,
+                        ColumnController(self.board, column, self.app.storage),
+                        self.focus_grid,
+                        item_height=self._item_height,
+                        grouped=True,
+                        parent_id=parent_id,
+                    )
+                    existing[cell.grid_key] = cell
+                    new_cells.append(cell)
+                cell.set_class(index >= self.COMPACT_COLUMNS, "column-overflow")
+                self._grid_cells.append((cell.grid_key, index))
+                cells.append(cell)
+
+            title = self._swimlane_title(parent_id)
+            if lane is None:
+                lane = Swimlane(parent_id, title, cells)
+                self._swimlanes_container.mount(lane)
+                self._swimlanes[parent_id] = lane
+            else:
+                lane.header.update(title)
+                if new_cells:
+                    lane.row.mount(*new_cells)
+                self._order_children(lane.row, cells)
+            lanes.append(lane)
+
+        self._order_children(self._swimlanes_container, lanes)
+        self.focus_grid.set_columns(self._navigable_column_ids())
+
+    def _swimlane_title(self, parent_id: Optional[str]) -> str:
+        parent = self.board.get_parent_by_id(parent_id) if parent_id else None
+        if parent:
+            parent_name = parent.name
+        elif parent_id:
+            parent_name = "Unknown Parent"
+        else:
+            parent_name = "No Parent"
+        return f"{parent_name} ({self.board.count_group_items(parent_id)})"
+
+    def _order_children(self, container: Widget, ordered: list[Widget]) -> None:
+        """Move the children of ``container`` into the order of ``ordered``."""
+        current = [child for child in container.children if child in ordered]
+        if current != ordered:
+            for previous, widget in zip(ordered, ordered[1:]):
+                container.move_child(widget, after=previous)
+
+    def visible_column_ids(self) -> list[str]:
+        """Ids of the columns at least partly on screen, left to right."""
+        screen_region = self.screen.region
+        column_ids: list[str] = []
+        for key, _ in self._grid_cells:
+            column_widget = self._column_widgets_by_id.get(key)
+            if (
+                column_widget
+                and column_widget.region.overlaps(screen_region)
+                and column_widget.column.id not in column_ids
+            ):
+                column_ids.append(column_widget.column.id)
+        return column_ids
+
+    def update_hydrated_column(self, column_id: str, renamed: dict[str, str]) -> None:
+        """Show the items of a column loaded since the skeleton was painted."""
+        if not self.board:
+            return
+
+        if self.show_parents and self.board.get_group_parent_ids() != (
+            self._lane_parent_ids
+        ):
+            # Item files named parents the column.md links did not
+            self.refresh_board()
+            return
+
+        for column_widget in list(self._column_widgets_by_id.values()):
+            if column_widget.column.id == column_id:
+                column_widget.rename_items(renamed)
 
     def toggle_parent_grouping(self) -> None:
         self.show_parents = not self.show_parents
@@ -179,27 +361,112 @@ class BoardWidget(Widget):
             if columns:
                 target_column = columns[0]
 
-        if target_column:
+        if target_column and target_column.column.collapsed:
+            key = target_column.grid_key
+            if self._expand_for_change(target_column.column):
+                # Expanding re-renders the swimlane view, so find the cell again
+                self.call_after_refresh(self._add_item_inline, key)
+        elif target_column:
             target_column.add_new_item_inline()
         else:
             self.app.notify("No column available for new item", severity="error")
 
+    def _add_item_inline(self, key: str) -> None:
+        column_widget = self._find_column_widget(key)
+        if column_widget:
+            column_widget.add_new_item_inline()
+
+    def toggle_selected_column(self) -> None:
+        """Collapse the column of the focused card, or expand a focused column."""
+        focused = self.app.focused
+        if isinstance(focused, ItemWidget):
+            column_widget = self._find_column_for_item(focused.item)
+        elif isinstance(focused, ColumnWidget):
+            column_widget = focused
+        else:
+            return
+        if column_widget:
+            self.set_column_collapsed(
+                column_widget.column,
+                not column_widget.column.collapsed,
+                focus_key=column_widget.grid_key,
+            )
+
+    def expand_all_columns(self) -> None:
+        if not self.board:
+            return
+        for column in self.board.columns:
+            if column.collapsed:
+                self.set_column_collapsed(column, False)
+
+    def set_column_collapsed(
+        self, column: Column, collapsed: bool, focus_key: Optional[str] = None
+    ) -> bool:
+        """Collapse or expand a column and keep that in its column.md.
+
+        An expanded column that was loaded collapsed gets its items from the
+        app's hydrator. ``focus_key`` is the column or cell to focus after:
+        the column itself once collapsed, its first card once expanded.
+        """
+        if not self.board or column.collapsed == collapsed:
+            return True
+
+        self.app.write_queue.drain()
+        column.collapsed = collapsed
+        try:
+            self.app.storage.save_column_metadata(self.board, column)
+        except OSError as e:
+            column.collapsed = not collapsed
+            self.app.notify(f"Error saving column: {e}", severity="error")
+            return False
+
+        if not collapsed:
+            self.app.expand_column(column)
+        self.refresh_board()
+        if focus_key:
+            self.call_after_refresh(self._focus_column, focus_key)
+        return True
+
+    def _expand_for_change(self, column: Column) -> bool:
+        """Expand a collapsed column before an item is added to it.
+
+        Its items are loaded right away, since the change is saved with them.
+        """
+        if not self.board or not column.collapsed:
+            return True
+        self.app.write_queue.drain()
+        try:
+            self.app.storage.load_column_items(self.board, column)
+        except OSError as e:
+            self.app.notify(f"Error loading column: {e}", severity="error")
+            return False
+        return self.set_column_collapsed(column, False)
+
+    def _focus_column(self, key: str) -> None:
+        column_widget = self._find_column_widget(key)
+        if column_widget and not column_widget.focus_item_at(0):
+            column_widget.focus()
+
     def _find_column_for_item(self, item: Item) -> Optional[ColumnWidget]:
-        for column_widget in self.query(ColumnWidget):
-            if column_widget.column.id == item.column_id:
-                return column_widget
-        return None
+        return self._find_column_widget(
+            cell_key(item.column_id, item.parent_id, self.show_parents)
+        )
 
+    @traced("board_widget.delete_selected_item")
     def delete_selected_item(self) -> None:
         selected = self.get_selected_item()
         if not selected:
             return
 
+        self.app.write_queue.drain()
         column = self.board.get_column_by_id(selected.column_id)
         column_controller = ColumnController(self.board, column, self.app.storage)
+        deleted = ItemDeleteChange(selected.model_copy())
         if column_controller.delete_item(selected):
+            self.app.history.record(deleted)
             self.refresh_board()
 
+    @traced("board_widget.edit_selected_item")
     def edit_selected_item(self) -> None:
         selected = self.get_selected_item()
         if not selected or not self.board:
@@ -213,6 +480,7 @@ class BoardWidget(Widget):
         if not target_column:
             return
 
+        self.app.write_queue.drain()
         item_file_path = self._get_item_file_path(selected)
         if not item_file_path or not item_file_path.exists():
             self.app.notify("Item file not found", severity="error")
@@ -220,234 +488,264 @@ class BoardWidget(Widget):
 
         import subprocess
 
+        stamp = FileStamp.of(item_file_path)
         try:
             with self.app.suspend():
                 subprocess.run(["neovide", str(item_file_path)], check=True)
-            self.refresh_board()
-
         except subprocess.CalledProcessError:
             self.app.notify("Error opening Neovim", severity="error")
         except FileNotFoundError:
             self.app.notify("Neovim not found. Please install nvim", severity="error")
+            return
 
-    async def move_right(self) -> None:
-        selected = self.get_selected_item()
-        if not selected or not self.board:
+        if stamp and stamp.matches(item_file_path):
+            return
+        self._reload_edited_item(focused_widget, item_file_path)
+
+    def _reload_edited_item(self, item_widget: ItemWidget, item_file: Path) -> None:
+        """Show the edits made to one item file, without re-rendering the board."""
+        item = item_widget.item
+        old_parent_id = item.parent_id
+        before = {name: getattr(item, name) for name in EDITABLE_FIELDS}
+        if not item_widget.item_controller.reload_from_file(item_file):
+            self.app.notify("Edited file no longer holds this item", severity="error")
             return
 
-        async def move_item(target_column_id: str) -> None:
-            items_container = self.query_one(
-                f"#column_{target_column_id.replace('-', '_')}", Vertical
-            )
+        edit = ItemFieldsChange.between(
+            item.id, before, {name: getattr(item, name) for name in EDITABLE_FIELDS}
+        )
+        if edit:
+            self.app.history.record(edit)
 
-            item = self.query_one(f"#item_{selected.id.replace('-', '_')}")
-            new_item = ItemWidget(
-                item.item,
-                item_controller=ItemController(
-                    items_container.column_controller.board,
-                    item,
-                    items_container.column_controller.storage,
-                ),
-            )
+        if self.show_parents and item.parent_id != old_parent_id:
+            # The card moves to another swimlane
+            self.refresh_board(focus_item_id=item.id)
+            return
 
-            await item.remove()
-            items_container.children[0].children[0].mount(new_item)
-            items_container.items.append(item)
-            new_item.focus()
+        column_widget = self._find_column_for_item(item)
+        if column_widget:
+            column_widget.sync_item_order(item)
+        card = column_widget.widget_for_item(item.id) if column_widget else None
+        if card:
+            card.set_item(item)
+            card.refresh()
+
+    class ItemMoveFailed(Message):
+        """Posted from the writer thread when a queued move could not be saved."""
+
+        def __init__(
+            self,
+            move: ItemMove,
+            error: Optional[Exception],
+            change: Optional[ItemMoveChange] = None,
+        ) -> None:
+            super().__init__()
+            self.move = move
+            self.error = error
+            self.change = change
+
+    @traced("board_widget.move_right")
+    def move_right(self) -> None:
+        self._move_selected_item(1)
+
+    @traced("board_widget.move_left")
+    def move_left(self) -> None:
+        self._move_selected_item(-1)
+
+    def _move_selected_item(self, offset: int) -> None:
+        """Move the card in memory right away and save it on the writer thread."""
+        selected = self.get_selected_item()
+        if not selected or not self.board:
+            return
 
-            controller = items_container.column_controller
-            controller.move_item(selected.id, target_column_id)
+        columns = sorted(self.board.columns, key=lambda c: c.position)
+        source = self.board.get_column_by_id(selected.column_id)
+        target_index = columns.index(source) + offset
+        if target_index < 0 or target_index >= len(columns):
+            return
+        target = columns[target_index]
+        if not self._expand_for_change(target):
+            return
 
-        column = None
+        source_widget = self._find_column_for_item(selected)
+        target_widget = self._find_column_widget(
+            cell_key(target.id, selected.parent_id, self.show_parents)
+        )
+        if not source_widget or not target_widget:
+            return
 
-        for index, value in enumerate(self.board.columns):
-            if value.id == selected.column_id:
-                if index == len(self.board.columns) - 1:
-                    return
-                column = self.board.columns[index + 1]
-                await move_item(column.id)
-                return
+        controller = target_widget.column_controller
+        move = controller.apply_move(selected.id, target.id)
+        if not move:
+            return
 
-    async def move_left(self) -> None:
-        selected = self.get_selected_item()
-        if not selected or not self.board:
+        change = ItemMoveChange(
+            selected.id,
+            move.source_column_id,
+            move.source_rank,
+            target.id,
+            selected.rank,
+        )
+        self.app.history.record(change)
+
+        source_widget.reload_items()
+        target_widget.reload_items()
+        self._focus_position(self.focus_grid.locate(selected.id))
+
+        self.app.write_queue.submit(
+            selected.id,
+            lambda: controller.persist_move(move),
+            on_failure=lambda error: self.post_message(
+                self.ItemMoveFailed(move, error, change)
+            ),
+        )
+
+    def on_board_widget_item_move_failed(self, message: ItemMoveFailed) -> None:
+        move = message.move
+        if message.change:
+            self.app.history.discard(message.change)
+        if not self.board or self.board.get_item_by_id(move.item.id) is not move.item:
+            self.app.write_queue.resume(move.item.id)
             return
 
-        async def move_item(target_column_id: str) -> None:
-            items_container = self.query_one(
-                f"#column_{target_column_id.replace('-', '_')}", Vertical
+        item = move.item
+        current_column_id = item.column_id
+        column_widget = self._find_column_for_item(item)
+        try:
+            reverted = column_widget and column_widget.column_controller.revert_move(
+                move
             )
-
-            item = self.query_one(f"#item_{selected.id.replace('-', '_')}")
-            await item.remove()
-
-            new_item = ItemWidget(
-                item.item,
-                item_controller=ItemController(
-                    items_container.column_controller.board,
-                    item,
-                    items_container.column_controller.storage,
-                ),
+        except OSError as e:
+            self.app.write_queue.resume(move.item.id)
+            self.app.notify(
+                f"Could not move '{move.item.title}' back: {e}; reloading the board",
+                severity="error",
             )
+            self.app.reload_board()
+            return
+        if reverted:
+            for column_id in {current_column_id, move.source_column_id}:
+                widget = self._find_column_widget(
+                    cell_key(column_id, item.parent_id, self.show_parents)
+                )
+                if widget:
+                    widget.reload_items()
+            self._focus_position(self.focus_grid.locate(move.item.id))
 
-            await item.remove()
-            items_container.children[0].children[0].mount(new_item)
-            items_container.items.append(item)
+        self.app.write_queue.resume(move.item.id)
 
-            items_container.items.append(item)
+        reason = f": {message.error}" if message.error else ""
+        self.app.notify(f"Could not move '{move.item.title}'{reason}", severity="error")
 
-            controller = items_container.column_controller
-            controller.move_item(selected.id, target_column_id)
+    def move_item_up(self) -> None:
+        self._reorder_selected_item(lambda position, count: position - 1)
 
-            new_item.focus()
+    def move_item_down(self) -> None:
+        self._reorder_selected_item(lambda position, count: position + 1)
 
-        column = None
+    def move_item_to_top(self) -> None:
+        self._reorder_selected_item(lambda position, count: 0)
 
-        for index, value in enumerate(self.board.columns):
-            if value.id == selected.column_id:
-                if index == 0:
-                    return
-                column = self.board.columns[index - 1]
-                await move_item(column.id)
-                return
+    def move_item_to_bottom(self) -> None:
+        self._reorder_selected_item(lambda position, count: count - 1)
 
-    def move_focus_up(self) -> None:
-        focused = self.app.focused
-        if not isinstance(focused, ItemWidget):
-            all_items = self.query(".item")
-            focusable = [
-                w for w in all_items if hasattr(w, "can_focus") and w.can_focus
-            ]
-            if focusable:
-                focusable[0].focus()
-                self._ensure_item_visible(focusable[0])
+    @traced("board_widget._reorder_selected_item")
+    def _reorder_selected_item(self, target_position) -> None:
+        selected = self.get_selected_item()
+        if not selected or not self.board:
             return
 
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if not focusable:
+        column = self.board.get_column_by_id(selected.column_id)
+        column_widget = self._find_column_for_item(selected)
+        if not column or not column_widget:
             return
 
-        try:
-            current_idx = focusable.index(focused)
-            if current_idx > 0:
-                next_item = focusable[current_idx - 1]
-                next_item.focus()
-                self._ensure_item_visible(next_item)
-        except (ValueError, AttributeError):
-            pass
-
-    def move_focus_down(self) -> None:
-        focused = self.app.focused
-        if not isinstance(focused, ItemWidget):
-            all_items = self.query(".item")
-            focusable = [
-                w for w in all_items if hasattr(w, "can_focus") and w.can_focus
-            ]
-            if focusable:
-                focusable[0].focus()
-                self._ensure_item_visible(focusable[0])
+        # Positions are relative to the cards shown, which in the swimlane
+        # view are only the cell's items
+        shown = column_widget.items
+        position = shown.index(selected)
+        new_position = target_position(position, len(shown))
+        if new_position < 0 or new_position >= len(shown):
             return
+        new_position = column.items.index(shown[new_position])
 
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if not focusable:
+        self.app.write_queue.drain()
+        ranks = {item.id: item.rank for item in column.items}
+        try:
+            moved = column_widget.column_controller.reorder_item(
+                selected.id, new_position
+            )
+        except OSError as e:
+            self.app.notify(f"Error reordering item: {e}", severity="error")
             return
 
-        try:
-            current_idx = focusable.index(focused)
-            if current_idx < len(focusable) - 1:
-                next_item = focusable[current_idx + 1]
-                next_item.focus()
-                self._ensure_item_visible(next_item)
-        except (ValueError, AttributeError):
-            pass
+        if moved:
+            reorder = ItemOrderChange.between(
+                selected.id, column.id, ranks, column.items
+            )
+            if reorder:
+                self.app.history.record(reorder)
+            column_widget.sync_item_order(selected)
 
-    def move_focus_left(self) -> None:
-        focused = self.app.focused
-        if not isinstance(focused, ItemWidget):
-            return
+    def _has_card(self, item: Optional[Item]) -> bool:
+        if not item or not self.board or not self.board.get_item_by_id(item.id):
+            return False
+        column_widget = self._find_column_for_item(item)
+        return bool(column_widget and column_widget.widget_for_item(item.id))
 
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if not focusable:
-            return
+    def _find_column_widget(self, column_id: str) -> Optional[ColumnWidget]:
+        return self._column_widgets_by_id.get(column_id)
 
-        try:
-            current_idx = focusable.index(focused)
-            current_column = self._get_column_for_item(focused.item)
-            for i in range(current_idx - 1, -1, -1):
-                item_column = self._get_column_for_item(focusable[i].item)
-                if item_column != current_column:
-                    focusable[i].focus()
-                    self._ensure_item_visible(focusable[i])
-                    break
-        except (ValueError, AttributeError):
-            pass
+    def _focused_item_id(self) -> Optional[str]:
+        focused = self.app.focused
+        return focused.item.id if isinstance(focused, ItemWidget) else None
 
-    def move_focus_right(self) -> None:
+    def _focused_column_key(self) -> Optional[str]:
         focused = self.app.focused
-        if not isinstance(focused, ItemWidget):
-            return
+        return focused.grid_key if isinstance(focused, ColumnWidget) else None
 
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if not focusable:
+    def _focus_position(self, position: Optional[tuple[str, int]]) -> None:
+        if position is None:
             return
 
-        try:
-            current_idx = focusable.index(focused)
-            current_column = self._get_column_for_item(focused.item)
-            for i in range(current_idx + 1, len(focusable)):
-                item_column = self._get_column_for_item(focusable[i].item)
-                if item_column != current_column:
-                    focusable[i].focus()
-                    self._ensure_item_visible(focusable[i])
-                    break
-        except (ValueError, AttributeError):
-            pass
+        column_widget = self._find_column_widget(position[0])
+        if column_widget:
+            column_widget.focus_item_at(position[1])
 
-    def move_focus_first(self) -> None:
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if focusable:
-            focusable[0].focus()
-            self._ensure_item_visible(focusable[0])
+    def on_descendant_focus(self, event) -> None:
+        if isinstance(event.widget, ItemWidget):
+            self.focus_grid.remember(event.widget.item.id)
 
-    def move_focus_last(self) -> None:
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
-        if focusable:
-            focusable[-1].focus()
-            self._ensure_item_visible(focusable[-1])
+    def move_focus_up(self) -> None:
+        self._focus_position(self.focus_grid.previous(self._focused_item_id()))
 
-    def _ensure_item_visible(self, item_widget: ItemWidget) -> None:
-        if not item_widget:
-            return
+    def move_focus_down(self) -> None:
+        self._focus_position(self.focus_grid.next(self._focused_item_id()))
 
-        scroll_containers = []
+    def move_focus_left(self) -> None:
+        self._focus_position(
+            self.focus_grid.left(self._focused_item_id(), self._focused_column_key())
+        )
 
-        for value in item_widget.ancestors:
-            for clss in value.classes:
-                if clss == "items-scroll":
-                    scroll_containers.append(value)
+    def move_focus_right(self) -> None:
+        self._focus_position(
+            self.focus_grid.right(self._focused_item_id(), self._focused_column_key())
+        )
 
-        if not scroll_containers:
-            return
+    def move_focus_first(self) -> None:
+        self._focus_position(self.focus_grid.first())
 
-        scroll_view = scroll_containers[0]
+    def move_focus_last(self) -> None:
+        self._focus_position(self.focus_grid.last())
 
-        if not hasattr(scroll_view, "scroll_to_widget"):
+    def _ensure_item_visible(self, item_widget: ItemWidget) -> None:
+        if not item_widget:
             return
 
-        try:
-            scroll_view.scroll_to_widget(item_widget, animate=False)
-        except Exception:
-            try:
-                item_region = item_widget.region
-                scroll_view.scroll_to_region(item_region, animate=False)
-            except Exception:
-                pass
+        position = self.focus_grid.locate(item_widget.item.id)
+        column_widget = self._find_column_for_item(item_widget.item)
+        if position and column_widget:
+            column_widget.scroll_to_index(position[1])
 
     def _get_column_for_item(self, item: Item) -> Optional[str]:
         return item.column_id if item else None
@@ -458,12 +756,7 @@ class BoardWidget(Widget):
             return None
 
         # Find the column containing this item
-        column = None
-        for col in self.board.columns:
-            if col.id == item.column_id:
-                column = col
-                break
-
+        column = self.board.get_column_by_id(item.column_id)
         if not column:
             return None
 
@@ -474,27 +767,57 @@ class BoardWidget(Widget):
         items_dir = board_dir / column_safe_name / "items"
 
         # Find the item file by scanning metadata for the ID
-        item_file_path = storage._find_item_file_by_id(items_dir, item.id)
+        item_file_path = storage._find_item_file_by_id(items_dir, item.id, item.title)
         return item_file_path
 
-    def call_after_refresh(self, callback, *args) -> None:
-        self.set_timer(0.01, lambda: callback(*args))
+    def _focus_first(self) -> None:
+        if self.screen.focused and self.screen.focused.is_attached:
+            if self.screen.focused in self._column_widgets_by_id.values() or (
+                isinstance(self.screen.focused, ItemWidget)
+                and self._has_card(self.screen.focused.item)
+            ):
+                return
+
+        position = self.focus_grid.first()
+        if position:
+            self._focus_position(position)
+        elif self._column_widgets_by_id:
+            next(iter(self._column_widgets_by_id.values())).focus()
+
+    def _refocus_item(self, item: Item, position: Optional[tuple[str, int]]) -> None:
+        """Focus ``item`` after a re-render, or what took its place."""
+        if self.board and self.board.get_item_by_id(item.id):
+            position = self.focus_grid.locate(item.id)
+        if not position or not self._find_column_widget(position[0]):
+            position = self.focus_grid.first()
+        self._focus_position(position)
 
     def _restore_focus_to_item(self, item_id: str) -> None:
-        all_items = self.query(".item")
-        focusable = [w for w in all_items if hasattr(w, "can_focus") and w.can_focus]
+        if not self.board:
+            return
+
+        self._focus_position(self.focus_grid.locate(item_id))
 
-        for widget in focusable:
-            if hasattr(widget, "item") and widget.item.id == item_id:
-                widget.focus()
-                self._ensure_item_visible(widget)
-                break
+    def show_item_preview(self) -> None:
+        focused = self.app.focused
+        if isinstance(focused, ItemWidget):
+            self.app.push_screen(ItemPreviewDialog(focused.item, focused.parent_name))
 
     def show_help_dialog(self) -> None:
         dialog = HelpDialog()
         self.app.push_screen(dialog)
 
+    def schedule_responsive_layout(self) -> None:
+        """Apply the responsive layout once resize events stop arriving."""
+        if self._layout_timer:
+            self._layout_timer.stop()
+        self._layout_timer = self.set_timer(
+            self.LAYOUT_DEBOUNCE, self.update_responsive_layout
+        )
+
+    @traced("board_widget.update_responsive_layout")
     def update_responsive_layout(self) -> None:
+        self._layout_timer = None
         if not self.board:
             return
 
@@ -505,46 +828,32 @@ class BoardWidget(Widget):
         if num_columns == 0:
             return
 
-        # Handle very small terminals by switching to vertical layout
-        if terminal_width < 60 and num_columns > 2:
-            self._switch_to_compact_layout()
-            return
-
-        # Calculate responsive column width
-        available_width = terminal_width - 6  # Account for padding and margins
-        column_width = max(20, min(50, available_width // num_columns))
-
-        # Ensure minimum usable width
-        if column_width < 20 and num_columns > 1:
-            column_width = max(18, available_width // min(num_columns, 3))
-
-        # Update column widths if changed
-        if column_width != self._current_column_width:
-            self._current_column_width = column_width
-            self._update_column_styles(column_width)
-
-        # Calculate responsive item heights based on terminal height
-        available_height = terminal_height - 8  # Account for headers, borders, footer
-        max_items_per_column = max(1, available_height // 4)  # 4 lines per item minimum
-        item_height = max(3, min(12, available_height // max(max_items_per_column, 3)))
-
-        self._update_item_styles(item_height)
-
-    def _switch_to_compact_layout(self) -> None:
-        # For very narrow terminals, make columns stack or show fewer at once
-        for i, column_widget in enumerate(self.query(ColumnWidget)):
-            if i < 2:  # Show only first 2 columns
-                column_widget.display = True
-                column_widget.styles.min_width = 15
-                column_widget.styles.max_width = 25
-            else:
-                column_widget.display = False
-
-    def _update_column_styles(self, width: int) -> None:
-        for column_widget in self.query(ColumnWidget):
-            column_widget.styles.min_width = width
-            column_widget.styles.max_width = width + 10
-
-    def _update_item_styles(self, height: int) -> None:
-        for item_widget in self.query(ItemWidget):
-            item_widget.styles.max_height = height
+        # Very small terminals only show the first columns
+        compact = terminal_width < 60 and num_columns > 2
+        # Account for padding and margins
+        wide = not compact and (terminal_width - 6) // num_columns >= 40
+        # Account for headers, borders and footer
+        short = terminal_height - 8 < 12
+
+        self.set_class(compact, "layout-compact")
+        self.set_class(wide, "layout-wide")
+
+        if compact != self._compact:
+            self._compact = compact
+            self.focus_grid.set_columns(self._navigable_column_ids())
+
+        # Must match the .item heights in styles.css
+        item_height = 3 if short else 4
+        if short != self.has_class("layout-short"):
+            self.set_class(short, "layout-short")
+        if item_height != self._item_height:
+            self._item_height = item_height
+            for column_widget in self._column_widgets_by_id.values():
+                column_widget.item_list.set_item_height(item_height)
+
+    def _navigable_column_ids(self) -> list[str]:
+        return [
+            key
+            for key, column_index in self._grid_cells
+            if not self._compact or column_index < self.COMPACT_COLUMNS
+        ]
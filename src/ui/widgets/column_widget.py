@@ -1,39 +1,154 @@
-from typing import List
-from textual.containers import Vertical, VerticalScroll
+from typing import List, Optional
+from textual.containers import Vertical
+from ...models.board import Board
 from ...models.column import Column
 from ...models.item import Item
 from .item_widget import ItemWidget
 from .editable_item_widget import EditableItemWidget
+from .virtual_item_list import VirtualItemList
 from ...controllers.column_controller import ColumnController
 from ...controllers.item_controller import ItemController
+from ...controllers.history import ItemAddChange
+from ..focus_grid import FocusGrid
+
+
+def cell_key(column_id: str, parent_id: Optional[str], grouped: bool) -> str:
+    """Focus grid key of a column, or of one parent's cell of it."""
+    if not grouped:
+        return column_id
+    return f"{parent_id or ''}/{column_id}"
 
 
 class ColumnWidget(Vertical):
+    """A board column, or in the swimlane view one parent's cell of it."""
+
     def __init__(
-        self, column: Column, items: List[Item], column_controller: ColumnController
+        self,
+        column: Column,
+        items: List[Item],
+        column_controller: ColumnController,
+        focus_grid: Optional[FocusGrid] = None,
+        item_height: int = 4,
+        grouped: bool = False,
+        parent_id: Optional[str] = None,
     ):
         self.column = column
-        self.items = items
+        self.items = [] if column.collapsed else items
         self.column_controller = column_controller
+        self.focus_grid = focus_grid
+        self.grouped = grouped
+        self.parent_id = parent_id
         self.editing_widget = None
         self._max_items_visible = None
 
-        super().__init__(classes="column", id=f"column_{column.id.replace('-', '_')}")
-        self.border_title = f"{column.name} ({len(items)})"
+        widget_id = f"column_{column.id}"
+        if grouped:
+            widget_id = f"column_{parent_id or 'none'}_{column.id}"
+        super().__init__(classes="column", id=widget_id.replace("-", "_"))
+        self._update_title()
         self.can_focus = True
 
+        self._sync_focus_grid()
+
+        self.item_list = VirtualItemList(
+            self.items,
+            self._make_item_widget,
+            on_focus_lost=self.focus,
+            item_height=item_height,
+            classes="items-scroll",
+        )
+
     def compose(self):
         with Vertical(classes="items-container"):
-            with VerticalScroll(classes="items-scroll"):
-                for item in self.items:
-                    yield ItemWidget(
-                        item,
-                        item_controller=ItemController(
-                            self.column_controller.board,
-                            item,
-                            self.column_controller.storage,
-                        ),
-                    )
+            yield self.item_list
+
+    def _make_item_widget(self, item: Item) -> ItemWidget:
+        return ItemWidget(
+            item,
+            item_controller=ItemController(
+                self.column_controller.board,
+                item,
+                self.column_controller.storage,
+            ),
+        )
+
+    def _update_title(self) -> None:
+        self.set_class(self.column.collapsed, "collapsed")
+        if not self.column.collapsed:
+            self.border_title = f"{self.column.name} ({len(self.items)})"
+        elif self.grouped:
+            # The column's count is not this cell's
+            self.border_title = f"▸ {self.column.name}"
+        else:
+            self.border_title = f"▸ {self.column.name} ({self.column.item_count})"
+
+    def update_column(self, board: Board, column: Column) -> None:
+        self.column = column
+        self.column_controller.board = board
+        self.column_controller.column = column
+        for item_widget in self.query(ItemWidget):
+            item_widget.item_controller.board = board
+
+    def refresh_cards(self) -> None:
+        self.item_list.refresh_window(force=True)
+
+    @property
+    def grid_key(self) -> str:
+        return cell_key(self.column.id, self.parent_id, self.grouped)
+
+    def _sync_focus_grid(self) -> None:
+        if self.focus_grid:
+            self.focus_grid.set_rows(self.grid_key, [item.id for item in self.items])
+
+    def reload_items(self) -> None:
+        if self.grouped:
+            board = self.column_controller.board
+            self.set_items(board.get_group_items(self.parent_id, self.column.id))
+        else:
+            self.set_items(self.column.get_column_items(self.column.id))
+
+    def set_items(self, items: List[Item]) -> None:
+        # A collapsed column shows no cards, so focus movement skips it
+        self.items = [] if self.column.collapsed else items
+        self._update_title()
+        self._sync_focus_grid()
+        self.item_list.set_items(self.items)
+
+    def rename_items(self, renamed: dict[str, str]) -> None:
+        self.item_list.rename_items(renamed)
+        self.reload_items()
+
+    def widget_for_item(self, item_id: str) -> Optional[ItemWidget]:
+        return self.item_list.widget_for_item(item_id)
+
+    def index_of(self, item_id: str) -> int:
+        if self.focus_grid:
+            position = self.focus_grid.locate(item_id)
+            if position and position[0] == self.grid_key:
+                return position[1]
+        return self.item_list.index_of(item_id)
+
+    def scroll_to_index(self, index: int) -> None:
+        self.item_list.scroll_to_index(index)
+
+    def focus_item_at(self, index: int, retry: bool = True) -> Optional[ItemWidget]:
+        if not self.items:
+            return None
+
+        index = max(0, min(index, len(self.items) - 1))
+        if self.item_list.is_mounted:
+            self.item_list.scroll_to_index(index)
+        widget = self.item_list.widget_for_item(self.items[index].id)
+        if widget:
+            widget.focus(scroll_visible=False)
+        elif retry:
+            # A list that has not been laid out yet cannot scroll to the card
+            self.call_after_refresh(self.focus_item_at, index, False)
+        return widget
+
+    def sync_item_order(self, item: Item) -> None:
+        self.reload_items()
+        self.item_list.scroll_to_index(self.index_of(item.id))
 
     def add_new_item_inline(self) -> None:
         if self.editing_widget:
@@ -41,8 +156,11 @@ class ColumnWidget(Vertical):
 
         def on_save(title: str, content: str):
             controller = self.column_controller
-            controller.add_item(title, self.column.id, None, content)
+            self.app.write_queue.drain()
+            item = controller.add_item(title, self.column.id, self.parent_id, content)
+            self.app.history.record(ItemAddChange(item.model_copy()))
             self._finish_editing()
+            self.reload_items()
 
         def on_cancel():
             self._finish_editing()
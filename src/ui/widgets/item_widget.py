@@ -1,10 +1,18 @@
 from typing import Optional
-from textual.widgets import Markdown
+from rich.text import Text
+from textual.widget import Widget
 from ...models.item import Item
 from ...controllers.item_controller import ItemController
+from ..card_renderer import card_renderer
 
 
-class ItemWidget(Markdown):
+class ItemWidget(Widget):
+    """A board card showing the item title and parent.
+
+    Cards are drawn from cached Rich text rather than a Markdown widget; the
+    full markdown of an item is only rendered in the preview dialog.
+    """
+
     def __init__(
         self,
         item: Item,
@@ -12,18 +20,32 @@ class ItemWidget(Markdown):
         parent_name: Optional[str] = None,
     ):
         self.item = item
-        self.parent_name = parent_name
         self.item_controller = item_controller
+        self.parent_name = parent_name or self._lookup_parent_name()
 
-        markdown_content = self.item.title
+        super().__init__(classes="item")
+        self.can_focus = True
 
-        if self.parent_name:
-            markdown_content += f"\n\n*Parent: {self.parent_name}*"
+    def _lookup_parent_name(self) -> Optional[str]:
+        if not self.item.parent_id:
+            return None
+        parent = self.item_controller.board.get_parent_by_id(self.item.parent_id)
+        return parent.name if parent else None
 
-        super().__init__(
-            markdown_content, classes="item", id=f"item_{item.id.replace('-', '_')}"
+    def render(self) -> Text:
+        size = self.content_size
+        return card_renderer.render(
+            self.item.title, self.parent_name, size.width, size.height
         )
-        self.can_focus = True
+
+    def set_item(self, item: Item, parent_name: Optional[str] = None) -> None:
+        previous = (self.item.title, self.parent_name)
+        self.item = item
+        self.item_controller.item = item
+        self.parent_name = parent_name or self._lookup_parent_name()
+
+        if (self.item.title, self.parent_name) != previous:
+            self.refresh()
 
     def on_focus(self) -> None:
         self.add_class("focused")
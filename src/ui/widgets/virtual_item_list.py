@@ -0,0 +1,161 @@
+from typing import Callable, Optional
+from textual.containers import VerticalScroll
+from textual.widget import Widget
+from ...models.item import Item
+from .item_widget import ItemWidget
+
+
+class VirtualItemList(VerticalScroll):
+    """Scrollable item list that only mounts the visible window of cards.
+
+    Cards have a fixed height, set in CSS and mirrored in ``item_height``, so
+    the rows above and below the window are represented by two spacer
+    widgets. Card widgets leaving the window are recycled for the items
+    entering it.
+    """
+
+    OVERSCAN = 4
+
+    def __init__(
+        self,
+        items: list[Item],
+        make_widget: Callable[[Item], ItemWidget],
+        on_focus_lost: Optional[Callable[[], None]] = None,
+        item_height: int = 4,
+        item_spacing: int = 1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.items = items
+        self.item_height = item_height
+        self.item_spacing = item_spacing
+        self._make_widget = make_widget
+        self._on_focus_lost = on_focus_lost
+        self._widgets: dict[str, ItemWidget] = {}
+        self._spare: list[ItemWidget] = []
+        self._top_spacer = Widget(classes="virtual-spacer")
+        self._bottom_spacer = Widget(classes="virtual-spacer")
+        self._window = (0, 0)
+
+    @property
+    def pitch(self) -> int:
+        return self.item_height + self.item_spacing
+
+    def compose(self):
+        yield self._top_spacer
+        yield self._bottom_spacer
+
+    def on_mount(self) -> None:
+        self.refresh_window()
+
+    def on_resize(self, event) -> None:
+        self.refresh_window()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if int(old_value) // self.pitch != int(new_value) // self.pitch:
+            self.refresh_window()
+
+    def _viewport_height(self) -> int:
+        height = self.scrollable_content_region.height
+        if height <= 0:
+            height = self.app.size.height
+        return height
+
+    def set_items(self, items: list[Item]) -> None:
+        self.items = items
+        self.refresh_window(force=True)
+
+    def set_item_height(self, height: int) -> None:
+        if height == self.item_height:
+            return
+        self.item_height = height
+        self.refresh_window(force=True)
+
+    def rename_items(self, renamed: dict[str, str]) -> None:
+        """Keep card widgets attached to items whose id changed in place."""
+        self._widgets = {
+            renamed.get(item_id, item_id): widget
+            for item_id, widget in self._widgets.items()
+        }
+
+    def visible_range(self) -> tuple[int, int]:
+        return self._window
+
+    def widget_for_item(self, item_id: str) -> Optional[ItemWidget]:
+        return self._widgets.get(item_id)
+
+    def index_of(self, item_id: str) -> int:
+        for index, item in enumerate(self.items):
+            if item.id == item_id:
+                return index
+        return -1
+
+    def refresh_window(self, force: bool = False) -> None:
+        if not self.is_mounted:
+            return
+
+        count = len(self.items)
+        scroll_y = int(self.scroll_y)
+        first = max(0, scroll_y // self.pitch - self.OVERSCAN)
+        last = min(
+            count,
+            (scroll_y + self._viewport_height()) // self.pitch + 1 + self.OVERSCAN,
+        )
+        if (first, last) == self._window and not force:
+            return
+        self._window = (first, last)
+
+        self._top_spacer.styles.height = first * self.pitch
+        self._bottom_spacer.styles.height = (count - last) * self.pitch
+
+        wanted = self.items[first:last]
+        wanted_ids = {item.id for item in wanted}
+
+        for item_id in [i for i in self._widgets if i not in wanted_ids]:
+            widget = self._widgets.pop(item_id)
+            if widget.has_focus and self._on_focus_lost:
+                self._on_focus_lost()
+            widget.display = False
+            self._spare.append(widget)
+
+        new_widgets = []
+        ordered = []
+        for item in wanted:
+            widget = self._widgets.get(item.id)
+            if widget is None:
+                if self._spare:
+                    widget = self._spare.pop()
+                    widget.display = True
+                else:
+                    widget = self._make_widget(item)
+                    new_widgets.append(widget)
+                self._widgets[item.id] = widget
+            widget.set_item(item)
+            ordered.append(widget)
+
+        if new_widgets:
+            self.mount(*new_widgets, before=self._bottom_spacer)
+
+        current = [
+            child
+            for child in self.children
+            if isinstance(child, ItemWidget) and child.display
+        ]
+        if current != ordered:
+            for widget in ordered:
+                self.move_child(widget, before=self._bottom_spacer)
+
+    def scroll_to_index(self, index: int) -> None:
+        if not 0 <= index < len(self.items):
+            return
+
+        top = index * self.pitch
+        bottom = top + self.item_height
+        viewport = self._viewport_height()
+
+        if top < self.scroll_y:
+            self.scroll_to(y=top, animate=False, immediate=True)
+        elif bottom > self.scroll_y + viewport:
+            self.scroll_to(y=bottom - viewport, animate=False, immediate=True)
+        self.refresh_window()
@@ -10,6 +10,8 @@ class Config:
     auto_save: bool = True
     auto_save_interval: int = 30  # seconds
     backup_count: int = 5
+    # Name item files after the item's "title" or its "id"
+    item_filenames: str = "title"
 
     theme: str = "dark"
     show_parent_colors: bool = True
@@ -30,10 +32,18 @@ class Config:
                 "focus_last": "G",
                 "new_item": "o",
                 "edit_item": "i",
+                "preview_item": "space",
                 "delete_item": "d",
+                "undo": "u",
+                "redo": "ctrl+r",
                 "move_left": "ctrl+h",
                 "move_right": "ctrl+l",
+                "move_item_up": "K",
+                "move_item_down": "J",
+                "move_item_to_top": "T",
+                "move_item_to_bottom": "B",
                 "toggle_parents": "p",
+                "switch_board": "b",
                 "save": "w",
                 "refresh": "r",
                 "help": "g?",
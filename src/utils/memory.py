@@ -0,0 +1,315 @@
+"""What loaded boards, caches and widgets cost in memory.
+
+Sizes come from walking objects with ``sys.getsizeof``. Every object is
+counted once, in the first row that reaches it, so rows add up: models
+first, then caches, then widgets. When tracemalloc is tracing, the report
+also has the total Python heap and the files that allocated most of it,
+which covers what the walk cannot attribute, e.g. Textual's render caches
+held by C objects.
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+import types
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from pydantic import BaseModel
+
+from ..models.board import Board
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Shared runtime state a walk never enters, so it is not charged to the
+# first row that happens to reference it
+_OPAQUE_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+    asyncio.AbstractEventLoop,
+    threading.Thread,
+)
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class SizeWalker:
+    """Deep ``sys.getsizeof`` that counts each object only once per walker."""
+
+    def __init__(self):
+        self._seen: set[int] = set()
+
+    def size(self, obj: Any, stop: tuple[type, ...] = ()) -> int:
+        """Bytes reachable from ``obj`` and not counted before.
+
+        Objects of the ``stop`` types are not entered, except ``obj`` itself.
+        """
+        total = 0
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if id(current) in self._seen or isinstance(current, _OPAQUE_TYPES):
+                continue
+            if stop and current is not obj and isinstance(current, stop):
+                continue
+            self._seen.add(id(current))
+            total += sys.getsizeof(current)
+
+            if isinstance(current, _ATOMIC_TYPES):
+                continue
+            if isinstance(current, dict):
+                stack.extend(current.keys())
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple, set, frozenset, deque)):
+                stack.extend(current)
+            elif isinstance(current, types.MappingProxyType):
+                # The read-only view of a dict, which it holds as a referent
+                stack.extend(gc.get_referents(current))
+            else:
+                stack.extend(_attributes(current))
+        return total
+
+
+def _attributes(obj: Any) -> list[Any]:
+    values = []
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        values.append(instance_dict)
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{cls.__name__.lstrip('_')}{name}"
+            value = getattr(obj, name, None)
+            if value is not None:
+                values.append(value)
+    return values
+
+
+@dataclass
+class MemoryRow:
+    section: str
+    name: str
+    count: int
+    size: int
+
+
+@dataclass
+class ColumnMemory:
+    board: str
+    column: str
+    items: int
+    size: int
+
+
+@dataclass
+class MemoryReport:
+    rows: list[MemoryRow] = field(default_factory=list)
+    columns: list[ColumnMemory] = field(default_factory=list)
+    items: int = 0
+    item_bytes: int = 0
+    description_bytes: int = 0
+    widget_bytes: int = 0
+    resident: Optional[int] = None
+    traced: Optional[int] = None
+    traced_peak: Optional[int] = None
+    # (file, bytes, allocations) of the largest allocators
+    allocations: list[tuple[str, int, int]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(row.size for row in self.rows)
+
+    def add(self, section: str, name: str, count: int, size: int) -> None:
+        self.rows.append(MemoryRow(section, name, count, size))
+
+    def to_json(self) -> dict[str, Any]:
+        items = self.items or 1
+        return {
+            "total": self.total,
+            "resident": self.resident,
+            "traced": self.traced,
+            "traced_peak": self.traced_peak,
+            "items": self.items,
+            "per_item": {
+                "model": self.item_bytes // items,
+                "description": self.description_bytes // items,
+                "widgets": self.widget_bytes // items,
+            },
+            "rows": [row.__dict__ for row in self.rows],
+            "columns": [column.__dict__ for column in self.columns],
+            "allocations": [
+                {"file": file, "size": size, "count": count}
+                for file, size, count in self.allocations
+            ],
+        }
+
+    def format_lines(self) -> list[str]:
+        lines = [f"{'section':<8} {'what':<36} {'objects':>8} {'size':>10}"]
+        for row in self.rows:
+            lines.append(
+                f"{row.section:<8} {row.name[:36]:<36} {row.count:>8} "
+                f"{format_size(row.size):>10}"
+            )
+        lines.append(f"{'':<8} {'total':<36} {'':>8} {format_size(self.total):>10}")
+
+        if self.columns:
+            lines += ["", f"{'board / column':<45} {'items':>8} {'size':>10}"]
+            for column in self.columns:
+                name = f"{column.board} / {column.column}"
+                lines.append(
+                    f"{name[:45]:<45} {column.items:>8} {format_size(column.size):>10}"
+                )
+
+        if self.items:
+            lines += [
+                "",
+                f"per item: {format_size(self.item_bytes // self.items)} model "
+                f"({format_size(self.description_bytes // self.items)} description)"
+                + (
+                    f", {format_size(self.widget_bytes // self.items)} widgets"
+                    if self.widget_bytes
+                    else ""
+                ),
+            ]
+
+        heap = []
+        if self.resident is not None:
+            heap.append(f"resident {format_size(self.resident)}")
+        if self.traced is not None:
+            heap.append(
+                f"traced {format_size(self.traced)} "
+                f"(peak {format_size(self.traced_peak or 0)})"
+            )
+        if heap:
+            lines += ["", ", ".join(heap)]
+        if self.allocations:
+            lines += ["", f"{'allocated in':<45} {'blocks':>8} {'size':>10}"]
+            for file, size, count in self.allocations:
+                lines.append(f"{file[-45:]:<45} {count:>8} {format_size(size):>10}")
+        return lines
+
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def measure_memory(
+    boards: Iterable[Board],
+    caches: Optional[dict[str, Any]] = None,
+    widgets: Optional[dict[str, list[Any]]] = None,
+    top: int = 10,
+) -> MemoryReport:
+    """Break down the memory of ``boards``, then ``caches`` and ``widgets``.
+
+    ``caches`` maps a name to the object holding a cache. ``widgets`` maps a
+    name, e.g. a column's, to its widget nodes; each node is sized without
+    entering other nodes or models, which have rows of their own.
+    """
+    from textual.dom import DOMNode
+
+    report = MemoryReport()
+    # Before the walk, whose own bookkeeping is not worth reporting
+    report.resident = resident_bytes()
+    if tracemalloc.is_tracing():
+        report.traced, report.traced_peak = tracemalloc.get_traced_memory()
+        report.allocations = top_allocations(top)
+
+    walker = SizeWalker()
+    boards = list(boards)
+
+    overhead = fields = descriptions = 0
+    for board in boards:
+        for column in board.columns:
+            column_size = 0
+            for item in column.items:
+                description = walker.size(item.description)
+                item_overhead = (
+                    sys.getsizeof(item)
+                    + sys.getsizeof(item.__dict__)
+                    + sys.getsizeof(item.__pydantic_fields_set__)
+                )
+                item_size = description + walker.size(item)
+                descriptions += description
+                overhead += item_overhead
+                fields += item_size - description - item_overhead
+                column_size += item_size
+            report.columns.append(
+                ColumnMemory(board.name, column.name, len(column.items), column_size)
+            )
+            report.items += len(column.items)
+
+    report.add("models", "item descriptions", report.items, descriptions)
+    report.add("models", "item fields", report.items, fields)
+    report.add("models", "pydantic model overhead", report.items, overhead)
+    report.add(
+        "models",
+        "boards, columns and parents",
+        len(boards),
+        sum(walker.size(board) for board in boards),
+    )
+    report.item_bytes = descriptions + fields + overhead
+    report.description_bytes = descriptions
+
+    for name, cache in (caches or {}).items():
+        report.add("caches", name, _count(cache), walker.size(cache))
+
+    for name, nodes in (widgets or {}).items():
+        size = sum(walker.size(node, stop=(DOMNode, BaseModel)) for node in nodes)
+        report.add("widgets", name, len(nodes), size)
+        report.widget_bytes += size
+
+    return report
+
+
+def _count(obj: Any) -> int:
+    try:
+        return len(obj)
+    except TypeError:
+        return 1
+
+
+def top_allocations(top: int) -> list[tuple[str, int, int]]:
+    """The files that allocated the most of the traced heap."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+    )
+    allocations = []
+    for stat in snapshot.statistics("filename")[:top]:
+        path = Path(stat.traceback[0].filename)
+        allocations.append(("/".join(path.parts[-3:]), stat.size, stat.count))
+    return allocations
+
+
+def resident_bytes() -> Optional[int]:
+    """Resident set size of this process, or its peak where that is all there is."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KiB elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
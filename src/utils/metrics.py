@@ -0,0 +1,273 @@
+import atexit
+import functools
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_FAMILIES = {
+    "mkanban_operations": ("counter", "Storage operations performed"),
+    "mkanban_operation_duration_seconds": (
+        "histogram",
+        "Latency of storage operations",
+    ),
+    "mkanban_files_read": ("counter", "Markdown files read"),
+    "mkanban_files_written": ("counter", "Markdown files written"),
+    "mkanban_bytes_read": ("counter", "Bytes read from markdown files"),
+    "mkanban_bytes_written": ("counter", "Bytes written to markdown files"),
+}
+
+_SAMPLE_PATTERN = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$")
+_LABEL_PATTERN = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+Labels = tuple[tuple[str, str], ...]
+SampleKey = tuple[str, Labels]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _unescape(value: str) -> str:
+    return value.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _family_of(sample_name: str) -> str:
+    for suffix in ("_total", "_bucket", "_count", "_sum"):
+        if sample_name.endswith(suffix):
+            base = sample_name[: -len(suffix)]
+            if base in METRIC_FAMILIES:
+                return base
+    return sample_name
+
+
+def parse_samples(text: str) -> dict[SampleKey, float]:
+    samples: dict[SampleKey, float] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE_PATTERN.match(line)
+        if not match:
+            continue
+        labels = tuple(
+            (key, _unescape(value))
+            for key, value in _LABEL_PATTERN.findall(match.group(2) or "")
+        )
+        try:
+            samples[(match.group(1), labels)] = float(match.group(3))
+        except ValueError:
+            continue
+    return samples
+
+
+def format_samples(samples: dict[SampleKey, float]) -> str:
+    by_family: dict[str, list[tuple[SampleKey, float]]] = {}
+    for key, value in samples.items():
+        by_family.setdefault(_family_of(key[0]), []).append((key, value))
+
+    lines = []
+    for family in sorted(by_family):
+        metric_type, help_text = METRIC_FAMILIES.get(family, ("unknown", ""))
+        lines.append(f"# TYPE {family} {metric_type}")
+        if help_text:
+            lines.append(f"# HELP {family} {help_text}")
+        for (name, labels), value in sorted(by_family[family], key=_sample_sort_key):
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+            label_part = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}{label_part} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _sample_sort_key(entry: tuple[SampleKey, float]):
+    (name, labels), _ = entry
+    plain = tuple((k, v) for k, v in labels if k != "le")
+    le = dict(labels).get("le")
+    bound = float("inf") if le in (None, "+Inf") else float(le)
+    return (plain, name, bound)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._samples: dict[SampleKey, float] = {}
+        self._flushed: dict[SampleKey, float] = {}
+        self._lock = threading.Lock()
+        self.output_file: Optional[Path] = None
+        self._timer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def increment(self, name: str, labels: dict[str, str], amount: float = 1) -> None:
+        key = (f"{name}_total", tuple(sorted(labels.items())))
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        plain = tuple(sorted(labels.items()))
+        with self._lock:
+            for bound in (*LATENCY_BUCKETS, float("inf")):
+                if value <= bound:
+                    key = (f"{name}_bucket", plain + (("le", _format_le(bound)),))
+                    self._samples[key] = self._samples.get(key, 0) + 1
+            for suffix, amount in (("_count", 1), ("_sum", value)):
+                key = (f"{name}{suffix}", plain)
+                self._samples[key] = self._samples.get(key, 0) + amount
+
+    def snapshot(self) -> dict[SampleKey, float]:
+        with self._lock:
+            return dict(self._samples)
+
+    def record_file_read(self, board: str, size: int) -> None:
+        self.increment("mkanban_files_read", {"board": board})
+        self.increment("mkanban_bytes_read", {"board": board}, size)
+
+    def record_file_written(self, board: str, size: int) -> None:
+        self.increment("mkanban_files_written", {"board": board})
+        self.increment("mkanban_bytes_written", {"board": board}, size)
+
+    def record_operation(self, operation: str, board: str, seconds: float) -> None:
+        labels = {"operation": operation, "board": board}
+        self.increment("mkanban_operations", labels)
+        self.observe("mkanban_operation_duration_seconds", labels, seconds)
+
+    def enable_textfile(self, output_file: Path, interval: float = 0) -> None:
+        """Write metrics to ``output_file`` at exit and every ``interval`` seconds."""
+        self.output_file = Path(output_file)
+        atexit.register(self.flush)
+
+        if interval > 0 and self._timer is None:
+            self._timer = threading.Thread(
+                target=self._flush_periodically, args=(interval,), daemon=True
+            )
+            self._timer.start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Add everything recorded since the last flush to the textfile."""
+        if not self.output_file:
+            return
+
+        current = self.snapshot()
+        with self._lock:
+            delta = {
+                key: value - self._flushed.get(key, 0)
+                for key, value in current.items()
+                if value != self._flushed.get(key, 0)
+            }
+            self._flushed = current
+
+        if not delta and self.output_file.exists():
+            return
+
+        merged = load_textfile(self.output_file)
+        for key, value in delta.items():
+            merged[key] = merged.get(key, 0) + value
+
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.output_file.with_name(
+            f".{self.output_file.name}.{os.getpid()}.tmp"
+        )
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(format_samples(merged))
+        os.replace(temp_file, self.output_file)
+
+
+def load_textfile(path: Path) -> dict[SampleKey, float]:
+    if not path.exists():
+        return {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_samples(f.read())
+
+
+metrics = MetricsRegistry()
+
+
+def measured(operation: str) -> Callable:
+    """Count storage calls and observe their latency.
+
+    The wrapped method's owner must provide ``_metrics_board(value)`` to turn
+    the first argument (a board, board name or path) into a board label.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                board = self._metrics_board(args[0]) if args else ""
+                metrics.record_operation(operation, board, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def summarize_operations(samples: dict[SampleKey, float]) -> list[dict]:
+    """Per (board, operation) call counts with mean and estimated p95 latency."""
+    rows: dict[Labels, dict] = {}
+    for (name, labels), value in samples.items():
+        if not name.startswith("mkanban_operation_duration_seconds"):
+            continue
+        plain = tuple((k, v) for k, v in labels if k != "le")
+        row = rows.setdefault(plain, {"count": 0.0, "sum": 0.0, "buckets": []})
+        if name.endswith("_count"):
+            row["count"] = value
+        elif name.endswith("_sum"):
+            row["sum"] = value
+        elif name.endswith("_bucket"):
+            le = dict(labels)["le"]
+            row["buckets"].append((float("inf") if le == "+Inf" else float(le), value))
+
+    summary = []
+    for labels, row in rows.items():
+        count = row["count"]
+        p95 = 0.0
+        for bound, cumulative in sorted(row["buckets"]):
+            if count and cumulative >= 0.95 * count:
+                p95 = bound
+                break
+        summary.append(
+            {
+                **dict(labels),
+                "count": int(count),
+                "mean": row["sum"] / count if count else 0.0,
+                "p95": p95,
+            }
+        )
+    return sorted(summary, key=lambda r: (r.get("board", ""), r.get("operation", "")))
+
+
+def summarize_io(samples: dict[SampleKey, float]) -> dict[str, dict[str, float]]:
+    """Per-board totals for files and bytes read and written."""
+    totals: dict[str, dict[str, float]] = {}
+    for (name, labels), value in samples.items():
+        for family in (
+            "mkanban_files_read",
+            "mkanban_files_written",
+            "mkanban_bytes_read",
+            "mkanban_bytes_written",
+        ):
+            if name == f"{family}_total":
+                board = dict(labels).get("board", "")
+                short_name = family[len("mkanban_") :]
+                board_totals = totals.setdefault(board, {})
+                board_totals[short_name] = board_totals.get(short_name, 0) + value
+    return totals
@@ -0,0 +1,173 @@
+import atexit
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+DEFAULT_PROFILE_DIR = Path.home() / ".mkanban" / "profile"
+# Spans kept for trace.json; older ones are dropped in a long session
+MAX_SPANS = 100_000
+
+
+@dataclass
+class Span:
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: dict[str, str] = field(default_factory=dict)
+
+
+def describe(value: Any, limit: int = 80) -> str:
+    """Short, log-friendly description of a traced call argument."""
+    for attr in ("name", "title"):
+        label = getattr(value, attr, None)
+        if isinstance(label, str) and hasattr(value, "id"):
+            return f"{type(value).__name__}({label!r})"
+
+    text = repr(value)
+    if len(text) > limit:
+        text = text[: limit - 3] + "..."
+    return text
+
+
+class Profiler:
+    def __init__(self, max_spans: int = MAX_SPANS):
+        self.enabled = False
+        self.output_dir: Path = DEFAULT_PROFILE_DIR
+        self.slow_threshold_ms = 100.0
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+        self._origin_ns = time.perf_counter_ns()
+        self._profile: Optional[cProfile.Profile] = None
+        self._slow_log = logging.getLogger("mkanban.slow")
+        self._dumped = False
+        self._lock = threading.Lock()
+
+    def enable(
+        self, output_dir: Optional[Path] = None, slow_threshold_ms: float = 100.0
+    ) -> None:
+        if self.enabled:
+            return
+
+        self.output_dir = Path(output_dir or DEFAULT_PROFILE_DIR).expanduser()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.slow_threshold_ms = slow_threshold_ms
+
+        handler = logging.FileHandler(self.output_dir / "slow.log", encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self._slow_log.addHandler(handler)
+        self._slow_log.setLevel(logging.INFO)
+        self._slow_log.propagate = False
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self.enabled = True
+        atexit.register(self.dump)
+
+    def record(
+        self, name: str, start_ns: int, duration_ns: int, args: dict[str, str]
+    ) -> None:
+        span = Span(name, start_ns, duration_ns, threading.get_ident(), args)
+        with self._lock:
+            self.spans.append(span)
+
+        duration_ms = duration_ns / 1_000_000
+        if duration_ms >= self.slow_threshold_ms:
+            formatted_args = ", ".join(f"{k}={v}" for k, v in args.items())
+            self._slow_log.info(f"{name} took {duration_ms:.1f}ms ({formatted_args})")
+
+    def to_chrome_trace(self) -> dict:
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.args,
+            }
+            for span in spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self) -> None:
+        if not self.enabled or self._dumped:
+            return
+        self._dumped = True
+
+        if self._profile:
+            self._profile.disable()
+            self._profile.dump_stats(str(self.output_dir / "profile.prof"))
+
+        with open(self.output_dir / "trace.json", "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+profiler = Profiler()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Record a timed span around each call while profiling is enabled."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        # Follows __wrapped__, so the names survive other decorators below
+        signature = inspect.signature(func)
+
+        def finish(start_ns: int, args: tuple, kwargs: dict) -> None:
+            duration_ns = time.perf_counter_ns() - start_ns
+            try:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+            except TypeError:
+                bound = kwargs
+            described = {}
+            for arg_name, value in bound.items():
+                parameter = signature.parameters.get(arg_name)
+                if parameter and parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                    described.update({k: describe(v) for k, v in value.items()})
+                elif arg_name != "self":
+                    described[arg_name] = describe(value)
+            profiler.record(span_name, start_ns, duration_ns, described)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not profiler.enabled:
+                    return await func(*args, **kwargs)
+
+                start_ns = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    finish(start_ns, args, kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finish(start_ns, args, kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,35 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from src.models.board import Board
+from src.storage.markdown_storage import MarkdownStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> MarkdownStorage:
+    return MarkdownStorage(tmp_path)
+
+
+@pytest.fixture
+def board(storage: MarkdownStorage) -> Board:
+    """The sample board, saved and loaded back as the app would see it."""
+    board = storage.create_sample_board("Test")
+    storage.save_board(board)
+    return reload(storage, board)
+
+
+def reload(storage: MarkdownStorage, board: Board) -> Board:
+    return storage.load_board_from_file(storage.get_kanban_file(board))
+
+
+def titles(board: Board) -> list[list[str]]:
+    return [[item.title for item in column.items] for column in board.columns]
+
+
+def strip_ranks(storage: MarkdownStorage) -> None:
+    """Drop the stored ranks, like item files written before ranks existed."""
+    for item_file in storage.boards_dir.glob("*/*/items/*.md"):
+        text = item_file.read_text(encoding="utf-8")
+        item_file.write_text(re.sub(r"\n\s*rank: .*", "", text), encoding="utf-8")
@@ -0,0 +1,78 @@
+from click.testing import CliRunner
+
+from benchmarks import storage_benchmark
+from benchmarks.generator import generate_data_dir
+from benchmarks.results import compare_to_baseline, load_results, write_results
+from src.storage.markdown_storage import MarkdownStorage
+
+
+def report(**minimums):
+    return {"results": {name: {"min": value} for name, value in minimums.items()}}
+
+
+def test_compare_flags_only_slowdowns_over_the_threshold():
+    rows = compare_to_baseline(
+        report(load=1.3, save=1.2, move=0.5),
+        report(load=1.0, save=1.0, move=1.0),
+        threshold=0.25,
+    )
+
+    assert [
+        (name, round(ratio, 2), regressed) for name, _, _, ratio, regressed in rows
+    ] == [
+        ("load", 1.3, True),
+        ("save", 1.2, False),
+        ("move", 0.5, False),
+    ]
+
+
+def test_compare_skips_operations_without_a_baseline():
+    rows = compare_to_baseline(
+        report(load=1.0, new=5.0, zero=1.0), report(load=1.0, zero=0.0), 0.25
+    )
+
+    assert [row[0] for row in rows] == ["load"]
+
+
+def test_results_round_trip(tmp_path):
+    written = write_results(tmp_path / "out" / "results.json", {"repeat": 1}, {})
+
+    assert load_results(tmp_path / "out" / "results.json") == written
+    assert load_results(tmp_path / "missing.json") is None
+
+
+def test_storage_benchmarks_time_every_operation(tmp_path):
+    names = generate_data_dir(tmp_path, 1, 2, 4, description_size=20)
+
+    results = storage_benchmark.run_storage_benchmarks(tmp_path, names, repeat=2)
+
+    assert sorted(results) == [
+        "_find_item_file_by_id",
+        "delete_item_from_column",
+        "load_board_by_name",
+        "load_boards",
+        "move_item_between_columns",
+        "save_board",
+    ]
+    assert all(result["runs"] == 2 for result in results.values())
+    # Deleted items are put back, so the data dir can be measured again
+    board = MarkdownStorage(tmp_path).load_board_by_name(names[0])
+    assert [len(column.items) for column in board.columns] == [4, 4]
+
+
+def test_storage_benchmark_without_a_baseline_skips_the_comparison(tmp_path):
+    result = CliRunner().invoke(
+        storage_benchmark.main,
+        [
+            "--boards=1",
+            "--columns=2",
+            "--items=3",
+            "--repeat=1",
+            f"--output={tmp_path / 'out.json'}",
+            f"--baseline={tmp_path / 'baseline.json'}",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "No baseline at" in result.output
+    assert load_results(tmp_path / "out.json")["config"]["items"] == 3
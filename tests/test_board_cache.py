@@ -0,0 +1,42 @@
+from src.models.board import Board
+from src.storage.board_cache import BOARD_OVERHEAD_BYTES, BoardCache
+
+
+def boards(*names):
+    return {name: Board(name=name) for name in names}
+
+
+def test_least_recently_used_board_is_evicted():
+    cache = BoardCache(max_boards=2)
+    loaded = boards("a", "b", "c")
+    cache.put("a", loaded["a"])
+    cache.put("b", loaded["b"])
+    assert cache.get("a") is loaded["a"]
+
+    cache.put("c", loaded["c"])
+
+    assert cache.keys() == ["c", "a"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_boards_over_the_size_limit_are_evicted_but_the_newest_is_kept():
+    cache = BoardCache(max_bytes=BOARD_OVERHEAD_BYTES)
+    loaded = boards("a", "b")
+    cache.put("a", loaded["a"])
+    cache.put("b", loaded["b"])
+
+    assert cache.keys() == ["b"]
+    assert cache.size == BOARD_OVERHEAD_BYTES
+
+
+def test_setdefault_keeps_the_cached_board(board):
+    cache = BoardCache()
+    cache.put("test", board)
+
+    assert cache.setdefault("test", Board(name="Test")) is board
+    assert cache.boards() == [board]
+
+    cache.discard("test")
+    assert "test" not in cache
+    assert len(cache) == 0
@@ -0,0 +1,61 @@
+from src.storage.board_hydrator import BoardHydrator
+
+from .conftest import titles
+
+
+def skeleton(storage, board):
+    return storage.load_board_skeleton(storage.get_kanban_file(board))
+
+
+def ids(board):
+    return [[item.id for item in column.items] for column in board.columns]
+
+
+def test_apply_fills_placeholders_in_place(storage, board):
+    hydrated, pending = skeleton(storage, board)
+    placeholders = [pending_item.item for pending_item in pending]
+    hydrator = BoardHydrator(storage, hydrated, pending)
+
+    renamed = {}
+    for column_id, loaded in hydrator.batches():
+        renamed.update(hydrator.apply(column_id, loaded))
+
+    assert hydrator.is_complete
+    assert hydrator.remaining == 0
+    assert ids(hydrated) == ids(board)
+    assert titles(hydrated) == titles(board)
+    assert [item.id for item in placeholders] == list(renamed.values())
+    assert all(hydrated.get_item_by_id(item.id) is item for item in placeholders)
+
+
+def test_ranks_are_applied_once_the_column_is_complete(storage, board, monkeypatch):
+    monkeypatch.setattr(BoardHydrator, "BATCH_SIZE", 1)
+    item_file = storage.boards_dir / "test" / "to-do" / "items"
+    item_file /= "learn_keyboard_shortcuts.md"
+    text = item_file.read_text(encoding="utf-8")
+    item_file.write_text(text.replace("rank: 1024.0", "rank: 9999.0"), "utf-8")
+    hydrated, pending = skeleton(storage, board)
+    to_do = hydrated.columns[0]
+    hydrator = BoardHydrator(storage, hydrated, pending)
+    hydrator.prioritize([to_do.id])
+    batches = hydrator.batches()
+
+    # Cards keep the column.md order until the column is loaded
+    hydrator.apply(*next(batches))
+    assert [item.title for item in to_do.items] == titles(board)[0]
+    assert not hydrator.is_complete
+
+    hydrator.apply(*next(batches))
+    assert [item.title for item in to_do.items] == titles(board)[0][::-1]
+    assert hydrator.remaining == 3
+
+
+def test_placeholders_without_a_file_are_dropped(storage, board):
+    hydrated, pending = skeleton(storage, board)
+    pending[0].item_file.unlink()
+    hydrator = BoardHydrator(storage, hydrated, pending)
+
+    for column_id, loaded in hydrator.batches():
+        hydrator.apply(column_id, loaded)
+
+    assert titles(hydrated) == [["Explore markdown files"], *titles(board)[1:]]
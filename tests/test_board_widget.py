@@ -0,0 +1,101 @@
+import asyncio
+
+from textual.events import Resize
+from textual.geometry import Size
+
+from src.app import MKanbanApp
+
+
+def run_app(storage, scenario):
+    async def main():
+        app = MKanbanApp(data_dir=storage.data_dir, initial_board="Test")
+        async with app.run_test(size=(160, 50)) as pilot:
+            await pilot.pause()
+            await scenario(app, pilot)
+            app.write_queue.drain()
+
+    asyncio.run(main())
+
+
+def focus(app, title):
+    board_view = app.board_view
+    item = next(
+        i for c in app.current_board.columns for i in c.items if i.title == title
+    )
+    board_view._focus_position(board_view.focus_grid.locate(item.id))
+
+
+def test_swimlane_refresh_keeps_unchanged_widgets(storage, board):
+    epic = board.add_parent("Epic")
+    done = board.columns[3]
+    board.set_item_parent(done.items[0].id, epic.id)
+    storage.save_board(board)
+
+    async def scenario(app, pilot):
+        board_view = app.board_view
+        await pilot.press("p")
+        await pilot.pause()
+        lanes = dict(board_view._swimlanes)
+        cells = dict(board_view._column_widgets_by_id)
+        assert list(lanes) == [None, epic.id]
+
+        focus(app, "Learn keyboard shortcuts")
+        await pilot.pause()
+        await pilot.press("d")
+        await pilot.pause()
+        assert app.focused.item.title == "Explore markdown files"
+        assert board_view._swimlanes == lanes
+        assert board_view._column_widgets_by_id == cells
+        assert all(
+            board_view._column_widgets_by_id[key] is cell for key, cell in cells.items()
+        )
+
+        # The lane of a parent goes with its last item, and comes back on undo
+        focus(app, "Install MKanban")
+        await pilot.pause()
+        await pilot.press("d")
+        await pilot.pause()
+        assert list(board_view._swimlanes) == [None]
+        assert board_view._swimlanes[None] is lanes[None]
+        assert len(app.query(".parent-group")) == 1
+
+        await pilot.press("u")
+        await pilot.pause()
+        assert list(board_view._swimlanes) == [None, epic.id]
+        assert board_view._swimlanes[None] is lanes[None]
+        assert len(app.query(".parent-group")) == 2
+        cell = board_view._find_column_widget(f"{epic.id}/{done.id}")
+        assert [item.title for item in cell.items] == ["Install MKanban"]
+
+    run_app(storage, scenario)
+
+
+def test_resizes_are_laid_out_once_they_stop(storage, board):
+    async def scenario(app, pilot):
+        board_view = app.board_view
+        layouts = []
+        update = board_view.update_responsive_layout
+
+        def counting():
+            layouts.append(app.size)
+            update()
+
+        board_view.update_responsive_layout = counting
+        # As fast as a terminal being dragged, so no timer fires in between
+        for width in (150, 120, 50):
+            app.post_message(Resize(Size(width, 18), Size(width, 18)))
+        await pilot.pause(board_view.LAYOUT_DEBOUNCE * 3)
+
+        assert [size.width for size in layouts] == [50]
+        assert board_view.has_class("layout-compact", "layout-short")
+        assert not board_view.has_class("layout-wide")
+        assert board_view._item_height == 3
+
+        await pilot.resize_terminal(200, 50)
+        await pilot.pause(board_view.LAYOUT_DEBOUNCE * 3)
+        assert board_view.has_class("layout-wide")
+        assert not board_view.has_class("layout-compact")
+        assert not board_view.has_class("layout-short")
+        assert board_view._item_height == 4
+
+    run_app(storage, scenario)
@@ -0,0 +1,44 @@
+from src.ui.card_renderer import CardRenderer
+
+
+def test_cards_are_cached_by_title_parent_and_size():
+    renderer = CardRenderer()
+
+    first = renderer.render("Write tests", "Epic", 20, 4)
+    assert renderer.render("Write tests", "Epic", 20, 4) is first
+    assert renderer.render("Write tests", "Epic", 30, 4) is not first
+    assert renderer.render("Write tests", None, 20, 4) is not first
+    assert renderer.render("Write more tests", "Epic", 20, 4) is not first
+    assert (renderer.hits, renderer.misses) == (1, 4)
+
+
+def test_least_recently_used_cards_are_evicted():
+    renderer = CardRenderer(max_size=2)
+    first = renderer.render("a", None, 10, 4)
+    renderer.render("b", None, 10, 4)
+    renderer.render("a", None, 10, 4)
+    renderer.render("c", None, 10, 4)
+
+    assert len(renderer) == 2
+    assert renderer.render("a", None, 10, 4) is first
+    renderer.render("b", None, 10, 4)
+    assert renderer.misses == 4
+
+
+def test_clear_drops_every_card():
+    renderer = CardRenderer()
+    first = renderer.render("a", None, 10, 4)
+
+    renderer.clear()
+
+    assert len(renderer) == 0
+    assert renderer.render("a", None, 10, 4) is not first
+
+
+def test_long_titles_are_cut_above_the_parent_line():
+    renderer = CardRenderer()
+
+    text = renderer.render("one two three four five six", "Epic", 10, 4)
+
+    assert text.plain.split("\n") == ["one two", "three fou…", "", "Parent: Epic"]
+    assert renderer.render("short", None, 10, 4).plain == "short"
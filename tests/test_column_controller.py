@@ -0,0 +1,66 @@
+import pytest
+
+from src.controllers.column_controller import ColumnController
+
+from .conftest import reload, strip_ranks, titles
+
+
+@pytest.mark.parametrize("ranked", [True, False])
+def test_revert_move_puts_the_file_back(storage, board, ranked):
+    if not ranked:
+        strip_ranks(storage)
+        board = reload(storage, board)
+    item = board.columns[0].items[0]
+    before = titles(board)
+    target = board.columns[1]
+    controller = ColumnController(board, target, storage)
+
+    applied = controller.apply_move(item.id, target.id)
+    assert controller.persist_move(applied)
+    assert controller.revert_move(applied)
+
+    assert titles(board) == before
+    assert titles(reload(storage, board)) == before
+
+
+def test_persist_move_writes_the_order_of_the_snapshot(storage, board):
+    item = board.columns[0].items[0]
+    target = board.columns[1]
+    controller = ColumnController(board, target, storage)
+
+    applied = controller.apply_move(item.id, target.id)
+    expected = titles(board)
+    # The UI thread keeps changing the board while the write is queued
+    target.items.clear()
+    board.columns[0].items.reverse()
+
+    assert controller.persist_move(applied)
+    assert titles(reload(storage, board)) == expected
+
+
+def test_persist_move_of_a_deleted_file_fails(storage, board):
+    item = board.columns[0].items[0]
+    target = board.columns[1]
+    controller = ColumnController(board, target, storage)
+
+    applied = controller.apply_move(item.id, target.id)
+    (applied.snapshot.source_dir / "items" / "learn_keyboard_shortcuts.md").unlink()
+
+    assert not controller.persist_move(applied)
+
+
+def test_revert_move_raises_when_the_file_cannot_be_moved_back(
+    storage, board, monkeypatch
+):
+    item = board.columns[0].items[0]
+    target = board.columns[1]
+    controller = ColumnController(board, target, storage)
+    applied = controller.apply_move(item.id, target.id)
+    assert controller.persist_move(applied)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage, "move_item_between_columns", fail)
+    with pytest.raises(OSError):
+        controller.revert_move(applied)
@@ -0,0 +1,102 @@
+import pytest
+
+from src.storage.item_version import WriteConflict
+from src.storage.markdown_storage import MarkdownStorage
+
+from .conftest import reload
+
+
+def item_titled(board, title):
+    return next(i for c in board.columns for i in c.items if i.title == title)
+
+
+def item_files(storage):
+    return sorted(p.name for p in storage.boards_dir.glob("*/*/items/*.md"))
+
+
+@pytest.fixture
+def other(storage):
+    """A second process writing to the same data dir."""
+    return MarkdownStorage(storage.data_dir)
+
+
+def test_fields_changed_by_each_writer_are_merged(storage, board, other):
+    theirs = reload(other, board)
+    item_titled(theirs, "Install MKanban").parent_id = None
+    item_titled(theirs, "Install MKanban").description = "their text"
+    other.save_board(theirs)
+
+    item_titled(board, "Install MKanban").rank = 5.0
+    storage.save_board(board)
+
+    merged = item_titled(reload(storage, board), "Install MKanban")
+    assert merged.description.endswith("their text")
+    assert merged.rank == 5.0
+
+
+def test_field_changed_by_both_writers_conflicts(storage, board, other):
+    theirs = reload(other, board)
+    item = item_titled(theirs, "Install MKanban")
+    item.description = "theirs"
+    other.save_item(theirs, item)
+
+    ours = item_titled(board, "Install MKanban")
+    ours.description = "ours"
+    with pytest.raises(WriteConflict) as error:
+        storage.save_item(board, ours)
+    assert error.value.conflicts == {"Install MKanban": ["description"]}
+    assert item_titled(reload(storage, board), "Install MKanban").description.endswith(
+        "theirs"
+    )
+
+
+@pytest.mark.parametrize("item_filenames", ["title", "id"])
+def test_rename_by_another_writer_survives_a_stale_save(storage, board, item_filenames):
+    storage.item_filenames = item_filenames
+    storage.rename_item_files(board)
+    files = item_files(storage)
+    writer_a = MarkdownStorage(storage.data_dir, item_filenames)
+    board_a = reload(writer_a, board)
+
+    renamed = item_titled(board_a, "Install MKanban")
+    # As the editor does, with the heading following the title
+    renamed.title = "Renamed by A"
+    renamed.description = renamed.description.replace(
+        "# Install MKanban", "# Renamed by A", 1
+    )
+    writer_a.save_board(board_a)
+
+    # B loaded before A saved, and edits another field
+    item_titled(board, "Install MKanban").description = "# Install MKanban\n\nby B"
+    storage.save_board(board)
+
+    item = item_titled(reload(storage, board), "Renamed by A")
+    assert item.description.endswith("by B")
+    assert len(item_files(storage)) == len(files)
+    if item_filenames == "title":
+        assert "renamed_by_a.md" in item_files(storage)
+
+
+def test_stale_save_does_not_bring_back_deleted_items(storage, board, other):
+    theirs = reload(other, board)
+    other.delete_item_from_column(theirs, item_titled(theirs, "Install MKanban"))
+
+    item_titled(board, "Learn keyboard shortcuts").rank = 0.5
+    with pytest.raises(WriteConflict) as error:
+        storage.save_board(board)
+    assert error.value.conflicts == {"Install MKanban": ["deleted"]}
+
+    reloaded = reload(storage, board)
+    assert [i.title for i in reloaded.columns[-1].items] == []
+    assert item_titled(reloaded, "Learn keyboard shortcuts").rank == 0.5
+
+
+def test_undo_of_own_delete_writes_the_item_back(storage, board):
+    item = item_titled(board, "Install MKanban")
+    copy = item.model_copy()
+    storage.delete_item_from_column(board, item)
+    board.remove_item(item.id)
+
+    board.insert_item(copy)
+    assert storage.add_item_to_column(board, copy)
+    assert item_titled(reload(storage, board), "Install MKanban")
@@ -0,0 +1,34 @@
+import os
+
+from src.storage.file_stamp import FileStamp
+
+
+def test_untouched_file_matches_without_hashing(tmp_path, monkeypatch):
+    path = tmp_path / "item.md"
+    path.write_text("# Title")
+    stamp = FileStamp.of(path)
+
+    monkeypatch.setattr(FileStamp, "of", None)
+    assert stamp.matches(path)
+
+
+def test_touched_file_is_compared_by_content(tmp_path):
+    path = tmp_path / "item.md"
+    path.write_text("# Title")
+    stamp = FileStamp.of(path)
+
+    os.utime(path, ns=(stamp.mtime_ns + 10**9, stamp.mtime_ns + 10**9))
+    assert stamp.matches(path)
+
+    path.write_text("# Other")
+    assert not stamp.matches(path)
+
+
+def test_missing_file_has_no_stamp_and_matches_none(tmp_path):
+    path = tmp_path / "item.md"
+    assert FileStamp.of(path) is None
+
+    path.write_text("# Title")
+    stamp = FileStamp.of(path)
+    path.unlink()
+    assert not stamp.matches(path)
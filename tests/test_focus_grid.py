@@ -0,0 +1,57 @@
+import pytest
+
+from src.ui.focus_grid import FocusGrid
+
+
+@pytest.fixture
+def grid():
+    grid = FocusGrid()
+    grid.set_columns(["todo", "empty", "doing", "done"])
+    grid.set_rows("todo", ["a", "b", "c"])
+    grid.set_rows("doing", ["d"])
+    grid.set_rows("done", ["e", "f"])
+    return grid
+
+
+def test_next_and_previous_walk_rows_then_skip_empty_columns(grid):
+    assert grid.next("b") == ("todo", 2)
+    assert grid.next("c") == ("doing", 0)
+    assert grid.next("f") is None
+    assert grid.previous("d") == ("todo", 2)
+    assert grid.previous("a") is None
+    assert grid.next(None) == ("todo", 0)
+
+
+def test_first_and_last_skip_empty_columns(grid):
+    grid.set_rows("todo", [])
+
+    assert grid.first() == ("doing", 0)
+    assert grid.last() == ("done", 1)
+
+
+def test_sideways_keeps_the_row_within_the_target_column(grid):
+    assert grid.right("c") == ("doing", 0)
+    assert grid.right("d") == ("done", 0)
+    assert grid.left("f") == ("doing", 0)
+    assert grid.left("a") is None
+    # A collapsed column has no rows, but can still be left
+    assert grid.right(None, "empty") == ("doing", 0)
+
+
+def test_sideways_returns_to_the_remembered_row(grid):
+    grid.remember("c")
+
+    assert grid.left("d") == ("todo", 2)
+
+
+def test_items_follow_rows_and_columns(grid):
+    grid.set_rows("todo", ["c", "a"])
+    grid.set_rows("doing", ["d", "b"])
+
+    assert grid.locate("b") == ("doing", 1)
+    assert grid.item_at("todo", 0) == "c"
+    assert grid.item_at("todo", 2) is None
+
+    grid.set_columns(["todo", "done"])
+    assert grid.locate("d") is None
+    assert grid.next("a") == ("done", 0)
@@ -0,0 +1,126 @@
+import shutil
+from datetime import datetime
+
+import pytest
+
+from src.storage.fsck import fsck, scan_column
+
+from .conftest import reload, titles
+
+
+def column_dir(storage, folder):
+    return storage.boards_dir / "test" / folder
+
+
+def edit(path, old, new):
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8"
+    )
+
+
+def kinds(report):
+    return sorted(issue.kind for issue in report.issues)
+
+
+def test_clean_board_has_no_issues(storage, board):
+    report = fsck(storage.data_dir, jobs=1)
+    assert report.boards == 1
+    assert report.item_files == 5
+    assert report.issues == []
+
+
+def test_check_without_fix_changes_nothing(storage, board):
+    to_do = column_dir(storage, "to-do")
+    (to_do / "items" / "explore_markdown_files.md").unlink()
+    before = (to_do / "column.md").read_text(encoding="utf-8")
+
+    report = fsck(storage.data_dir, jobs=1)
+
+    assert kinds(report) == ["broken_link"]
+    assert report.unfixed == report.issues
+    assert (to_do / "column.md").read_text(encoding="utf-8") == before
+
+
+def test_fix_repairs_links_and_files(storage, board):
+    to_do = column_dir(storage, "to-do")
+    done = column_dir(storage, "done")
+    # A link to a file that is gone
+    (to_do / "items" / "explore_markdown_files.md").unlink()
+    # A link whose title no longer matches its file
+    edit(to_do / "column.md", "[Learn keyboard shortcuts]", "[Old title]")
+    # A stale copy of a renamed item, sharing its id
+    shutil.copy(
+        done / "items" / "install_mkanban.md", done / "items" / "old_install.md"
+    )
+    # An item file column.md does not link
+    review = column_dir(storage, "review")
+    edit(
+        review / "column.md",
+        "- [Organize with parents](items/organize_with_parents.md)",
+        "",
+    )
+
+    report = fsck(storage.data_dir, fix=True, jobs=1)
+
+    assert kinds(report) == [
+        "broken_link",
+        "duplicate_id",
+        "orphan_file",
+        "title_mismatch",
+    ]
+    assert report.unfixed == []
+    assert not (done / "items" / "old_install.md").exists()
+    assert (done / "items" / "install_mkanban.md").exists()
+
+    assert fsck(storage.data_dir, jobs=1).issues == []
+    assert titles(reload(storage, board)) == [
+        ["Learn keyboard shortcuts"],
+        ["Create your first board"],
+        ["Organize with parents"],
+        ["Install MKanban"],
+    ]
+
+
+def test_broken_link_is_relinked_to_renamed_file(storage, board):
+    items = column_dir(storage, "in-progress") / "items"
+    (items / "create_your_first_board.md").rename(items / "first_board.md")
+
+    report = fsck(storage.data_dir, fix=True, jobs=1)
+
+    assert kinds(report) == ["broken_link"]
+    column_file = column_dir(storage, "in-progress") / "column.md"
+    assert "(items/first_board.md)" in column_file.read_text(encoding="utf-8")
+    assert fsck(storage.data_dir, jobs=1).issues == []
+
+
+def test_only_named_boards_are_checked(storage, board):
+    (column_dir(storage, "done") / "items" / "install_mkanban.md").unlink()
+    other = storage.create_sample_board("Other")
+    storage.save_board(other)
+
+    assert fsck(storage.data_dir, ["other"], jobs=1).issues == []
+    assert kinds(fsck(storage.data_dir, ["TEST"], jobs=1)) == ["broken_link"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Null", None),
+        ("~", None),
+        ("2026-01-02 03:04:05", datetime(2026, 1, 2, 3, 4, 5)),
+        ("'It''s: done'", "It's: done"),
+        ("plain # a comment", "plain"),
+    ],
+)
+def test_item_front_matter_is_read_as_yaml(tmp_path, value, expected):
+    items_dir = tmp_path / "to-do" / "items"
+    items_dir.mkdir(parents=True)
+    (items_dir / "item.md").write_text(
+        f"---\nmetadata:\n  id: abc\n  title: Item\n  updated_at: {value}\n---\n",
+        encoding="utf-8",
+    )
+
+    (record,) = scan_column(tmp_path / "to-do", ["item"]).files
+
+    assert record.error is None
+    assert record.updated_at == expected
@@ -0,0 +1,48 @@
+import pytest
+
+from src.controllers.column_controller import ColumnController
+from src.controllers.history import Change, ItemMoveChange, UndoHistory
+
+from .conftest import reload, strip_ranks, titles
+
+
+def move(storage, board, title, offset):
+    item = next(i for c in board.columns for i in c.items if i.title == title)
+    columns = board.columns
+    source = board.get_column_by_id(item.column_id)
+    target = columns[columns.index(source) + offset]
+    controller = ColumnController(board, target, storage)
+
+    applied = controller.apply_move(item.id, target.id)
+    assert controller.persist_move(applied)
+    return ItemMoveChange(
+        item.id, applied.source_column_id, applied.source_rank, target.id, item.rank
+    )
+
+
+def test_change_subclass_must_implement_undo_and_redo():
+    class Incomplete(Change):
+        def undo(self, board, storage):
+            return True
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("ranked", [True, False])
+def test_undo_move_restores_order_on_disk(storage, board, ranked):
+    if not ranked:
+        strip_ranks(storage)
+        board = reload(storage, board)
+    before = titles(board)
+
+    history = UndoHistory()
+    history.record(move(storage, board, "Learn keyboard shortcuts", 1))
+    assert titles(reload(storage, board)) == titles(board)
+
+    history.undo(board, storage)
+    assert titles(board) == before
+    assert titles(reload(storage, board)) == before
+
+    history.redo(board, storage)
+    assert titles(reload(storage, board)) == titles(board)
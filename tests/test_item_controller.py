@@ -0,0 +1,27 @@
+from src.controllers.item_controller import ItemController
+
+from .conftest import reload, titles
+
+
+def test_reload_from_file_takes_an_edited_title(storage, board):
+    item = board.columns[0].items[1]
+    item_file = (
+        storage.boards_dir / "test" / "to-do" / "items" / "explore_markdown_files.md"
+    )
+    text = item_file.read_text(encoding="utf-8")
+    item_file.write_text(
+        text.replace("Explore markdown files", "Explore the files"),
+        encoding="utf-8",
+    )
+
+    assert ItemController(board, item, storage).reload_from_file(item_file)
+    assert item.title == "Explore the files"
+    assert titles(reload(storage, board)) == titles(board)
+
+
+def test_reload_from_file_of_another_item_fails(storage, board):
+    item = board.columns[0].items[0]
+    other_file = storage.boards_dir / "test" / "done" / "items" / "install_mkanban.md"
+
+    assert not ItemController(board, item, storage).reload_from_file(other_file)
+    assert item.title == "Learn keyboard shortcuts"
@@ -0,0 +1,125 @@
+import pytest
+
+from src.models.board import Board
+from src.models.column import RANK_STEP, Column
+
+
+@pytest.fixture
+def column():
+    column = Column(name="To Do", position=0)
+    for title in "abcd":
+        column.add_item(title, column.id)
+    return column
+
+
+def order(column):
+    return [item.title for item in column.items]
+
+
+def test_move_gives_only_the_moved_item_a_rank(column):
+    moved = column.items[3]
+
+    changed = column.move_item_to_position(moved.id, 1)
+
+    assert changed == [moved]
+    assert order(column) == ["a", "d", "b", "c"]
+    assert moved.rank == (RANK_STEP + 2 * RANK_STEP) / 2
+
+
+def test_move_to_the_ends(column):
+    column.move_item_to_position(column.items[2].id, 0)
+    assert column.items[0].rank == 0.0
+
+    column.move_item_to_position(column.items[0].id, 99)
+    assert order(column) == ["a", "b", "d", "c"]
+    assert column.items[-1].rank == 5 * RANK_STEP
+
+
+def test_exhausted_gap_rebalances_the_column(column):
+    for _ in range(60):
+        changed = column.move_item_to_position(column.items[-1].id, 1)
+        if len(changed) > 1:
+            break
+    else:
+        pytest.fail("ranks never ran out of room")
+
+    assert changed == column.items
+    assert [item.rank for item in column.items] == [
+        (index + 1) * RANK_STEP for index in range(4)
+    ]
+
+
+def test_unranked_items_get_ranks_in_their_order(column):
+    column.items[1].rank = None
+    column.items[2].rank = None
+
+    column.normalize_ranks()
+
+    assert order(column) == ["a", "b", "c", "d"]
+    assert [item.rank for item in column.items[:3]] == [
+        RANK_STEP,
+        2 * RANK_STEP,
+        3 * RANK_STEP,
+    ]
+
+
+def test_board_indexes_follow_item_changes():
+    board = Board(name="Test")
+    to_do = board.add_column("To Do")
+    done = board.add_column("Done")
+    parent = board.add_parent("Epic")
+    item = board.add_item(to_do.id, "Task")
+
+    assert board.get_column_by_id(done.id) is done
+    assert board.get_item_by_id(item.id) is item
+    assert board.get_parent_by_name("Epic") is parent
+    assert board.get_group_items(None, to_do.id) == [item]
+
+    board.set_item_parent(item.id, parent.id)
+    assert board.get_group_parent_ids() == [parent.id]
+
+    board.move_to_column(item.id, done.id)
+    assert to_do.items == []
+    assert board.get_group_items(parent.id, done.id) == [item]
+
+    board.remove_item(item.id)
+    assert board.get_item_by_id(item.id) is None
+    assert board.get_group_parent_ids() == []
+
+
+def test_removed_parent_frees_its_name_for_a_duplicate():
+    board = Board(name="Test")
+    first = board.add_parent("Epic")
+    second = board.add_parent("Epic")
+
+    assert board.get_parent_by_name("Epic") is first
+    board.remove_parent(first.id)
+    assert board.get_parent_by_id(first.id) is None
+    assert board.get_parent_by_name("Epic") is second
+
+
+def test_reindex_after_bulk_changes():
+    board = Board(name="Test")
+    to_do = board.add_column("To Do")
+    item = board.add_item(to_do.id, "Task")
+
+    board.columns = [to_do.model_copy(update={"id": "copied"})]
+    board.reindex()
+
+    assert board.get_column_by_id(to_do.id) is None
+    assert board.get_column_by_id("copied") is board.columns[0]
+    assert board.get_item_by_id(item.id) is item
+
+
+def test_reindex_item_after_id_change():
+    board = Board(name="Test")
+    to_do = board.add_column("To Do")
+    item = board.add_item(to_do.id, "Task")
+    old_id = item.id
+
+    item.id = "new-id"
+    board.reindex_item(item, old_id, None, to_do.id)
+
+    assert board.get_item_by_id(old_id) is None
+    assert board.get_item_by_id("new-id") is item
+    assert board.get_group_items(None, to_do.id) == [item]
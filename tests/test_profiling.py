@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+from src.utils.profiling import Profiler, profiler, traced
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    """Spans recorded while profiling is on, with every call logged as slow."""
+    recorded = []
+    monkeypatch.setattr(profiler, "enabled", True)
+    monkeypatch.setattr(profiler, "slow_threshold_ms", 0.0)
+    monkeypatch.setattr(profiler, "spans", recorded)
+    return recorded
+
+
+def test_stacked_method_logs_its_argument_names(storage, board, spans, caplog):
+    caplog.set_level(logging.INFO, logger="mkanban.slow")
+
+    storage.save_board(board)
+
+    span = next(span for span in spans if span.name == "storage.save_board")
+    assert span.args == {"board": "Board('Test')"}
+    assert "storage.save_board took" in caplog.text
+    assert "(board=Board('Test'))" in caplog.text
+
+
+def test_keyword_and_variadic_arguments_are_named(spans):
+    @traced("test.call")
+    def call(first, second=2, *rest, **options):
+        return first
+
+    call(1, second=3, flag=True)
+    call(1, 2, 3)
+
+    assert spans[0].args == {"first": "1", "second": "3", "flag": "True"}
+    assert spans[1].args == {"first": "1", "second": "2", "rest": "(3,)"}
+
+
+def test_only_the_latest_spans_are_kept():
+    recent = Profiler(max_spans=3)
+    for index in range(5):
+        recent.record(f"span.{index}", index, 1, {})
+
+    assert [span.name for span in recent.spans] == ["span.2", "span.3", "span.4"]
+    assert len(recent.to_chrome_trace()["traceEvents"]) == 3
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.storage.markdown_storage import MarkdownStorage
+from src.storage.query import (
+    And,
+    Comparison,
+    Not,
+    Or,
+    QueryEngine,
+    QueryError,
+    parse_query,
+)
+
+from .conftest import reload
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def test_parses_precedence_sort_and_limit():
+    query = parse_query(
+        'title ~ bug or not parent = none and column = "In Progress" '
+        "sort by updated_at desc, title limit 20",
+        NOW,
+    )
+    assert query.condition == Or(
+        [
+            Comparison("title", "~", "bug"),
+            And(
+                [
+                    Not(Comparison("parent", "=", None)),
+                    Comparison("column", "=", "in progress"),
+                ]
+            ),
+        ]
+    )
+    assert query.sort == [("updated_at", True), ("title", False)]
+    assert query.limit == 20
+
+
+def test_parses_durations_dates_and_escapes():
+    query = parse_query(
+        "updated_at < 14d ago and created_at >= 2024-01-02 and title = 'it\\'s'", NOW
+    )
+    assert query.condition.terms == [
+        Comparison("updated_at", "<", NOW - timedelta(days=14)),
+        Comparison("created_at", ">=", datetime(2024, 1, 2)),
+        Comparison("title", "=", "it's"),
+    ]
+
+
+def test_quoted_none_is_a_parent_name():
+    assert parse_query('parent = "none"').condition == Comparison("parent", "=", "none")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "colour = red",
+        "title",
+        "title ~",
+        "(title = a",
+        "updated_at ~ 2d",
+        "updated_at < yesterday",
+        "parent ~ none",
+        "sort title",
+        "limit many",
+        "title = a title = b",
+    ],
+)
+def test_rejects_invalid_queries(text):
+    with pytest.raises(QueryError):
+        parse_query(text, NOW)
+
+
+def test_unknown_fields_evaluate_to_unknown():
+    query = parse_query("board = test and title ~ shortcuts")
+    assert query.matches({"board": "Test"}) is None
+    assert query.matches({"board": "Other"}) is False
+    assert query.matches({"board": "Test", "title": "Learn keyboard shortcuts"})
+
+
+def test_engine_reads_only_the_item_files_it_needs(storage, board):
+    engine = QueryEngine(storage)
+    results = list(engine.run(parse_query("title ~ shortcuts or column = done")))
+
+    assert sorted(r.item.title for r in results) == [
+        "Install MKanban",
+        "Learn keyboard shortcuts",
+    ]
+    assert engine.stats.matches == 2
+    assert engine.stats.item_files_read == 2
+    assert engine.stats.links == 5
+
+
+def test_engine_sorts_and_limits(storage, board):
+    engine = QueryEngine(storage)
+    results = engine.run(parse_query("sort by column desc, title limit 3"))
+    assert [(r.column, r.item.title) for r in results] == [
+        ("To Do", "Explore markdown files"),
+        ("To Do", "Learn keyboard shortcuts"),
+        ("Review", "Organize with parents"),
+    ]
+
+
+def count_item_reads(storage, monkeypatch):
+    reads = []
+    read_text = storage._read_text
+
+    def counting(path):
+        if path.parent.name == "items":
+            reads.append(path.name)
+        return read_text(path)
+
+    monkeypatch.setattr(storage, "_read_text", counting)
+    return reads
+
+
+def test_engine_looks_up_ids_by_item_file(storage, board, monkeypatch):
+    by_id = MarkdownStorage(storage.data_dir, "id")
+    by_id.rename_item_files(reload(by_id, board))
+    item = board.columns[2].items[0]
+    fresh = MarkdownStorage(storage.data_dir, "id")
+    reads = count_item_reads(fresh, monkeypatch)
+
+    engine = QueryEngine(fresh)
+    results = list(engine.run(parse_query(f"id = {item.id}")))
+
+    assert [r.item.title for r in results] == ["Organize with parents"]
+    assert reads == [f"{item.id}.md", f"{item.id}.md"]
+
+
+def test_engine_stops_scanning_once_every_id_is_found(storage, board, monkeypatch):
+    item = board.columns[2].items[0]
+    fresh = MarkdownStorage(storage.data_dir)
+    reads = count_item_reads(fresh, monkeypatch)
+
+    engine = QueryEngine(fresh)
+    results = list(engine.run(parse_query(f"id = {item.id}")))
+
+    assert [r.item.title for r in results] == ["Organize with parents"]
+    # Nothing is named after the id, so links are read in order up to it
+    assert "install_mkanban.md" not in reads
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+from src.storage.markdown_storage import MarkdownStorage
+from src.utils.memory import measure_memory
+
+from .conftest import reload, titles
+
+
+def item_files(storage):
+    return sorted(p.name for p in storage.boards_dir.glob("*/*/items/*.md"))
+
+
+def outline(storage, board):
+    return storage.load_board_outline(storage.get_kanban_file(board))[0]
+
+
+def test_iter_boards_loads_every_board(storage, board):
+    storage.save_board(storage.create_sample_board("Other"))
+
+    assert [loaded.name for loaded in storage.iter_boards()] == ["Other", "Test"]
+
+
+def test_load_board_by_name_ignores_case(storage, board):
+    storage.save_board(storage.create_sample_board("Other"))
+
+    assert storage.load_board_by_name("test").id == board.id
+    assert storage.load_board_by_name("missing") is None
+
+
+def test_iter_items_pages_in_link_order(storage, board):
+    skeleton = outline(storage, board)
+    to_do = skeleton.columns[0]
+    assert to_do.items == []
+
+    def page(offset, limit=None):
+        items = storage.iter_items(skeleton, to_do, offset, limit)
+        return [item.title for item in items]
+
+    assert page(0) == titles(board)[0]
+    assert page(0, 1) == ["Learn keyboard shortcuts"]
+    assert page(1, 1) == ["Explore markdown files"]
+    assert page(2) == []
+
+
+def test_count_items_reads_links(storage, board):
+    skeleton = outline(storage, board)
+
+    assert storage.count_items(skeleton) == 5
+    assert storage.count_items(skeleton, skeleton.columns[0]) == 2
+
+
+def test_rename_item_files_to_ids_and_back(storage, board):
+    expected = titles(board)
+    by_id = MarkdownStorage(storage.data_dir, "id")
+    board = reload(by_id, board)
+
+    assert by_id.rename_item_files(board) == 5
+    assert item_files(storage) == sorted(
+        f"{item.id}.md" for column in board.columns for item in column.items
+    )
+    assert by_id.rename_item_files(board) == 0
+
+    by_title = MarkdownStorage(storage.data_dir, "title")
+    board = reload(by_title, board)
+    assert by_title.rename_item_files(board) == 5
+    assert "install_mkanban.md" in item_files(storage)
+    assert titles(reload(by_title, board)) == expected
+
+
+def test_renamed_title_renames_the_file_in_place(storage, board):
+    item = board.columns[3].items[0]
+    item.title = "Install it"
+    item.description = item.description.replace("# Install MKanban", "# Install it")
+    storage.save_board(board)
+
+    files = item_files(storage)
+    assert "install_it.md" in files
+    assert "install_mkanban.md" not in files
+    assert len(files) == 5
+
+
+def test_version_stamps_are_a_read_only_view(storage, board):
+    stamps = storage.version_stamps()
+    item = board.columns[0].items[0]
+
+    assert set(stamps) == {i.id for column in board.columns for i in column.items}
+    assert stamps[item.id].path.name == "learn_keyboard_shortcuts.md"
+    with pytest.raises(TypeError):
+        stamps[item.id] = None
+
+    report = measure_memory([], {"item versions": stamps})
+    assert report.rows[-1].count == 5
+    assert report.rows[-1].size > sys.getsizeof(storage._versions)
@@ -0,0 +1,39 @@
+from click.testing import CliRunner
+
+from benchmarks import tui_benchmark
+
+
+def test_tui_benchmarks_measure_every_key_per_size():
+    results = tui_benchmark.run_tui_benchmarks(
+        [3], columns=2, description_size=20, repeat=1, size=(100, 30)
+    )
+
+    assert sorted(results) == sorted(
+        f"{name}@3"
+        for name in (
+            "mount",
+            "noop",
+            "j",
+            "k",
+            "l",
+            "h",
+            "G",
+            "gg",
+            "L",
+            "H",
+            "o",
+            "o_save",
+            "d",
+            "p",
+            "resize",
+        )
+    )
+    assert results["p@3"]["runs"] == 2
+    assert all(result["min"] > 0 for result in results.values())
+
+
+def test_sizes_must_be_numbers():
+    result = CliRunner().invoke(tui_benchmark.main, ["--sizes=20,many"])
+
+    assert result.exit_code == 2
+    assert "must be comma-separated numbers" in result.output
@@ -0,0 +1,56 @@
+import asyncio
+
+from benchmarks.generator import generate_data_dir
+from src.app import MKanbanApp
+from src.ui.widgets.item_widget import ItemWidget
+
+
+def run_board(tmp_path, scenario):
+    generate_data_dir(tmp_path, 1, 2, 60, description_size=20)
+
+    async def main():
+        app = MKanbanApp(data_dir=tmp_path, initial_board="bench-0")
+        async with app.run_test(size=(100, 30)) as pilot:
+            while app.hydrator is not None:
+                await pilot.pause(0.01)
+            column = app.current_board.columns[0]
+            await scenario(app.board_view._find_column_widget(column.id), pilot)
+            app.write_queue.drain()
+
+    asyncio.run(main())
+
+
+def shown(item_list):
+    return [card.item for card in item_list.query(ItemWidget) if card.display]
+
+
+def test_only_the_visible_window_is_mounted(tmp_path):
+    async def scenario(column_widget, pilot):
+        item_list = column_widget.item_list
+        first, last = item_list.visible_range()
+
+        assert first == 0 and last < 60
+        assert shown(item_list) == item_list.items[first:last]
+        assert item_list._bottom_spacer.styles.height.value == (
+            (60 - last) * item_list.pitch
+        )
+
+    run_board(tmp_path, scenario)
+
+
+def test_scrolling_recycles_the_card_widgets(tmp_path):
+    async def scenario(column_widget, pilot):
+        item_list = column_widget.item_list
+        cards = set(item_list.query(ItemWidget))
+
+        item_list.scroll_to_index(59)
+        await pilot.pause()
+
+        first, last = item_list.visible_range()
+        assert (first > 0, last) == (True, 60)
+        assert shown(item_list) == item_list.items[first:last]
+        assert set(item_list.query(ItemWidget)) == cards
+        assert item_list._top_spacer.styles.height.value == first * item_list.pitch
+        assert item_list.widget_for_item(item_list.items[0].id) is None
+
+    run_board(tmp_path, scenario)
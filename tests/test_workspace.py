@@ -0,0 +1,73 @@
+import pytest
+
+from src.storage.markdown_storage import MarkdownStorage
+from src.storage.workspace import Workspace
+
+
+def add_data_dir(path, *board_names):
+    path.mkdir(parents=True, exist_ok=True)
+    storage = MarkdownStorage(path)
+    for name in board_names:
+        storage.save_board(storage.create_sample_board(name))
+    return storage
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "notes"
+    add_data_dir(root / "work", "Sprint")
+    add_data_dir(root / "home" / "garden", "Plants")
+    (root / "home" / "docs").mkdir()
+    return root
+
+
+def workspace(root):
+    return Workspace(root, root.parent / "manifest.json")
+
+
+def names(boards):
+    return sorted(board.name for board in boards)
+
+
+def test_scan_finds_boards_in_every_data_dir(root):
+    boards = workspace(root).scan()
+
+    assert names(boards) == ["Plants", "Sprint"]
+    assert {board.data_dir for board in boards} == {
+        root / "work",
+        root / "home" / "garden",
+    }
+
+
+def test_repeat_scan_reuses_the_manifest(root):
+    workspace(root).scan()
+
+    again = workspace(root)
+    assert names(again.boards()) == ["Plants", "Sprint"]
+    again.scan()
+    assert again.stats.dirs_listed == 0
+    assert again.stats.boards_read == 0
+
+
+def test_scan_picks_up_new_and_changed_boards(root):
+    workspace(root).scan()
+    storage = add_data_dir(root / "home" / "docs", "Reading")
+    sprint = MarkdownStorage(root / "work").load_board_by_name("Sprint")
+    sprint.description = "Ship it"
+    MarkdownStorage(root / "work").save_board(sprint)
+
+    again = workspace(root)
+    boards = again.scan()
+
+    assert names(boards) == ["Plants", "Reading", "Sprint"]
+    assert storage.data_dir in {board.data_dir for board in boards}
+    assert again.stats.boards_read == 2
+    assert [board.name for board in again.search("ship")] == ["Sprint"]
+
+
+def test_manifest_of_another_root_is_ignored(root, tmp_path):
+    workspace(root).scan()
+    other = tmp_path / "other"
+    add_data_dir(other, "Elsewhere")
+
+    assert Workspace(other, root.parent / "manifest.json").boards() == []
@@ -0,0 +1,75 @@
+import threading
+
+from src.storage.write_queue import WriteQueue
+
+
+def test_jobs_run_in_order_and_drain_waits_for_them():
+    queue = WriteQueue()
+    release = threading.Event()
+    ran = []
+    queue.submit("board", lambda: release.wait() and ran.append(1) is None)
+    queue.submit("board", lambda: ran.append(2) is None)
+
+    assert not queue.drain(timeout=0.05)
+    assert queue.pending("board") == 2
+    release.set()
+    assert queue.drain(timeout=5)
+    assert ran == [1, 2]
+    assert queue.pending() == 0
+
+
+def test_failure_drops_later_jobs_of_the_key_until_resumed():
+    queue = WriteQueue()
+    release = threading.Event()
+    errors = []
+    ran = []
+
+    def fail():
+        release.wait()
+        raise OSError("disk full")
+
+    queue.submit("board", fail, on_failure=errors.append)
+    dropped = queue.submit("board", lambda: ran.append("queued"))
+    queue.submit("other", lambda: ran.append("other") is None)
+    release.set()
+    queue.drain(timeout=5)
+
+    assert [str(error) for error in errors] == ["disk full"]
+    assert dropped.cancelled
+    assert queue.submit("board", lambda: ran.append("late")).cancelled
+    assert ran == ["other"]
+
+    queue.resume("board")
+    queue.submit("board", lambda: ran.append("retry") is None)
+    queue.drain(timeout=5)
+    assert ran == ["other", "retry"]
+
+
+def test_job_returning_false_fails_without_an_error():
+    queue = WriteQueue()
+    outcomes = []
+    queue.submit(
+        "board",
+        lambda: False,
+        on_failure=outcomes.append,
+        on_success=lambda: outcomes.append("saved"),
+    )
+    queue.submit("board", lambda: True, on_success=lambda: outcomes.append("saved"))
+    queue.drain(timeout=5)
+
+    assert outcomes == [None]
+
+
+def test_failing_callback_does_not_stop_the_writer(caplog):
+    queue = WriteQueue()
+    ran = []
+
+    def callback():
+        raise RuntimeError("broken callback")
+
+    queue.submit("board", lambda: True, on_success=callback)
+    queue.submit("board", lambda: ran.append(1) is None)
+    queue.drain(timeout=5)
+
+    assert ran == [1]
+    assert "write callback for board failed" in caplog.text